@@ -3,18 +3,128 @@ Enhanced Personality-Based Decision Engine with LLM Integration
 """
 
 import asyncio
+import inspect
 import json
 import random
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-from enum import Enum
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, DefaultDict, Deque, Mapping
+from collections import Counter, OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field, asdict, replace
+from enum import Enum, IntEnum
+from statistics import fmean, pstdev
+from types import MappingProxyType
 from datetime import datetime, timedelta
 import logging
 import numpy as np
 from app.ai.llm_analyzer import LLMAnalyzer, MeetingInsight, AnalysisDepth
+from app.ai.scoring_kernels import (
+    workload_score as _workload_kernel,
+    attendee_relationship_score,
+    in_focus_time,
+    reasoning_flags,
+    REASON_HIGH_IMPORTANCE,
+    REASON_LOW_IMPORTANCE,
+    REASON_TIME_SENSITIVE,
+    REASON_SKIPPABLE
+)
 
 logger = logging.getLogger(__name__)
 
+# Static alternative options, shared across decisions (never mutated downstream)
+_ALT_AI_REP = {
+    "option": "Send AI representative",
+    "pros": ("Stay informed", "No time commitment"),
+    "cons": ("Less personal engagement",),
+    "confidence": 0.8
+}
+_ALT_MEETING_NOTES = {
+    "option": "Request meeting notes",
+    "pros": ("Stay informed", "Zero time commitment"),
+    "cons": ("No input opportunity",),
+    "confidence": 0.7
+}
+_ALT_SHORTER_MEETING = {
+    "option": "Suggest shorter meeting",
+    "pros": ("Participate efficiently", "Build relationships"),
+    "cons": ("Still requires time",),
+    "confidence": 0.6
+}
+_SHORTER_DURATION_PROS = ("Save time", "More focused discussion")
+_SHORTER_DURATION_CONS = ("May seem pushy",)
+_ASYNC_APPROACH_PROS = ("More efficient", "Async friendly")
+_ASYNC_APPROACH_CONS = ("Less collaborative",)
+
+
+# Decisions kept per personality for statistics
+_DECISION_HISTORY_CAPACITY = 1000
+
+# Maximum feedback items applied per learning batch
+_FEEDBACK_BATCH_SIZE = 64
+
+# Feedback entries kept in the learning cache before evicting the oldest
+_LEARNING_CACHE_CAPACITY = 10_000
+
+# Organizer address fragments that indicate a VIP
+_VIP_INDICATOR_RE = re.compile(r"ceo|cto|vp|director|client|customer", re.IGNORECASE)
+
+# Default feedback learning weights, copied per engine
+_DEFAULT_FEEDBACK_WEIGHTS = {
+    "user_acceptance_rate": 1.0,
+    "decision_speed": 1.0,
+    "meeting_effectiveness": 1.0,
+    "time_saved": 1.0,
+    "relationship_impact": 1.0
+}
+
+# Positions of the entries in PersonalityDecision.learning_factors
+_LEARNING_FACTOR_KEYS = (
+    "importance_weight",
+    "urgency_weight",
+    "relationship_weight",
+    "workload_weight",
+    "skip_probability",
+    "ai_suitability",
+    "confidence",
+    "user_stress_level",
+    "calendar_density",
+    "focus_time_ratio"
+)
+
+# Above this confidence the templated explanation is used instead of the LLM
+_LLM_EXPLANATION_CONFIDENCE_CUTOFF = 0.9
+
+# Fixed suggested actions per decision
+_DELEGATE_ACTIONS = (
+    "Identify appropriate delegate",
+    "Brief delegate on context",
+    "Request post-meeting summary"
+)
+_DELEGATE_TO_AI_ACTIONS = (
+    "Configure AI with meeting context",
+    "Set AI response parameters",
+    "Review AI-generated summary post-meeting"
+)
+_REQUEST_INFO_ACTIONS = (
+    "Ask for detailed agenda",
+    "Clarify expected outcomes",
+    "Understand your required contribution"
+)
+
+
+class Decision(IntEnum):
+    """Decisions a personality can make, numbered for compact storage"""
+    ACCEPT = 0
+    DECLINE = 1
+    RESCHEDULE = 2
+    DELEGATE = 3
+    DELEGATE_TO_AI = 4
+    REQUEST_INFO = 5
+
+
+# Serialized decision names, indexed by Decision
+_DECISIONS = tuple(d.name.lower() for d in Decision)
+
 
 class PersonalityType(Enum):
     """Enhanced AI personality types"""
@@ -25,11 +135,305 @@ class PersonalityType(Enum):
     EFFICIENT = "efficient"  # Optimization-focused
 
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
+class PersonalityTraits:
+    """Trait levels of a personality, 0.0 to 1.0"""
+    assertiveness: float
+    collaboration: float
+    efficiency: float
+    protection: float
+    adaptability: float
+    communication: float
+    decision_speed: float
+    risk_tolerance: float
+    empathy: float
+    formality: float
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionWeights:
+    """Weights of the decision score components"""
+    importance: float
+    urgency: float
+    strategic_value: float
+    relationship: float
+    workload: float
+
+
+@dataclass(frozen=True, slots=True)
+class CommunicationStyle:
+    """Phrasing used in personality responses"""
+    greeting: str
+    decline_phrase: str
+    reschedule_phrase: str
+    closing: str
+    tone: str
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionThresholds:
+    """Weighted-score thresholds for each decision"""
+    auto_accept: float
+    auto_decline: float
+    delegate: float
+    reschedule: float
+
+
+@dataclass(frozen=True, slots=True)
+class PersonalityProfile:
+    """Complete characteristics of a personality"""
+    traits: PersonalityTraits
+    decision_weights: DecisionWeights
+    communication_style: CommunicationStyle
+    thresholds: DecisionThresholds
+
+
+# Personality characteristics with enhanced traits
+PERSONALITY_PROFILES: Mapping[PersonalityType, PersonalityProfile] = MappingProxyType({
+    PersonalityType.PROFESSIONAL: PersonalityProfile(
+        traits=PersonalityTraits(
+            assertiveness=0.6,
+            collaboration=0.7,
+            efficiency=0.8,
+            protection=0.5,
+            adaptability=0.6,
+            communication=0.7,
+            decision_speed=0.6,
+            risk_tolerance=0.4,
+            empathy=0.7,
+            formality=0.9
+        ),
+        decision_weights=DecisionWeights(
+            importance=0.35,
+            urgency=0.25,
+            strategic_value=0.20,
+            relationship=0.10,
+            workload=0.10
+        ),
+        communication_style=CommunicationStyle(
+            greeting="Thank you for the meeting invitation.",
+            decline_phrase="I regret that I cannot attend",
+            reschedule_phrase="Would it be possible to reschedule",
+            closing="Best regards",
+            tone="formal and courteous"
+        ),
+        thresholds=DecisionThresholds(
+            auto_accept=0.75,
+            auto_decline=0.35,
+            delegate=0.50,
+            reschedule=0.55
+        )
+    ),
+    PersonalityType.ASSERTIVE: PersonalityProfile(
+        traits=PersonalityTraits(
+            assertiveness=0.95,
+            collaboration=0.4,
+            efficiency=0.9,
+            protection=0.85,
+            adaptability=0.3,
+            communication=0.6,
+            decision_speed=0.9,
+            risk_tolerance=0.7,
+            empathy=0.4,
+            formality=0.5
+        ),
+        decision_weights=DecisionWeights(
+            importance=0.40,
+            urgency=0.20,
+            strategic_value=0.25,
+            relationship=0.05,
+            workload=0.10
+        ),
+        communication_style=CommunicationStyle(
+            greeting="Regarding your meeting request:",
+            decline_phrase="This meeting doesn't align with current priorities",
+            reschedule_phrase="This needs to be rescheduled to",
+            closing="Thanks",
+            tone="direct and decisive"
+        ),
+        thresholds=DecisionThresholds(
+            auto_accept=0.85,
+            auto_decline=0.25,
+            delegate=0.40,
+            reschedule=0.45
+        )
+    ),
+    PersonalityType.COLLABORATIVE: PersonalityProfile(
+        traits=PersonalityTraits(
+            assertiveness=0.3,
+            collaboration=0.95,
+            efficiency=0.6,
+            protection=0.3,
+            adaptability=0.85,
+            communication=0.9,
+            decision_speed=0.4,
+            risk_tolerance=0.7,
+            empathy=0.95,
+            formality=0.6
+        ),
+        decision_weights=DecisionWeights(
+            importance=0.25,
+            urgency=0.20,
+            strategic_value=0.15,
+            relationship=0.25,
+            workload=0.15
+        ),
+        communication_style=CommunicationStyle(
+            greeting="Thanks so much for including me!",
+            decline_phrase="I'm so sorry, but I won't be able to make it",
+            reschedule_phrase="Could we find another time that works for everyone",
+            closing="Looking forward to connecting",
+            tone="warm and inclusive"
+        ),
+        thresholds=DecisionThresholds(
+            auto_accept=0.60,
+            auto_decline=0.45,
+            delegate=0.65,
+            reschedule=0.70
+        )
+    ),
+    PersonalityType.PROTECTIVE: PersonalityProfile(
+        traits=PersonalityTraits(
+            assertiveness=0.8,
+            collaboration=0.5,
+            efficiency=0.7,
+            protection=0.95,
+            adaptability=0.4,
+            communication=0.6,
+            decision_speed=0.7,
+            risk_tolerance=0.2,
+            empathy=0.6,
+            formality=0.7
+        ),
+        decision_weights=DecisionWeights(
+            importance=0.30,
+            urgency=0.30,
+            strategic_value=0.20,
+            relationship=0.05,
+            workload=0.15
+        ),
+        communication_style=CommunicationStyle(
+            greeting="After reviewing your meeting request:",
+            decline_phrase="This conflicts with protected focus time",
+            reschedule_phrase="This can be moved to a less critical time slot",
+            closing="Regards",
+            tone="protective and boundary-setting"
+        ),
+        thresholds=DecisionThresholds(
+            auto_accept=0.80,
+            auto_decline=0.30,
+            delegate=0.55,
+            reschedule=0.50
+        )
+    ),
+    PersonalityType.EFFICIENT: PersonalityProfile(
+        traits=PersonalityTraits(
+            assertiveness=0.7,
+            collaboration=0.6,
+            efficiency=0.99,
+            protection=0.6,
+            adaptability=0.7,
+            communication=0.5,
+            decision_speed=0.95,
+            risk_tolerance=0.5,
+            empathy=0.5,
+            formality=0.6
+        ),
+        decision_weights=DecisionWeights(
+            importance=0.25,
+            urgency=0.25,
+            strategic_value=0.30,
+            relationship=0.05,
+            workload=0.15
+        ),
+        communication_style=CommunicationStyle(
+            greeting="Re: Meeting request",
+            decline_phrase="Not optimal use of time - declining",
+            reschedule_phrase="Proposing shorter/async alternative",
+            closing="-",
+            tone="brief and efficiency-focused"
+        ),
+        thresholds=DecisionThresholds(
+            auto_accept=0.70,
+            auto_decline=0.35,
+            delegate=0.45,
+            reschedule=0.60
+        )
+    )
+})
+
+
+# Canned explanations per (personality, decision), filled via str.format_map
+_EXPLANATION_TEMPLATES: Dict[Tuple[PersonalityType, Decision], str] = {
+    (PersonalityType.PROFESSIONAL, Decision.ACCEPT):
+        "I'll attend '{title}' as it aligns with our strategic objectives (importance: {importance}/10). I'll ensure we achieve the expected outcomes efficiently.",
+    (PersonalityType.PROFESSIONAL, Decision.DECLINE):
+        "After careful consideration, I must decline '{title}' as it doesn't align with current priorities. I suggest exploring alternative communication methods.",
+    (PersonalityType.PROFESSIONAL, Decision.RESCHEDULE):
+        "While '{title}' is valuable, I recommend rescheduling to optimize our collective productivity. I've identified better time slots that minimize conflicts.",
+    (PersonalityType.PROFESSIONAL, Decision.DELEGATE):
+        "I recommend delegating '{title}' to maintain focus on higher-priority initiatives. The meeting objectives can be achieved through representation.",
+    (PersonalityType.PROFESSIONAL, Decision.DELEGATE_TO_AI):
+        "My AI assistant can effectively represent us in '{title}', allowing me to focus on critical tasks while ensuring meeting coverage.",
+    (PersonalityType.PROFESSIONAL, Decision.REQUEST_INFO):
+        "I need additional context about '{title}' to make an informed decision. Could you provide more details about the agenda and expected outcomes?",
+    (PersonalityType.ASSERTIVE, Decision.ACCEPT):
+        "I'll take '{title}' - it's worth my time (score: {importance}/10). Let's make it count.",
+    (PersonalityType.ASSERTIVE, Decision.DECLINE):
+        "Declining '{title}' - not a priority. Time is better spent on high-impact work.",
+    (PersonalityType.ASSERTIVE, Decision.RESCHEDULE):
+        "'{title}' needs rescheduling. Current slot isn't optimal. I've blocked better times.",
+    (PersonalityType.ASSERTIVE, Decision.DELEGATE):
+        "Delegating '{title}'. Someone else can handle this while I focus on priorities.",
+    (PersonalityType.ASSERTIVE, Decision.DELEGATE_TO_AI):
+        "AI's got '{title}'. No need for human presence on this one.",
+    (PersonalityType.ASSERTIVE, Decision.REQUEST_INFO):
+        "Need more info on '{title}' - make the case for my time.",
+    (PersonalityType.COLLABORATIVE, Decision.ACCEPT):
+        "I'd love to join '{title}' ! It's important we collaborate on this (importance: {importance}/10). Looking forward to everyone's input!",
+    (PersonalityType.COLLABORATIVE, Decision.DECLINE):
+        "I'm so sorry to miss '{title}', but I have a conflict. Happy to contribute async or catch up after!",
+    (PersonalityType.COLLABORATIVE, Decision.RESCHEDULE):
+        "Could we find a better time for '{title}'? I want to ensure everyone can participate fully!",
+    (PersonalityType.COLLABORATIVE, Decision.DELEGATE):
+        "I think someone from my team would be perfect for '{title}' - they'd bring great perspective!",
+    (PersonalityType.COLLABORATIVE, Decision.DELEGATE_TO_AI):
+        "My AI assistant can join '{title}' and share notes with everyone afterward - teamwork with technology!",
+    (PersonalityType.COLLABORATIVE, Decision.REQUEST_INFO):
+        "I'd love to learn more about '{title}' to see how I can best contribute! What are we hoping to achieve together?",
+    (PersonalityType.PROTECTIVE, Decision.ACCEPT):
+        "Accepting '{title}' as it's critical enough to interrupt focus time (urgency: {urgency}/10).",
+    (PersonalityType.PROTECTIVE, Decision.DECLINE):
+        "Declining '{title}' to protect scheduled focus time. This time block is non-negotiable.",
+    (PersonalityType.PROTECTIVE, Decision.RESCHEDULE):
+        "'{title}' must move to a non-focus time slot. Protecting deep work periods is essential.",
+    (PersonalityType.PROTECTIVE, Decision.DELEGATE):
+        "Delegating '{title}' to preserve focus time. Meeting doesn't require my direct involvement.",
+    (PersonalityType.PROTECTIVE, Decision.DELEGATE_TO_AI):
+        "AI assistant will cover '{title}' - protecting human focus time for high-value work.",
+    (PersonalityType.PROTECTIVE, Decision.REQUEST_INFO):
+        "Evaluating '{title}' - need justification for focus time interruption.",
+    (PersonalityType.EFFICIENT, Decision.ACCEPT):
+        "Taking '{title}' - ROI justified at {importance}/10.",
+    (PersonalityType.EFFICIENT, Decision.DECLINE):
+        "Declining '{title}' - insufficient ROI. Email would be 3x faster.",
+    (PersonalityType.EFFICIENT, Decision.RESCHEDULE):
+        "Rescheduling '{title}' to batch with similar meetings. 40% time savings.",
+    (PersonalityType.EFFICIENT, Decision.DELEGATE):
+        "Delegating '{title}'. More efficient use of organizational resources.",
+    (PersonalityType.EFFICIENT, Decision.DELEGATE_TO_AI):
+        "AI handles '{title}'. 100% time savings, 90% effectiveness.",
+    (PersonalityType.EFFICIENT, Decision.REQUEST_INFO):
+        "Need ROI data for '{title}'. Can't optimize without metrics."
+}
+
+
+@dataclass(slots=True)
 class PersonalityDecision:
     """Decision made by a personality"""
     personality_type: PersonalityType
-    decision: str  # accept, decline, reschedule, delegate, request_info
+    decision: Decision
     confidence: float  # 0.0 to 1.0
     reasoning: str
     natural_explanation: str
@@ -37,223 +441,141 @@ class PersonalityDecision:
     alternative_options: List[Dict[str, Any]]
     emotional_tone: str  # professional, friendly, assertive, empathetic
     response_template: str  # Email/message template
-    learning_factors: Dict[str, float]  # Factors that influenced decision
+    learning_factors: np.ndarray  # Factors that influenced decision, ordered as _LEARNING_FACTOR_KEYS
     timestamp: datetime
+    # Serialized forms of the immutable enum/timestamp fields
+    _personality_type_value: str = field(init=False, repr=False, compare=False)
+    _timestamp_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._personality_type_value = self.personality_type.value
+        self._timestamp_iso = self.timestamp.isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
-            **asdict(self),
-            'personality_type': self.personality_type.value,
-            'timestamp': self.timestamp.isoformat()
+            'personality_type': self._personality_type_value,
+            'decision': _DECISIONS[self.decision],
+            'confidence': self.confidence,
+            'reasoning': self.reasoning,
+            'natural_explanation': self.natural_explanation,
+            'suggested_actions': list(self.suggested_actions),
+            'alternative_options': [dict(option) for option in self.alternative_options],
+            'emotional_tone': self.emotional_tone,
+            'response_template': self.response_template,
+            'learning_factors': {
+                key: float(value)
+                for key, value in zip(_LEARNING_FACTOR_KEYS, self.learning_factors)
+                if not np.isnan(value)
+            },
+            'timestamp': self._timestamp_iso
         }
 
 
+class DecisionHistory:
+    """Fixed-size ring buffer of one personality's decisions
+
+    Confidences and decision kinds are stored as parallel arrays so
+    statistics are NumPy reductions; only the most recent decisions are
+    kept as full objects.
+    """
+
+    def __init__(self, capacity: int = _DECISION_HISTORY_CAPACITY, recent: int = 5):
+        self.confidences = np.empty(capacity, dtype=np.float64)
+        self.decisions = np.empty(capacity, dtype=np.int8)
+        self.recent: Deque[PersonalityDecision] = deque(maxlen=recent)
+        self.head = 0
+        self.size = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, decision: PersonalityDecision):
+        """Record a decision, overwriting the oldest when full"""
+        self.confidences[self.head] = decision.confidence
+        self.decisions[self.head] = decision.decision
+        self.head = (self.head + 1) % len(self.confidences)
+        self.size = min(self.size + 1, len(self.confidences))
+        self.total += 1
+        self.recent.append(decision)
+
+
 class EnhancedPersonalityEngine:
     """Advanced personality-based decision engine with LLM integration"""
 
-    # Personality characteristics with enhanced traits
-    PERSONALITY_PROFILES = {
-        PersonalityType.PROFESSIONAL: {
-            "traits": {
-                "assertiveness": 0.6,
-                "collaboration": 0.7,
-                "efficiency": 0.8,
-                "protection": 0.5,
-                "adaptability": 0.6,
-                "communication": 0.7,
-                "decision_speed": 0.6,
-                "risk_tolerance": 0.4,
-                "empathy": 0.7,
-                "formality": 0.9
-            },
-            "decision_weights": {
-                "importance": 0.35,
-                "urgency": 0.25,
-                "strategic_value": 0.20,
-                "relationship": 0.10,
-                "workload": 0.10
-            },
-            "communication_style": {
-                "greeting": "Thank you for the meeting invitation.",
-                "decline_phrase": "I regret that I cannot attend",
-                "reschedule_phrase": "Would it be possible to reschedule",
-                "closing": "Best regards",
-                "tone": "formal and courteous"
-            },
-            "thresholds": {
-                "auto_accept": 0.75,
-                "auto_decline": 0.35,
-                "delegate": 0.50,
-                "reschedule": 0.55
-            }
-        },
-        PersonalityType.ASSERTIVE: {
-            "traits": {
-                "assertiveness": 0.95,
-                "collaboration": 0.4,
-                "efficiency": 0.9,
-                "protection": 0.85,
-                "adaptability": 0.3,
-                "communication": 0.6,
-                "decision_speed": 0.9,
-                "risk_tolerance": 0.7,
-                "empathy": 0.4,
-                "formality": 0.5
-            },
-            "decision_weights": {
-                "importance": 0.40,
-                "urgency": 0.20,
-                "strategic_value": 0.25,
-                "relationship": 0.05,
-                "workload": 0.10
-            },
-            "communication_style": {
-                "greeting": "Regarding your meeting request:",
-                "decline_phrase": "This meeting doesn't align with current priorities",
-                "reschedule_phrase": "This needs to be rescheduled to",
-                "closing": "Thanks",
-                "tone": "direct and decisive"
-            },
-            "thresholds": {
-                "auto_accept": 0.85,
-                "auto_decline": 0.25,
-                "delegate": 0.40,
-                "reschedule": 0.45
-            }
-        },
-        PersonalityType.COLLABORATIVE: {
-            "traits": {
-                "assertiveness": 0.3,
-                "collaboration": 0.95,
-                "efficiency": 0.6,
-                "protection": 0.3,
-                "adaptability": 0.85,
-                "communication": 0.9,
-                "decision_speed": 0.4,
-                "risk_tolerance": 0.7,
-                "empathy": 0.95,
-                "formality": 0.6
-            },
-            "decision_weights": {
-                "importance": 0.25,
-                "urgency": 0.20,
-                "strategic_value": 0.15,
-                "relationship": 0.25,
-                "workload": 0.15
-            },
-            "communication_style": {
-                "greeting": "Thanks so much for including me!",
-                "decline_phrase": "I'm so sorry, but I won't be able to make it",
-                "reschedule_phrase": "Could we find another time that works for everyone",
-                "closing": "Looking forward to connecting",
-                "tone": "warm and inclusive"
-            },
-            "thresholds": {
-                "auto_accept": 0.60,
-                "auto_decline": 0.45,
-                "delegate": 0.65,
-                "reschedule": 0.70
-            }
-        },
-        PersonalityType.PROTECTIVE: {
-            "traits": {
-                "assertiveness": 0.8,
-                "collaboration": 0.5,
-                "efficiency": 0.7,
-                "protection": 0.95,
-                "adaptability": 0.4,
-                "communication": 0.6,
-                "decision_speed": 0.7,
-                "risk_tolerance": 0.2,
-                "empathy": 0.6,
-                "formality": 0.7
-            },
-            "decision_weights": {
-                "importance": 0.30,
-                "urgency": 0.30,
-                "strategic_value": 0.20,
-                "relationship": 0.05,
-                "workload": 0.15
-            },
-            "communication_style": {
-                "greeting": "After reviewing your meeting request:",
-                "decline_phrase": "This conflicts with protected focus time",
-                "reschedule_phrase": "This can be moved to a less critical time slot",
-                "closing": "Regards",
-                "tone": "protective and boundary-setting"
-            },
-            "thresholds": {
-                "auto_accept": 0.80,
-                "auto_decline": 0.30,
-                "delegate": 0.55,
-                "reschedule": 0.50
-            }
-        },
-        PersonalityType.EFFICIENT: {
-            "traits": {
-                "assertiveness": 0.7,
-                "collaboration": 0.6,
-                "efficiency": 0.99,
-                "protection": 0.6,
-                "adaptability": 0.7,
-                "communication": 0.5,
-                "decision_speed": 0.95,
-                "risk_tolerance": 0.5,
-                "empathy": 0.5,
-                "formality": 0.6
-            },
-            "decision_weights": {
-                "importance": 0.25,
-                "urgency": 0.25,
-                "strategic_value": 0.30,
-                "relationship": 0.05,
-                "workload": 0.15
-            },
-            "communication_style": {
-                "greeting": "Re: Meeting request",
-                "decline_phrase": "Not optimal use of time - declining",
-                "reschedule_phrase": "Proposing shorter/async alternative",
-                "closing": "-",
-                "tone": "brief and efficiency-focused"
-            },
-            "thresholds": {
-                "auto_accept": 0.70,
-                "auto_decline": 0.35,
-                "delegate": 0.45,
-                "reschedule": 0.60
-            }
-        }
-    }
+    # Shared read-only profiles; learned threshold adjustments are per engine
+    PERSONALITY_PROFILES = PERSONALITY_PROFILES
 
     def __init__(self, llm_analyzer: Optional[LLMAnalyzer] = None):
         self.llm_analyzer = llm_analyzer or LLMAnalyzer()
-        self.decision_history: Dict[PersonalityType, List[PersonalityDecision]] = {
-            p: [] for p in PersonalityType
-        }
-        self.learning_cache = {}
+        # Per-personality histories are created on first decision
+        self.decision_history: DefaultDict[PersonalityType, DecisionHistory] = defaultdict(DecisionHistory)
+        self.learning_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._learning_cache_capacity = _LEARNING_CACHE_CAPACITY
         self.user_feedback_weights = self._initialize_feedback_weights()
+        self.thresholds: Dict[PersonalityType, DecisionThresholds] = {
+            p: profile.thresholds for p, profile in self.PERSONALITY_PROFILES.items()
+        }
+
+        # Trait views used by stats and explanation prompts
+        self._traits_by_personality: Dict[PersonalityType, Dict[str, float]] = {
+            p: asdict(profile.traits) for p, profile in self.PERSONALITY_PROFILES.items()
+        }
+        self._traits_json_by_personality: Dict[PersonalityType, str] = {
+            p: json.dumps(traits) for p, traits in self._traits_by_personality.items()
+        }
+
+        # Sync-only LLM clients are run on worker threads so concurrent
+        # explanations don't block the event loop. Thread offloading only
+        # helps while the client is IO-bound; a GIL-bound client would need
+        # a process pool instead.
+        self._llm_executor: Optional[ThreadPoolExecutor] = None
+        self._llm_client_checked = None
+        self._llm_client_is_async = True
+
+        # Feedback is applied in batches by a worker started on first use
+        self._feedback_queue: Optional[asyncio.Queue] = None
+        self._feedback_task: Optional[asyncio.Task] = None
+
+    async def _create_chat_completion(self, **kwargs):
+        """Create a chat completion with either an async or a sync-only client"""
+
+        client = self.llm_analyzer.client
+        if client is not self._llm_client_checked:
+            create = inspect.unwrap(client.chat.completions.create)
+            self._llm_client_is_async = inspect.iscoroutinefunction(create)
+            self._llm_client_checked = client
+
+        if self._llm_client_is_async:
+            return await client.chat.completions.create(**kwargs)
+
+        if self._llm_executor is None:
+            self._llm_executor = ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="personality-llm"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._llm_executor,
+            lambda: client.chat.completions.create(**kwargs)
+        )
 
     def _initialize_feedback_weights(self) -> Dict[str, float]:
         """Initialize feedback learning weights"""
-        return {
-            "user_acceptance_rate": 1.0,
-            "decision_speed": 1.0,
-            "meeting_effectiveness": 1.0,
-            "time_saved": 1.0,
-            "relationship_impact": 1.0
-        }
+        return dict(_DEFAULT_FEEDBACK_WEIGHTS)
 
     async def make_personality_decision(
         self,
         personality_type: PersonalityType,
         meeting_data: Dict[str, Any],
         meeting_insight: MeetingInsight,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        force_llm: bool = False
     ) -> PersonalityDecision:
         """Make a decision based on specific personality"""
 
         profile = self.PERSONALITY_PROFILES[personality_type]
+        user_context = self._normalize_user_context(user_context)
 
         # Calculate decision scores
         decision_scores = await self._calculate_decision_scores(
@@ -264,7 +586,7 @@ class EnhancedPersonalityEngine:
         )
 
         # Determine primary decision
-        decision = self._determine_decision(decision_scores, profile["thresholds"])
+        decision = self._determine_decision(decision_scores, self.thresholds[personality_type])
 
         # Generate natural language explanation
         natural_explanation = await self._generate_personality_explanation(
@@ -272,7 +594,8 @@ class EnhancedPersonalityEngine:
             decision,
             meeting_data,
             meeting_insight,
-            decision_scores
+            decision_scores,
+            force_llm
         )
 
         # Create response template
@@ -314,7 +637,7 @@ class EnhancedPersonalityEngine:
             natural_explanation=natural_explanation,
             suggested_actions=suggested_actions,
             alternative_options=alternatives,
-            emotional_tone=profile["communication_style"]["tone"],
+            emotional_tone=profile.communication_style.tone,
             response_template=response_template,
             learning_factors=learning_factors,
             timestamp=datetime.utcnow()
@@ -339,17 +662,29 @@ class EnhancedPersonalityEngine:
             AnalysisDepth.STANDARD,
             user_context
         )
+        user_context = self._normalize_user_context(user_context)
+
+        # Get decisions from all personalities concurrently
+        personality_types = list(PersonalityType)
+        results = await asyncio.gather(
+            *(
+                self.make_personality_decision(
+                    personality_type,
+                    meeting_data,
+                    meeting_insight,
+                    user_context
+                )
+                for personality_type in personality_types
+            ),
+            return_exceptions=True
+        )
 
-        # Get decisions from all personalities
         decisions = {}
-        for personality_type in PersonalityType:
-            decision = await self.make_personality_decision(
-                personality_type,
-                meeting_data,
-                meeting_insight,
-                user_context
-            )
-            decisions[personality_type] = decision
+        for personality_type, result in zip(personality_types, results):
+            if isinstance(result, BaseException):
+                logger.error(f"{personality_type.value} personality decision failed: {result}")
+                result = self._neutral_decision(personality_type, meeting_data, meeting_insight)
+            decisions[personality_type] = result
 
         # Determine consensus or use primary personality
         if primary_personality:
@@ -357,29 +692,79 @@ class EnhancedPersonalityEngine:
         else:
             primary_decision = self._find_consensus(decisions)
 
-        # Create ensemble result
+        # Create ensemble result, serializing each decision once
+        all_decisions = {p.value: d.to_dict() for p, d in decisions.items()}
+
         return {
-            "primary_decision": primary_decision.to_dict(),
-            "all_decisions": {
-                p.value: d.to_dict() for p, d in decisions.items()
-            },
+            "primary_decision": all_decisions[primary_decision.personality_type.value],
+            "all_decisions": all_decisions,
             "meeting_insight": meeting_insight.to_dict(),
             "consensus_analysis": self._analyze_consensus(decisions),
-            "recommended_action": primary_decision.decision,
+            "recommended_action": _DECISIONS[primary_decision.decision],
             "confidence": primary_decision.confidence,
             "explanation": primary_decision.natural_explanation
         }
 
+    @staticmethod
+    def _normalize_user_context(
+        user_context: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Prepare user context for scoring
+
+        Returns a copy whose important_contacts is a lowercased frozenset;
+        a context that already holds a frozenset is returned unchanged.
+        """
+
+        if not user_context:
+            return user_context
+
+        important_contacts = user_context.get("important_contacts")
+        if important_contacts is None or isinstance(important_contacts, frozenset):
+            return user_context
+
+        return {
+            **user_context,
+            "important_contacts": frozenset(contact.lower() for contact in important_contacts)
+        }
+
+    def _neutral_decision(
+        self,
+        personality_type: PersonalityType,
+        meeting_data: Dict[str, Any],
+        meeting_insight: MeetingInsight
+    ) -> PersonalityDecision:
+        """Zero-confidence request for more information, used when a personality fails"""
+
+        explanation = self._template_explanation(
+            personality_type, Decision.REQUEST_INFO, meeting_data, meeting_insight
+        )
+
+        return PersonalityDecision(
+            personality_type=personality_type,
+            decision=Decision.REQUEST_INFO,
+            confidence=0.0,
+            reasoning="Decision could not be computed",
+            natural_explanation=explanation,
+            suggested_actions=list(_REQUEST_INFO_ACTIONS),
+            alternative_options=[],
+            emotional_tone=self.PERSONALITY_PROFILES[personality_type].communication_style.tone,
+            response_template=self._create_response_template(
+                personality_type, Decision.REQUEST_INFO, meeting_data, explanation
+            ),
+            learning_factors=np.full(len(_LEARNING_FACTOR_KEYS), np.nan),
+            timestamp=datetime.utcnow()
+        )
+
     async def _calculate_decision_scores(
         self,
-        profile: Dict[str, Any],
+        profile: PersonalityProfile,
         meeting_data: Dict[str, Any],
         meeting_insight: MeetingInsight,
         user_context: Optional[Dict[str, Any]]
     ) -> Dict[str, float]:
         """Calculate decision scores based on personality profile"""
 
-        weights = profile["decision_weights"]
+        weights = profile.decision_weights
 
         # Base scores from meeting insight
         importance_score = meeting_insight.importance_score / 10.0
@@ -397,26 +782,26 @@ class EnhancedPersonalityEngine:
 
         # Calculate weighted score
         weighted_score = (
-            weights["importance"] * importance_score +
-            weights["urgency"] * urgency_score +
-            weights["strategic_value"] * strategic_value_score +
-            weights["relationship"] * relationship_score +
-            weights["workload"] * (1.0 - workload_score)  # Inverse for workload
+            weights.importance * importance_score +
+            weights.urgency * urgency_score +
+            weights.strategic_value * strategic_value_score +
+            weights.relationship * relationship_score +
+            weights.workload * (1.0 - workload_score)  # Inverse for workload
         )
 
         # Adjust for personality traits
-        traits = profile["traits"]
+        traits = profile.traits
 
         # Assertive personalities are more likely to decline
-        if traits["assertiveness"] > 0.7:
-            weighted_score *= (1.0 - traits["assertiveness"] * 0.2)
+        if traits.assertiveness > 0.7:
+            weighted_score *= (1.0 - traits.assertiveness * 0.2)
 
         # Collaborative personalities are more likely to accept
-        if traits["collaboration"] > 0.7:
-            weighted_score *= (1.0 + traits["collaboration"] * 0.2)
+        if traits.collaboration > 0.7:
+            weighted_score *= (1.0 + traits.collaboration * 0.2)
 
         # Protective personalities consider focus time
-        if traits["protection"] > 0.7 and self._conflicts_with_focus_time(meeting_data):
+        if traits.protection > 0.7 and self._conflicts_with_focus_time(meeting_data):
             weighted_score *= 0.5
 
         # Calculate confidence based on data quality
@@ -437,8 +822,8 @@ class EnhancedPersonalityEngine:
     def _determine_decision(
         self,
         scores: Dict[str, float],
-        thresholds: Dict[str, float]
-    ) -> str:
+        thresholds: DecisionThresholds
+    ) -> Decision:
         """Determine decision based on scores and thresholds"""
 
         weighted_score = scores["weighted_score"]
@@ -447,41 +832,50 @@ class EnhancedPersonalityEngine:
 
         # Check for AI attendance option
         if ai_suitable and skip_probability > 0.6:
-            return "delegate_to_ai"
+            return Decision.DELEGATE_TO_AI
 
         # Check thresholds
-        if weighted_score >= thresholds["auto_accept"]:
-            return "accept"
-        elif weighted_score <= thresholds["auto_decline"]:
-            return "decline"
-        elif weighted_score >= thresholds["reschedule"] and skip_probability > 0.4:
-            return "reschedule"
-        elif weighted_score >= thresholds["delegate"] and ai_suitable:
-            return "delegate"
+        if weighted_score >= thresholds.auto_accept:
+            return Decision.ACCEPT
+        elif weighted_score <= thresholds.auto_decline:
+            return Decision.DECLINE
+        elif weighted_score >= thresholds.reschedule and skip_probability > 0.4:
+            return Decision.RESCHEDULE
+        elif weighted_score >= thresholds.delegate and ai_suitable:
+            return Decision.DELEGATE
         else:
-            return "request_info"
+            return Decision.REQUEST_INFO
 
     async def _generate_personality_explanation(
         self,
         personality_type: PersonalityType,
-        decision: str,
+        decision: Decision,
         meeting_data: Dict[str, Any],
         meeting_insight: MeetingInsight,
-        decision_scores: Dict[str, float]
+        decision_scores: Dict[str, float],
+        force_llm: bool = False
     ) -> str:
         """Generate personality-specific natural language explanation"""
 
         profile = self.PERSONALITY_PROFILES[personality_type]
 
+        # Confident decisions are well served by the canned templates
+        if not force_llm and decision_scores["confidence"] > _LLM_EXPLANATION_CONFIDENCE_CUTOFF:
+            explanation = self._template_explanation(
+                personality_type, decision, meeting_data, meeting_insight
+            )
+            if explanation:
+                return explanation
+
         # Use LLM if available
         if self.llm_analyzer and self.llm_analyzer.client:
             prompt = f"""
             You are an AI assistant with a {personality_type.value} personality.
-            Your traits: {json.dumps(profile['traits'])}
-            Communication style: {profile['communication_style']['tone']}
+            Your traits: {self._traits_json_by_personality[personality_type]}
+            Communication style: {profile.communication_style.tone}
 
             Explain this decision in 2-3 sentences:
-            Decision: {decision}
+            Decision: {_DECISIONS[decision]}
             Meeting: {meeting_data.get('title')}
             Importance: {meeting_insight.importance_score}/10
             Your confidence: {decision_scores['confidence']:.1%}
@@ -490,7 +884,7 @@ class EnhancedPersonalityEngine:
             """
 
             try:
-                response = await self.llm_analyzer.client.chat.completions.create(
+                response = await self._create_chat_completion(
                     model="gpt-4o-mini",
                     messages=[
                         {"role": "system", "content": f"You have a {personality_type.value} personality."},
@@ -504,91 +898,66 @@ class EnhancedPersonalityEngine:
                 logger.error(f"LLM explanation generation failed: {e}")
 
         # Fallback to template-based explanation
-        explanations = {
-            PersonalityType.PROFESSIONAL: {
-                "accept": f"I'll attend '{meeting_data.get('title')}' as it aligns with our strategic objectives (importance: {meeting_insight.importance_score}/10). I'll ensure we achieve the expected outcomes efficiently.",
-                "decline": f"After careful consideration, I must decline '{meeting_data.get('title')}' as it doesn't align with current priorities. I suggest exploring alternative communication methods.",
-                "reschedule": f"While '{meeting_data.get('title')}' is valuable, I recommend rescheduling to optimize our collective productivity. I've identified better time slots that minimize conflicts.",
-                "delegate": f"I recommend delegating '{meeting_data.get('title')}' to maintain focus on higher-priority initiatives. The meeting objectives can be achieved through representation.",
-                "delegate_to_ai": f"My AI assistant can effectively represent us in '{meeting_data.get('title')}', allowing me to focus on critical tasks while ensuring meeting coverage.",
-                "request_info": f"I need additional context about '{meeting_data.get('title')}' to make an informed decision. Could you provide more details about the agenda and expected outcomes?"
-            },
-            PersonalityType.ASSERTIVE: {
-                "accept": f"I'll take '{meeting_data.get('title')}' - it's worth my time (score: {meeting_insight.importance_score}/10). Let's make it count.",
-                "decline": f"Declining '{meeting_data.get('title')}' - not a priority. Time is better spent on high-impact work.",
-                "reschedule": f"'{meeting_data.get('title')}' needs rescheduling. Current slot isn't optimal. I've blocked better times.",
-                "delegate": f"Delegating '{meeting_data.get('title')}'. Someone else can handle this while I focus on priorities.",
-                "delegate_to_ai": f"AI's got '{meeting_data.get('title')}'. No need for human presence on this one.",
-                "request_info": f"Need more info on '{meeting_data.get('title')}' - make the case for my time."
-            },
-            PersonalityType.COLLABORATIVE: {
-                "accept": f"I'd love to join '{meeting_data.get('title')}' ! It's important we collaborate on this (importance: {meeting_insight.importance_score}/10). Looking forward to everyone's input!",
-                "decline": f"I'm so sorry to miss '{meeting_data.get('title')}', but I have a conflict. Happy to contribute async or catch up after!",
-                "reschedule": f"Could we find a better time for '{meeting_data.get('title')}'? I want to ensure everyone can participate fully!",
-                "delegate": f"I think someone from my team would be perfect for '{meeting_data.get('title')}' - they'd bring great perspective!",
-                "delegate_to_ai": f"My AI assistant can join '{meeting_data.get('title')}' and share notes with everyone afterward - teamwork with technology!",
-                "request_info": f"I'd love to learn more about '{meeting_data.get('title')}' to see how I can best contribute! What are we hoping to achieve together?"
-            },
-            PersonalityType.PROTECTIVE: {
-                "accept": f"Accepting '{meeting_data.get('title')}' as it's critical enough to interrupt focus time (urgency: {meeting_insight.urgency_score}/10).",
-                "decline": f"Declining '{meeting_data.get('title')}' to protect scheduled focus time. This time block is non-negotiable.",
-                "reschedule": f"'{meeting_data.get('title')}' must move to a non-focus time slot. Protecting deep work periods is essential.",
-                "delegate": f"Delegating '{meeting_data.get('title')}' to preserve focus time. Meeting doesn't require my direct involvement.",
-                "delegate_to_ai": f"AI assistant will cover '{meeting_data.get('title')}' - protecting human focus time for high-value work.",
-                "request_info": f"Evaluating '{meeting_data.get('title')}' - need justification for focus time interruption."
-            },
-            PersonalityType.EFFICIENT: {
-                "accept": f"Taking '{meeting_data.get('title')}' - ROI justified at {meeting_insight.importance_score}/10.",
-                "decline": f"Declining '{meeting_data.get('title')}' - insufficient ROI. Email would be 3x faster.",
-                "reschedule": f"Rescheduling '{meeting_data.get('title')}' to batch with similar meetings. 40% time savings.",
-                "delegate": f"Delegating '{meeting_data.get('title')}'. More efficient use of organizational resources.",
-                "delegate_to_ai": f"AI handles '{meeting_data.get('title')}'. 100% time savings, 90% effectiveness.",
-                "request_info": f"Need ROI data for '{meeting_data.get('title')}'. Can't optimize without metrics."
-            }
-        }
+        return self._template_explanation(
+            personality_type, decision, meeting_data, meeting_insight
+        ) or f"Making a {_DECISIONS[decision]} decision on '{meeting_data.get('title')}' based on analysis."
 
-        return explanations.get(personality_type, {}).get(
-            decision,
-            f"Making a {decision} decision on '{meeting_data.get('title')}' based on analysis."
-        )
+    def _template_explanation(
+        self,
+        personality_type: PersonalityType,
+        decision: Decision,
+        meeting_data: Dict[str, Any],
+        meeting_insight: MeetingInsight
+    ) -> Optional[str]:
+        """Get the canned explanation for a personality/decision pair, if any"""
+
+        template = _EXPLANATION_TEMPLATES.get((personality_type, decision))
+        if template is None:
+            return None
+
+        return template.format_map({
+            "title": meeting_data.get("title"),
+            "importance": meeting_insight.importance_score,
+            "urgency": meeting_insight.urgency_score
+        })
 
     def _create_response_template(
         self,
         personality_type: PersonalityType,
-        decision: str,
+        decision: Decision,
         meeting_data: Dict[str, Any],
         explanation: str
     ) -> str:
         """Create email/message response template"""
 
         profile = self.PERSONALITY_PROFILES[personality_type]
-        style = profile["communication_style"]
+        style = profile.communication_style
 
-        if decision == "accept":
+        if decision == Decision.ACCEPT:
             template = f"""
-{style['greeting']}
+{style.greeting}
 
 I'll be attending "{meeting_data.get('title')}".
 
 {explanation}
 
-{style['closing']}
+{style.closing}
 """
-        elif decision == "decline":
+        elif decision == Decision.DECLINE:
             template = f"""
-{style['greeting']}
+{style.greeting}
 
-{style['decline_phrase']} "{meeting_data.get('title')}".
+{style.decline_phrase} "{meeting_data.get('title')}".
 
 {explanation}
 
-{style['closing']}
+{style.closing}
 """
-        elif decision == "reschedule":
+        elif decision == Decision.RESCHEDULE:
             template = f"""
-{style['greeting']}
+{style.greeting}
 
-{style['reschedule_phrase']} "{meeting_data.get('title')}"?
+{style.reschedule_phrase} "{meeting_data.get('title')}"?
 
 {explanation}
 
@@ -597,64 +966,49 @@ Proposed alternative times:
 - [Option 2]
 - [Option 3]
 
-{style['closing']}
+{style.closing}
 """
         else:
             template = f"""
-{style['greeting']}
+{style.greeting}
 
 Regarding "{meeting_data.get('title')}":
 
 {explanation}
 
-{style['closing']}
+{style.closing}
 """
 
         return template.strip()
 
     def _generate_alternatives(
         self,
-        decision: str,
+        decision: Decision,
         meeting_data: Dict[str, Any],
         meeting_insight: MeetingInsight,
-        profile: Dict[str, Any]
+        profile: PersonalityProfile
     ) -> List[Dict[str, Any]]:
         """Generate alternative options"""
 
         alternatives = []
 
-        if decision == "decline":
+        if decision == Decision.DECLINE:
             # Suggest alternatives to declining
             if meeting_insight.ai_attendance_suitable:
-                alternatives.append({
-                    "option": "Send AI representative",
-                    "pros": ["Stay informed", "No time commitment"],
-                    "cons": ["Less personal engagement"],
-                    "confidence": 0.8
-                })
+                alternatives.append(_ALT_AI_REP)
 
-            alternatives.append({
-                "option": "Request meeting notes",
-                "pros": ["Stay informed", "Zero time commitment"],
-                "cons": ["No input opportunity"],
-                "confidence": 0.7
-            })
+            alternatives.append(_ALT_MEETING_NOTES)
 
             if meeting_insight.optimal_duration_minutes < 30:
-                alternatives.append({
-                    "option": "Suggest shorter meeting",
-                    "pros": ["Participate efficiently", "Build relationships"],
-                    "cons": ["Still requires time"],
-                    "confidence": 0.6
-                })
+                alternatives.append(_ALT_SHORTER_MEETING)
 
-        elif decision == "accept":
+        elif decision == Decision.ACCEPT:
             # Suggest optimization options
             if meeting_insight.optimal_duration_minutes < meeting_data.get("duration_minutes", 60):
                 alternatives.append({
                     "option": f"Propose {meeting_insight.optimal_duration_minutes} min duration",
-                    "pros": ["Save time", "More focused discussion"],
-                    "cons": ["May seem pushy"],
+                    "pros": _SHORTER_DURATION_PROS,
+                    "cons": _SHORTER_DURATION_CONS,
                     "confidence": 0.7
                 })
 
@@ -662,8 +1016,8 @@ Regarding "{meeting_data.get('title')}":
                 for approach in meeting_insight.alternative_approaches[:2]:
                     alternatives.append({
                         "option": approach,
-                        "pros": ["More efficient", "Async friendly"],
-                        "cons": ["Less collaborative"],
+                        "pros": _ASYNC_APPROACH_PROS,
+                        "cons": _ASYNC_APPROACH_CONS,
                         "confidence": 0.6
                     })
 
@@ -671,7 +1025,7 @@ Regarding "{meeting_data.get('title')}":
 
     def _determine_suggested_actions(
         self,
-        decision: str,
+        decision: Decision,
         meeting_insight: MeetingInsight,
         personality_type: PersonalityType
     ) -> List[str]:
@@ -679,39 +1033,33 @@ Regarding "{meeting_data.get('title')}":
 
         actions = []
 
-        if decision == "accept":
+        if decision == Decision.ACCEPT:
             # Add preparation actions
             actions.extend(meeting_insight.required_preparation[:3])
             actions.append("Block 5 minutes before for prep")
             if meeting_insight.decision_points:
                 actions.append("Review decision points in advance")
 
-        elif decision == "decline":
+        elif decision == Decision.DECLINE:
             actions.append("Send polite decline message")
             if meeting_insight.ai_attendance_suitable:
                 actions.append("Offer to send AI representative")
             actions.append("Request meeting summary afterwards")
 
-        elif decision == "reschedule":
+        elif decision == Decision.RESCHEDULE:
             actions.append("Propose 3 alternative time slots")
             actions.append("Explain scheduling conflict briefly")
             if personality_type == PersonalityType.EFFICIENT:
                 actions.append(f"Suggest {meeting_insight.optimal_duration_minutes} min duration")
 
-        elif decision == "delegate":
-            actions.append("Identify appropriate delegate")
-            actions.append("Brief delegate on context")
-            actions.append("Request post-meeting summary")
+        elif decision == Decision.DELEGATE:
+            actions.extend(_DELEGATE_ACTIONS)
 
-        elif decision == "delegate_to_ai":
-            actions.append("Configure AI with meeting context")
-            actions.append("Set AI response parameters")
-            actions.append("Review AI-generated summary post-meeting")
+        elif decision == Decision.DELEGATE_TO_AI:
+            actions.extend(_DELEGATE_TO_AI_ACTIONS)
 
-        elif decision == "request_info":
-            actions.append("Ask for detailed agenda")
-            actions.append("Clarify expected outcomes")
-            actions.append("Understand your required contribution")
+        elif decision == Decision.REQUEST_INFO:
+            actions.extend(_REQUEST_INFO_ACTIONS)
 
         return actions
 
@@ -720,26 +1068,33 @@ Regarding "{meeting_data.get('title')}":
         decision_scores: Dict[str, float],
         meeting_insight: MeetingInsight,
         user_context: Optional[Dict[str, Any]]
-    ) -> Dict[str, float]:
-        """Calculate factors for learning and adaptation"""
+    ) -> np.ndarray:
+        """Calculate factors for learning and adaptation
 
-        factors = {
-            "importance_weight": decision_scores["importance"],
-            "urgency_weight": decision_scores["urgency"],
-            "relationship_weight": decision_scores["relationship"],
-            "workload_weight": decision_scores["workload"],
-            "skip_probability": meeting_insight.skip_probability,
-            "ai_suitability": 1.0 if meeting_insight.ai_attendance_suitable else 0.0,
-            "confidence": decision_scores["confidence"]
-        }
+        Returns a vector ordered as _LEARNING_FACTOR_KEYS; user context
+        factors are NaN when no context is available.
+        """
 
         # Add user context factors if available
         if user_context:
-            factors["user_stress_level"] = user_context.get("stress_level", 0.5)
-            factors["calendar_density"] = user_context.get("calendar_density", 0.5)
-            factors["focus_time_ratio"] = user_context.get("focus_time_ratio", 0.3)
-
-        return factors
+            stress_level = user_context.get("stress_level", 0.5)
+            calendar_density = user_context.get("calendar_density", 0.5)
+            focus_time_ratio = user_context.get("focus_time_ratio", 0.3)
+        else:
+            stress_level = calendar_density = focus_time_ratio = np.nan
+
+        return np.array([
+            decision_scores["importance"],
+            decision_scores["urgency"],
+            decision_scores["relationship"],
+            decision_scores["workload"],
+            meeting_insight.skip_probability,
+            1.0 if meeting_insight.ai_attendance_suitable else 0.0,
+            decision_scores["confidence"],
+            stress_level,
+            calendar_density,
+            focus_time_ratio
+        ], dtype=np.float64)
 
     def _parse_strategic_value(self, strategic_value: str) -> float:
         """Parse strategic value string to score"""
@@ -762,23 +1117,16 @@ Regarding "{meeting_data.get('title')}":
         organizer = meeting_data.get("organizer_email", "")
 
         if user_context and "important_contacts" in user_context:
-            important_contacts = user_context["important_contacts"]
-            if organizer in important_contacts:
+            # Contacts are a lowercased frozenset after _normalize_user_context
+            if organizer.lower() in user_context["important_contacts"]:
                 return 0.9
 
         # Check for VIP keywords
-        vip_indicators = ["ceo", "cto", "vp", "director", "client", "customer"]
-        if any(indicator in organizer.lower() for indicator in vip_indicators):
+        if _VIP_INDICATOR_RE.search(organizer):
             return 0.8
 
         # Check attendee count (smaller meetings often more important)
-        attendee_count = len(meeting_data.get("attendees", []))
-        if attendee_count <= 3:
-            return 0.7
-        elif attendee_count <= 5:
-            return 0.5
-        else:
-            return 0.3
+        return attendee_relationship_score(len(meeting_data.get("attendees", [])))
 
     def _calculate_workload_score(self, user_context: Optional[Dict[str, Any]]) -> float:
         """Calculate current workload score"""
@@ -793,9 +1141,7 @@ Regarding "{meeting_data.get('title')}":
         stress_level = user_context.get("stress_level", 0.5)
 
         # Combine factors
-        workload = (calendar_density * 0.7 + stress_level * 0.3)
-
-        return min(1.0, max(0.0, workload))
+        return _workload_kernel(float(calendar_density), float(stress_level))
 
     def _conflicts_with_focus_time(self, meeting_data: Dict[str, Any]) -> bool:
         """Check if meeting conflicts with typical focus time"""
@@ -805,12 +1151,17 @@ Regarding "{meeting_data.get('title')}":
             return False
 
         try:
-            meeting_hour = datetime.fromisoformat(start_time).hour
-            # Focus time typically 9-11 AM and 2-4 PM
-            return (9 <= meeting_hour < 11) or (14 <= meeting_hour < 16)
-        except:
+            # Read the hour straight from "YYYY-MM-DDTHH..." without building a datetime
+            if len(start_time) >= 13 and start_time[10] in "T ":
+                meeting_hour = int(start_time[11:13])
+            else:
+                meeting_hour = datetime.fromisoformat(start_time).hour
+        except (ValueError, TypeError):
             return False
 
+        # Focus time typically 9-11 AM and 2-4 PM
+        return bool(in_focus_time(meeting_hour))
+
     def _generate_reasoning(
         self,
         decision_scores: Dict[str, float],
@@ -818,30 +1169,27 @@ Regarding "{meeting_data.get('title')}":
     ) -> str:
         """Generate detailed reasoning for decision"""
 
-        reasoning_parts = []
-
-        # Add importance reasoning
-        if decision_scores["importance"] > 0.7:
-            reasoning_parts.append(f"High importance meeting ({meeting_insight.importance_score}/10)")
-        elif decision_scores["importance"] < 0.3:
-            reasoning_parts.append(f"Low importance meeting ({meeting_insight.importance_score}/10)")
-
-        # Add urgency reasoning
-        if decision_scores["urgency"] > 0.8:
-            reasoning_parts.append("Time-sensitive matter requiring immediate attention")
-
-        # Add strategic value
-        reasoning_parts.append(f"Strategic value: {meeting_insight.strategic_value}")
-
-        # Add skip probability
-        if meeting_insight.skip_probability > 0.7:
-            reasoning_parts.append("High probability this meeting can be skipped or delegated")
+        flags = reasoning_flags(
+            decision_scores["importance"],
+            decision_scores["urgency"],
+            float(meeting_insight.skip_probability)
+        )
 
-        # Add AI suitability
-        if meeting_insight.ai_attendance_suitable:
-            reasoning_parts.append("AI attendance is suitable for this meeting type")
+        if flags & REASON_HIGH_IMPORTANCE:
+            importance = f"High importance meeting ({meeting_insight.importance_score}/10)"
+        elif flags & REASON_LOW_IMPORTANCE:
+            importance = f"Low importance meeting ({meeting_insight.importance_score}/10)"
+        else:
+            importance = ""
 
-        return ". ".join(reasoning_parts)
+        # Importance, urgency, strategic value, skip probability, AI suitability
+        return ". ".join(part for part in (
+            importance,
+            "Time-sensitive matter requiring immediate attention" if flags & REASON_TIME_SENSITIVE else "",
+            f"Strategic value: {meeting_insight.strategic_value}",
+            "High probability this meeting can be skipped or delegated" if flags & REASON_SKIPPABLE else "",
+            "AI attendance is suitable for this meeting type" if meeting_insight.ai_attendance_suitable else ""
+        ) if part)
 
     def _find_consensus(
         self,
@@ -849,19 +1197,18 @@ Regarding "{meeting_data.get('title')}":
     ) -> PersonalityDecision:
         """Find consensus decision across personalities"""
 
-        # Count decisions
-        decision_counts = {}
+        # Count decisions, tracking the most confident one of each type
+        decision_counts = Counter()
+        most_confident: Dict[Decision, PersonalityDecision] = {}
         for decision in decisions.values():
-            if decision.decision not in decision_counts:
-                decision_counts[decision.decision] = 0
             decision_counts[decision.decision] += 1
+            current = most_confident.get(decision.decision)
+            if current is None or decision.confidence > current.confidence:
+                most_confident[decision.decision] = decision
 
-        # Find most common decision
-        most_common = max(decision_counts, key=decision_counts.get)
-
-        # Return the decision with highest confidence for that type
-        matching_decisions = [d for d in decisions.values() if d.decision == most_common]
-        return max(matching_decisions, key=lambda d: d.confidence)
+        # Return the decision with highest confidence for the most common type
+        most_common = decision_counts.most_common(1)[0][0]
+        return most_confident[most_common]
 
     def _analyze_consensus(
         self,
@@ -869,86 +1216,250 @@ Regarding "{meeting_data.get('title')}":
     ) -> Dict[str, Any]:
         """Analyze consensus across personalities"""
 
-        decision_list = [d.decision for d in decisions.values()]
-        confidence_list = [d.confidence for d in decisions.values()]
+        # Collect decisions and confidences in one pass over the personalities
+        decision_list = []
+        confidence_list = []
+        personality_decisions = []
+        for personality_type, d in decisions.items():
+            decision_list.append(d.decision)
+            confidence_list.append(d.confidence)
+            personality_decisions.append((personality_type, d.decision))
+
+        # Unanimous decisions need no counting or dissent tracking
+        first = decision_list[0]
+        if all(d == first for d in decision_list):
+            return {
+                "agreement_level": 1.0,
+                "unique_decisions": [_DECISIONS[first]],
+                "average_confidence": fmean(confidence_list),
+                "confidence_std": pstdev(confidence_list),
+                "full_consensus": True,
+                "majority_decision": _DECISIONS[first],
+                "dissenting_personalities": []
+            }
 
-        # Count unique decisions
-        unique_decisions = set(decision_list)
+        # Count decisions once
+        decision_counts = Counter(decision_list)
+        majority_decision, most_common_count = decision_counts.most_common(1)[0]
 
         # Calculate agreement level
-        most_common_count = max(decision_list.count(d) for d in unique_decisions)
         agreement_level = most_common_count / len(decision_list)
 
         return {
             "agreement_level": agreement_level,
-            "unique_decisions": list(unique_decisions),
-            "average_confidence": np.mean(confidence_list),
-            "confidence_std": np.std(confidence_list),
+            "unique_decisions": [_DECISIONS[d] for d in decision_counts],
+            "average_confidence": fmean(confidence_list),
+            "confidence_std": pstdev(confidence_list),
             "full_consensus": agreement_level == 1.0,
-            "majority_decision": max(unique_decisions, key=decision_list.count),
+            "majority_decision": _DECISIONS[majority_decision],
             "dissenting_personalities": [
-                p.value for p, d in decisions.items()
-                if d.decision != max(unique_decisions, key=decision_list.count)
+                p.value for p, decision in personality_decisions
+                if decision != majority_decision
             ]
         }
 
+    def analyze_consensus_batch(
+        self,
+        decision_sets: List[Dict[PersonalityType, PersonalityDecision]]
+    ) -> List[Dict[str, Any]]:
+        """Analyze consensus for many meetings at once
+
+        Each entry of decision_sets holds one meeting's personality
+        decisions; results match _analyze_consensus for each meeting.
+        """
+
+        if not decision_sets:
+            return []
+
+        personality_count = len(decision_sets[0])
+        if len(decision_sets) == 1 or any(len(d) != personality_count for d in decision_sets):
+            return [self._analyze_consensus(decisions) for decisions in decision_sets]
+
+        # Meetings x personalities arrays of decision kinds and confidences
+        codes = np.array([
+            [d.decision for d in decisions.values()]
+            for decisions in decision_sets
+        ], dtype=np.int8)
+        confidences = np.array([
+            [d.confidence for d in decisions.values()]
+            for decisions in decision_sets
+        ], dtype=np.float64)
+
+        meeting_count = codes.shape[0]
+        rows = np.arange(meeting_count)[:, None]
+        columns = np.broadcast_to(np.arange(personality_count), codes.shape)
+
+        counts = np.zeros((meeting_count, len(_DECISIONS)), dtype=np.int32)
+        np.add.at(counts, (rows, codes), 1)
+
+        # First position of each decision kind, so ties and ordering follow
+        # the same first-seen rule as the per-meeting Counter
+        first_seen = np.full(counts.shape, personality_count, dtype=np.int32)
+        np.minimum.at(first_seen, (rows, codes), columns)
+
+        most_common_counts = counts.max(axis=1)
+        majority = np.where(
+            counts == most_common_counts[:, None], first_seen, personality_count + 1
+        ).argmin(axis=1)
+        agreement_levels = most_common_counts / personality_count
+        average_confidences = confidences.mean(axis=1)
+        confidence_stds = confidences.std(axis=1)
+
+        results = []
+        for i, decisions in enumerate(decision_sets):
+            present = np.flatnonzero(counts[i])
+            unique_decisions = [_DECISIONS[k] for k in present[np.argsort(first_seen[i, present])]]
+            majority_decision = Decision(majority[i])
+            agreement_level = float(agreement_levels[i])
+            results.append({
+                "agreement_level": agreement_level,
+                "unique_decisions": unique_decisions,
+                "average_confidence": float(average_confidences[i]),
+                "confidence_std": float(confidence_stds[i]),
+                "full_consensus": agreement_level == 1.0,
+                "majority_decision": _DECISIONS[majority_decision],
+                "dissenting_personalities": [
+                    p.value for p, d in decisions.items()
+                    if d.decision != majority_decision
+                ]
+            })
+
+        return results
+
     async def learn_from_feedback(
         self,
         decision_id: str,
         feedback: Dict[str, Any],
         personality_type: Optional[PersonalityType] = None
     ):
-        """Learn from user feedback on decisions"""
+        """Learn from user feedback on decisions
 
-        user_agreed = feedback.get("user_agreed", False)
-        actual_outcome = feedback.get("actual_outcome")  # good, neutral, bad
-        time_saved = feedback.get("time_saved", 0)  # in minutes
+        Feedback is queued and applied in batches by a background worker;
+        await flush_feedback() to wait until queued feedback is applied.
+        """
 
-        # Update feedback weights
-        if not user_agreed:
-            self.user_feedback_weights["user_acceptance_rate"] *= 0.95
-        else:
-            self.user_feedback_weights["user_acceptance_rate"] *= 1.02
-
-        if actual_outcome == "bad":
-            self.user_feedback_weights["meeting_effectiveness"] *= 0.9
-        elif actual_outcome == "good":
-            self.user_feedback_weights["meeting_effectiveness"] *= 1.05
-
-        # Store learning data
-        self.learning_cache[decision_id] = {
-            "feedback": feedback,
-            "timestamp": datetime.utcnow().isoformat(),
-            "personality": personality_type.value if personality_type else None
-        }
+        if self._feedback_queue is None:
+            self._feedback_queue = asyncio.Queue()
+        self._ensure_feedback_worker()
+
+        self._feedback_queue.put_nowait(
+            (decision_id, feedback, personality_type, datetime.utcnow().isoformat())
+        )
 
-        # Adjust personality thresholds if specified
-        if personality_type and not user_agreed:
-            profile = self.PERSONALITY_PROFILES[personality_type]
-            # Make more conservative
-            profile["thresholds"]["auto_accept"] = min(0.95, profile["thresholds"]["auto_accept"] + 0.05)
-            profile["thresholds"]["auto_decline"] = max(0.1, profile["thresholds"]["auto_decline"] - 0.05)
+    def _ensure_feedback_worker(self):
+        """Start the feedback worker unless it is running; it drains the existing queue"""
+        if self._feedback_task is None or self._feedback_task.done():
+            self._feedback_task = asyncio.create_task(self._feedback_worker())
+
+    async def flush_feedback(self):
+        """Wait until all queued feedback has been applied"""
+        if self._feedback_queue is not None:
+            if not self._feedback_queue.empty():
+                self._ensure_feedback_worker()
+            await self._feedback_queue.join()
+
+    async def aclose(self):
+        """Apply any queued feedback, then stop the feedback worker"""
+        await self.flush_feedback()
+        if self._feedback_task is not None:
+            self._feedback_task.cancel()
+            await asyncio.gather(self._feedback_task, return_exceptions=True)
+            self._feedback_task = None
+
+    async def _feedback_worker(self):
+        """Drain queued feedback and apply it in batches"""
+
+        while True:
+            batch = [await self._feedback_queue.get()]
+            while len(batch) < _FEEDBACK_BATCH_SIZE:
+                try:
+                    batch.append(self._feedback_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
 
-        logger.info(f"Learned from feedback: agreed={user_agreed}, outcome={actual_outcome}")
+            try:
+                self._apply_feedback_batch(batch)
+            except Exception as e:
+                logger.error(f"Applying feedback batch failed: {e}")
+            finally:
+                for _ in batch:
+                    self._feedback_queue.task_done()
+
+    def _apply_feedback_batch(
+        self,
+        batch: List[Tuple[str, Dict[str, Any], Optional[PersonalityType], str]]
+    ):
+        """Apply a batch of feedback with one update per weight"""
+
+        agreed = disagreed = good = bad = 0
+        disagreements: Counter = Counter()
+
+        for decision_id, feedback, personality_type, timestamp in batch:
+            user_agreed = feedback.get("user_agreed", False)
+            actual_outcome = feedback.get("actual_outcome")  # good, neutral, bad
+
+            if user_agreed:
+                agreed += 1
+            else:
+                disagreed += 1
+                # Adjust personality thresholds if specified
+                if personality_type:
+                    disagreements[personality_type] += 1
+
+            if actual_outcome == "bad":
+                bad += 1
+            elif actual_outcome == "good":
+                good += 1
+
+            # Store learning data
+            self.learning_cache[decision_id] = {
+                "feedback": feedback,
+                "timestamp": timestamp,
+                "personality": personality_type.value if personality_type else None
+            }
+            self.learning_cache.move_to_end(decision_id)
+
+        # Evict least recently updated entries beyond capacity
+        while len(self.learning_cache) > self._learning_cache_capacity:
+            self.learning_cache.popitem(last=False)
+
+        # Update feedback weights
+        self.user_feedback_weights["user_acceptance_rate"] *= 0.95 ** disagreed * 1.02 ** agreed
+        self.user_feedback_weights["meeting_effectiveness"] *= 0.9 ** bad * 1.05 ** good
+
+        # Make disagreed personalities more conservative
+        for personality_type, count in disagreements.items():
+            thresholds = self.thresholds[personality_type]
+            self.thresholds[personality_type] = replace(
+                thresholds,
+                auto_accept=min(0.95, thresholds.auto_accept + 0.05 * count),
+                auto_decline=max(0.1, thresholds.auto_decline - 0.05 * count)
+            )
+
+        logger.info(
+            f"Learned from {len(batch)} feedback items: agreed={agreed}, "
+            f"disagreed={disagreed}, good={good}, bad={bad}"
+        )
 
     def get_personality_stats(self, personality_type: PersonalityType) -> Dict[str, Any]:
         """Get statistics for a specific personality"""
 
-        decisions = self.decision_history.get(personality_type, [])
+        history = self.decision_history.get(personality_type)
 
-        if not decisions:
+        if not history:
             return {"total_decisions": 0}
 
-        decision_types = [d.decision for d in decisions]
-        confidences = [d.confidence for d in decisions]
+        # Averages and breakdown cover the decisions still in the ring buffer
+        confidences = history.confidences[:history.size]
+        decision_counts = np.bincount(history.decisions[:history.size], minlength=len(_DECISIONS))
 
         return {
-            "total_decisions": len(decisions),
-            "average_confidence": np.mean(confidences),
+            "total_decisions": history.total,
+            "average_confidence": float(confidences.mean()),
             "decision_breakdown": {
-                decision: decision_types.count(decision)
-                for decision in set(decision_types)
+                decision: int(count)
+                for decision, count in zip(_DECISIONS, decision_counts) if count
             },
-            "recent_decisions": [d.to_dict() for d in decisions[-5:]],
-            "personality_traits": self.PERSONALITY_PROFILES[personality_type]["traits"]
+            "recent_decisions": [d.to_dict() for d in history.recent],
+            "personality_traits": self._traits_by_personality[personality_type]
         }
\ No newline at end of file
@@ -4,21 +4,215 @@ Provides sophisticated AI analysis for meetings using state-of-the-art language
 """
 
 import asyncio
-import json
+import functools
+import hashlib
+import random
 import re
-from typing import Dict, Any, List, Optional, Tuple
+import textwrap
+import time
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, List, Optional, Tuple, DefaultDict, FrozenSet, Callable
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 import logging
+import httpx
 import openai
 from openai import AsyncOpenAI
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import orjson
+import tiktoken
+from sklearn.feature_extraction.text import HashingVectorizer
+
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    simsimd = None
+    HAS_SIMSIMD = False
 
 logger = logging.getLogger(__name__)
 
+# orjson options for JSON embedded in prompts. Compact, since indentation
+# only costs tokens, and key-sorted so equal data always yields the same prompt
+_PROMPT_JSON = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+# Analyses remembered per meeting pattern
+_PATTERN_HISTORY_CAPACITY = 50
+
+# Serialized user contexts and indexed recent-meeting lists remembered
+# for reuse across meetings
+_USER_CONTEXT_CACHE_CAPACITY = 32
+
+# Semantic insight caches kept, one per analysis depth and requesting
+# organizer/user context, least recently used dropped first
+_INSIGHT_CACHE_SCOPES = 16
+
+# Meetings analyzed concurrently by analyze_meetings
+_ANALYSIS_CONCURRENCY = 10
+
+# Pooled HTTP/2 connections shared by all OpenAI requests
+_HTTP_MAX_CONNECTIONS = 200
+_HTTP_MAX_KEEPALIVE_CONNECTIONS = 100
+# Idle connections survive gaps between sweeps instead of re-handshaking
+_HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# Cached chat responses for repeated explanation and pattern requests
+_RESPONSE_CACHE_CAPACITY = 2048
+_RESPONSE_CACHE_TTL_SECONDS = 3600.0
+
+# Explanation requests arriving within the window are dispatched together,
+# with at most _EXPLANATION_CONCURRENCY API calls in flight
+_EXPLANATION_BATCH_WINDOW_SECONDS = 0.02
+_EXPLANATION_BATCH_SIZE = 32
+_EXPLANATION_CONCURRENCY = 10
+
+# Prompt tokens allowed for each meeting list sent for calendar analysis,
+# and the characters per token assumed when the tokenizer cannot be loaded
+_CALENDAR_PROMPT_TOKEN_BUDGET = 1500
+_CHARS_PER_TOKEN_ESTIMATE = 4
+
+# Attempts per LLM call before a rate limit error is given up on
+_RATE_LIMIT_ATTEMPTS = 3
+# How long the proactive rate limiter runs at half capacity after a 429
+_RATE_LIMIT_COOLDOWN_SECONDS = 60.0
+
+# Streamed analyses stop once the model is this sure the meeting is skippable
+_EARLY_SKIP_PROBABILITY = 0.9
+
+# Leading numeric fields of a streamed analysis, matched once fully written
+_STREAMED_SCORE_RE = re.compile(
+    r'"(importance_score|urgency_score|skip_probability)"\s*:\s*(-?[0-9.]+)\s*[,}]'
+)
+
+
+# Static instructions for meeting analysis. Kept byte-identical across calls,
+# with the meeting itself sent as the user message, so the provider can
+# reuse its prompt cache for this prefix.
+ANALYSIS_SYSTEM_PROMPT = """You are an elite executive assistant AI with expertise in time management and meeting optimization.
+Analyze the meeting given as JSON in the user message with surgical precision.
+
+importance_score (strategic value) and urgency_score (time sensitivity) range 0-10; skip_probability ranges 0-1.
+ai_attendance_suitable is true if an AI can represent the user.
+Keep lists to 3-5 short, specific items.
+strategic_value is High, Medium or Low; where free text is allowed it reads "<High/Medium/Low> - <explanation>".
+If include_attendee_roles is true, give each attendee's likely role, decision-making authority, whether they are required or optional, and relationship to the user.
+summary is a one-line executive summary with key preparation points and critical decisions.
+
+Consider ROI of attendance, alternative communication methods, meeting fatigue,
+focus time protection, and strategic alignment."""
+
+
+# Static instructions for decision explanations and calendar pattern
+# analysis, sent ahead of the per-request data for the same reason
+EXPLANATION_INSTRUCTIONS = """Generate a natural, conversational explanation for the meeting decision in the next message.
+
+Write a 2-3 sentence explanation that:
+1. Sounds human and empathetic
+2. Clearly explains the reasoning
+3. Provides actionable next steps
+4. Maintains professional tone with personality
+
+Format: Conversational but professional explanation."""
+
+# Ready-made explanations for routine decisions, used instead of an LLM call
+# when the decision is confident and there is no user context to personalize
+_EXPLANATION_TEMPLATES = {
+    "auto_accept": "I've accepted '{meeting_title}' for you. It's clearly worth your time and fits your schedule.",
+    "accept": "I've accepted '{meeting_title}' for you. It's clearly worth your time and fits your schedule.",
+    "auto_decline": "I've declined '{meeting_title}' on your behalf. It's low priority, so your time is better spent elsewhere; I'll flag anything you need from it.",
+    "decline": "I've declined '{meeting_title}' on your behalf. It's low priority, so your time is better spent elsewhere; I'll flag anything you need from it.",
+    "defer_interruption": "I've deferred '{meeting_title}' until your focus session ends, so you can keep working uninterrupted.",
+    "block_interruption": "I've held off '{meeting_title}' to protect your focus time. It can wait until you're free.",
+    "allow_interruption": "I've let '{meeting_title}' through because it's important enough to interrupt your focus time."
+}
+_TEMPLATE_EXPLANATION_MIN_CONFIDENCE = 0.9
+_TEMPLATE_EXPLANATION_MAX_TITLE_LENGTH = 80
+
+CALENDAR_PATTERN_INSTRUCTIONS = """Analyze the calendar patterns in the next message.
+
+Identify:
+1. Recurring meeting patterns and their effectiveness
+2. Meeting clustering and fatigue zones
+3. Optimal focus time slots
+4. Inefficient meeting patterns
+5. Opportunities for batch processing
+6. Recommended schedule optimizations
+
+Provide actionable insights for calendar optimization, one short item per list entry."""
+
+
+@functools.lru_cache(maxsize=1)
+def _token_counter() -> Callable[[str], int]:
+    """Prompt token counter, loaded on first use
+
+    cl100k_base is used because the pinned tiktoken predates gpt-4o's own
+    encoding; it is close enough for budgeting. Loading fetches the
+    encoding file, so without it tokens are estimated from length.
+    """
+    try:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, estimating prompt tokens: {e}")
+        return lambda text: len(text) // _CHARS_PER_TOKEN_ESTIMATE + 1
+    return lambda text: len(encoding.encode_ordinary(text))
+
+
+async def _load_token_counter() -> Callable[[str], int]:
+    """_token_counter for async code; the first load runs in a worker
+    thread, so fetching the encoding never blocks the event loop"""
+    if _token_counter.cache_info().currsize:
+        return _token_counter()
+    return await asyncio.to_thread(_token_counter)
+
+
+def _pack_json_list(items: List[Any], token_budget: int, count_tokens: Callable[[str], int]) -> str:
+    """Compact JSON array of the longest prefix of items fitting the token budget"""
+    parts = []
+    used = 0
+    for item in items:
+        part = orjson.dumps(item, option=_PROMPT_JSON).decode()
+        used += count_tokens(part)
+        if used > token_budget:
+            break
+        parts.append(part)
+    # Same bytes orjson would produce for the list as a whole
+    return "[" + ",".join(parts) + "]"
+
+
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Strict JSON schema for an object requiring exactly the given properties"""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+_STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+# Calendar pattern insights as strict JSON. _basic_pattern_analysis returns
+# every key here too, so callers can read them whichever path answered
+_CALENDAR_INSIGHTS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "calendar_insights",
+        "strict": True,
+        "schema": _strict_object({
+            "patterns": _strict_object({
+                "recurring_meetings": _STRING_LIST_SCHEMA,
+                "fatigue_zones": _STRING_LIST_SCHEMA,
+                "inefficiencies": _STRING_LIST_SCHEMA
+            }),
+            "recommendations": _STRING_LIST_SCHEMA,
+            "optimization_opportunities": _STRING_LIST_SCHEMA,
+            "focus_time_suggestions": _STRING_LIST_SCHEMA,
+            "meeting_reduction_targets": _STRING_LIST_SCHEMA
+        })
+    }
+}
+
 
 class AnalysisDepth(Enum):
     """Different levels of analysis depth"""
@@ -44,7 +238,191 @@ class MeetingCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one pattern matching any of them as a substring
+
+    The lookahead lets findall report a keyword at every position, so
+    occurrences that overlap other keywords are still found. At any one
+    position only the longest matching keyword is reported, though: where
+    one keyword is a prefix of another ("retro", "retrospective"), text
+    containing the longer one reports only it. That equals testing each
+    keyword with `in` only while such prefix pairs lead to the same result.
+    """
+    alternatives = sorted(keywords, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, alternatives)) + "))")
+
+
+def _count_keywords(pattern: "re.Pattern[str]", text: str) -> int:
+    """Number of distinct keywords of a compiled pattern present in text"""
+    return len(set(pattern.findall(text)))
+
+
+# Keyword patterns for rule-based analysis, compiled once
+_HIGH_IMPORTANCE_RE = _keyword_pattern([
+    "urgent", "critical", "emergency", "escalation",
+    "decision", "approval", "budget", "strategic",
+    "executive", "board", "client", "customer"
+])
+_LOW_IMPORTANCE_RE = _keyword_pattern([
+    "optional", "fun", "social", "casual", "catch-up",
+    "standup", "sync", "check-in", "status"
+])
+_AI_SUITABLE_RE = _keyword_pattern(["status", "update", "standup", "review", "sync"])
+
+# Sentiment words, matched against whole words of the meeting text
+_WORD_RE = re.compile(r"[a-z']+")
+_POSITIVE_WORDS = frozenset([
+    "great", "excellent", "opportunity", "success", "celebrate",
+    "achievement", "progress", "innovative"
+])
+_NEGATIVE_WORDS = frozenset([
+    "problem", "issue", "concern", "risk", "failure", "delay",
+    "escalation", "urgent", "critical"
+])
+
+# Category keywords in priority order; the first category with a match wins
+_CATEGORY_KEYWORDS = (
+    (MeetingCategory.STATUS_UPDATE, ["status", "update", "standup", "sync"]),
+    (MeetingCategory.BRAINSTORMING, ["brainstorm", "ideation", "creative", "workshop"]),
+    (MeetingCategory.DECISION_MAKING, ["decision", "approval", "review", "gate"]),
+    (MeetingCategory.ONE_ON_ONE, ["1:1", "one-on-one", "1-on-1", "catch up"]),
+    (MeetingCategory.TRAINING, ["training", "learning", "onboarding", "tutorial"]),
+    (MeetingCategory.CLIENT_MEETING, ["client", "customer", "prospect", "sales"]),
+    (MeetingCategory.TEAM_BUILDING, ["team building", "social", "happy hour", "lunch"]),
+    (MeetingCategory.REVIEW, ["review", "retrospective", "retro", "post-mortem"]),
+    (MeetingCategory.PLANNING, ["planning", "roadmap", "strategy", "sprint"]),
+    (MeetingCategory.EMERGENCY, ["emergency", "urgent", "critical", "incident"])
+)
+_CATEGORY_PRIORITY = tuple(category for category, _ in _CATEGORY_KEYWORDS)
+_CATEGORY_BY_KEYWORD: Dict[str, int] = {}
+for _priority, (_, _keywords) in enumerate(_CATEGORY_KEYWORDS):
+    for _keyword in _keywords:
+        _CATEGORY_BY_KEYWORD.setdefault(_keyword, _priority)
+_CATEGORY_KEYWORD_RE = _keyword_pattern(list(_CATEGORY_BY_KEYWORD))
+
+# Distinct meeting texts whose keyword analysis is memoized; recurring
+# meetings share titles, so most lookups hit
+_KEYWORD_ANALYSIS_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_KEYWORD_ANALYSIS_CACHE_SIZE)
+def _categorize_text(text_lower: str) -> MeetingCategory:
+    """Highest-priority category among all keywords found in one scan"""
+    matched = _CATEGORY_KEYWORD_RE.findall(text_lower)
+    if matched:
+        return _CATEGORY_PRIORITY[min(_CATEGORY_BY_KEYWORD[keyword] for keyword in matched)]
+    return MeetingCategory.UNKNOWN
+
+
+@functools.lru_cache(maxsize=_KEYWORD_ANALYSIS_CACHE_SIZE)
+def _sentiment_scores(text_lower: str) -> Tuple[float, float, float]:
+    """Positive, neutral and negative keyword sentiment scores of a text"""
+    words = frozenset(_WORD_RE.findall(text_lower))
+    positive_count = len(words & _POSITIVE_WORDS)
+    negative_count = len(words & _NEGATIVE_WORDS)
+    total = max(1, positive_count + negative_count)
+
+    positive_score = positive_count / total
+    negative_score = negative_count / total
+    neutral_score = max(0, 1.0 - positive_score - negative_score)
+
+    return round(positive_score, 2), round(neutral_score, 2), round(negative_score, 2)
+
+
+# Distinct meeting start times whose hour is memoized; calendar analyses
+# revisit the same meetings, so their start times repeat
+_START_HOUR_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_START_HOUR_CACHE_SIZE)
+def _parse_hour(start_time: str) -> int:
+    """Hour of an ISO 8601 start time, or -1 if it cannot be parsed"""
+    try:
+        return datetime.fromisoformat(start_time).hour
+    except ValueError:
+        return -1
+
+
+
+def _analysis_response_format(detailed: bool) -> Dict[str, Any]:
+    """Strict JSON schema for the multi-task analysis response
+
+    Detailed schemas add the prose rationale fields and attendee roles,
+    which only deeper analyses pay output tokens for. strategic_value is
+    a scoring input, so shallower schemas keep it as a bare level.
+    """
+    string_list = {"type": "array", "items": {"type": "string"}}
+    analysis_properties = {
+        # Scores first so a streamed response can be cut short on an obvious skip
+        "importance_score": {"type": "number"},
+        "urgency_score": {"type": "number"},
+        "skip_probability": {"type": "number"},
+        "category": {"type": "string", "enum": [category.value for category in MeetingCategory]},
+        "ai_attendance_suitable": {"type": "boolean"},
+        "key_topics": string_list,
+        "required_preparation": string_list,
+        "expected_outcomes": string_list,
+        "decision_points": string_list,
+        "optimal_duration_minutes": {"type": "integer"},
+        "efficiency_recommendations": string_list,
+        "potential_blockers": string_list,
+        "follow_up_actions": string_list,
+        "delegation_candidates": string_list,
+        "alternative_approaches": string_list
+    }
+    if detailed:
+        analysis_properties["strategic_value"] = {"type": "string"}
+        analysis_properties["ai_reasoning"] = {"type": "string"}
+    else:
+        analysis_properties["strategic_value"] = {"type": "string", "enum": ["High", "Medium", "Low"]}
+
+    properties = {
+        "analysis": {
+            "type": "object",
+            "properties": analysis_properties,
+            "required": list(analysis_properties),
+            "additionalProperties": False
+        },
+        "summary": {"type": "string"}
+    }
+    if detailed:
+        # Strict schemas cannot key objects by email, so roles come as a list
+        properties["attendees"] = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"email": {"type": "string"}, "role": {"type": "string"}},
+                "required": ["email", "role"],
+                "additionalProperties": False
+            }
+        }
+
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "meeting_analysis",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False
+            }
+        }
+    }
+
+
+# Response formats per depth, built once and shared by every request
+_STANDARD_RESPONSE_FORMAT = _analysis_response_format(detailed=False)
+_DETAILED_RESPONSE_FORMAT = _analysis_response_format(detailed=True)
+_ANALYSIS_RESPONSE_FORMATS = {
+    AnalysisDepth.QUICK: _STANDARD_RESPONSE_FORMAT,
+    AnalysisDepth.STANDARD: _STANDARD_RESPONSE_FORMAT,
+    AnalysisDepth.DEEP: _DETAILED_RESPONSE_FORMAT,
+    AnalysisDepth.EXECUTIVE: _DETAILED_RESPONSE_FORMAT
+}
+
+@dataclass(slots=True, kw_only=True)
 class MeetingInsight:
     """Comprehensive meeting insights from AI analysis"""
     importance_score: float  # 0.0 to 10.0
@@ -70,70 +448,262 @@ class MeetingInsight:
     ai_reasoning: str
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage"""
-        return {
-            **asdict(self),
-            'category': self.category.value
-        }
+        """Convert to dictionary for storage
+
+        Shallow: lists and dicts are shared with the insight rather than
+        deep-copied, since callers serialize the result straight away.
+        """
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data['category'] = self.category.value
+        return data
+
+    def copy(self) -> "MeetingInsight":
+        """Independent copy that bypasses __init__
+
+        Containers are copied one level deep; they only hold strings and
+        numbers, so this is as safe as copy.deepcopy and much cheaper.
+        """
+        clone = object.__new__(MeetingInsight)
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            if isinstance(value, (list, dict)):
+                value = value.copy()
+            object.__setattr__(clone, name, value)
+        return clone
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    """Scale a vector to unit L2 norm so cosine similarity is a dot product"""
+    norm = np.sqrt(np.vdot(vector, vector))
+    return vector / norm if norm > 0 else vector
+
+
+class SemanticInsightCache:
+    """LRU cache of LLM insights looked up by meeting text similarity
+
+    Meetings are embedded into L2-normalised rows of a fixed-size matrix,
+    so a lookup is a single matrix-vector product. An insight is reused
+    when the cosine similarity to a cached meeting reaches the threshold.
+    With SimSIMD installed the matrix is stored as float16 and scored with
+    its SIMD cosine kernel.
+    """
+
+    def __init__(
+        self,
+        vectorizer: HashingVectorizer,
+        capacity: int = 512,
+        threshold: float = 0.95
+    ):
+        self.vectorizer = vectorizer
+        self.threshold = threshold
+        self.matrix = np.zeros(
+            (capacity, vectorizer.n_features),
+            dtype=np.float16 if HAS_SIMSIMD else np.float32
+        )
+        # Matrix row -> cached insight, least recently used first
+        self.entries: OrderedDict[int, MeetingInsight] = OrderedDict()
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed meeting text as an L2-normalised float32 vector"""
+        return _normalize(self.vectorizer.transform([text]).toarray()[0].astype(np.float32))
+
+    def get(self, embedding: np.ndarray) -> Optional[MeetingInsight]:
+        """Return a copy of the most similar cached insight, if similar enough"""
+        if not self.entries or not embedding.any():
+            return None
+
+        # Rows are filled in order and reused on eviction, so the occupied
+        # rows are always a prefix of the matrix
+        occupied = self.matrix[:len(self.entries)]
+        if HAS_SIMSIMD:
+            query = embedding.astype(np.float16)[np.newaxis]
+            scores = 1.0 - np.asarray(simsimd.cdist(query, occupied, metric="cosine")).ravel()
+        else:
+            scores = occupied @ embedding
+        row = int(np.argmax(scores))
+        if scores[row] < self.threshold:
+            return None
+
+        self.entries.move_to_end(row)
+        # Callers enhance insights in place, so never hand out the cached one
+        return self.entries[row].copy()
+
+    def put(self, embedding: np.ndarray, insight: MeetingInsight):
+        """Cache an insight, evicting the least recently used when full"""
+        if len(self.entries) < len(self.matrix):
+            row = len(self.entries)
+        else:
+            row, _ = self.entries.popitem(last=False)
+
+        self.matrix[row] = embedding
+        self.entries[row] = insight.copy()
+
+
+class MeetingPatternHistory:
+    """Fixed-size ring buffer of analyses for one recurring meeting pattern
+
+    Each field is its own NumPy column, so aggregates over the history
+    are array reductions instead of loops over per-meeting dicts.
+    """
+
+    def __init__(self, capacity: int = _PATTERN_HISTORY_CAPACITY):
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.importance = np.zeros(capacity, dtype=np.float32)
+        self.duration = np.zeros(capacity, dtype=np.int32)
+        self.skip_probability = np.zeros(capacity, dtype=np.float32)
+        self.ai_suitable = np.zeros(capacity, dtype=bool)
+        self.head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, importance: float, duration: int, skip_probability: float, ai_suitable: bool):
+        """Record an analysis, overwriting the oldest when full"""
+        self.timestamps[self.head] = time.time()
+        self.importance[self.head] = importance
+        self.duration[self.head] = duration
+        self.skip_probability[self.head] = skip_probability
+        self.ai_suitable[self.head] = ai_suitable
+        self.head = (self.head + 1) % len(self.importance)
+        self.size = min(self.size + 1, len(self.importance))
+
+    def mean_duration(self) -> float:
+        """Average duration in minutes of the recorded meetings"""
+        return float(self.duration[:self.size].mean()) if self.size else 0.0
+
+
+class TokenBucket:
+    """Requests-per-minute and tokens-per-minute budget shared by LLM calls
+
+    Both budgets refill continuously from elapsed time, so callers wait
+    only as long as needed to stay under quota instead of discovering it
+    through rate limit errors. After one, capacity is halved for a
+    cool-down period.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_available = float(requests_per_minute)
+        self.tokens_available = float(tokens_per_minute)
+        self.last_refill = time.monotonic()
+        self.throttled_until = 0.0
+        # Held while waiting, so callers are served in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> Tuple[float, float]:
+        """Top up both budgets for the time elapsed; returns current capacities"""
+        scale = 0.5 if now < self.throttled_until else 1.0
+        request_capacity = self.requests_per_minute * scale
+        token_capacity = self.tokens_per_minute * scale
+
+        elapsed_minutes = (now - self.last_refill) / 60
+        self.last_refill = now
+        self.requests_available = min(
+            request_capacity, self.requests_available + elapsed_minutes * request_capacity
+        )
+        self.tokens_available = min(
+            token_capacity, self.tokens_available + elapsed_minutes * token_capacity
+        )
+        return request_capacity, token_capacity
+
+    async def acquire(self, tokens: int):
+        """Wait until one request of the given token size fits, then take it"""
+        async with self._lock:
+            while True:
+                request_capacity, token_capacity = self._refill(time.monotonic())
+                # A request larger than the whole budget waits for a full bucket
+                needed = min(tokens, token_capacity)
+                if self.requests_available >= 1 and self.tokens_available >= needed:
+                    self.requests_available -= 1
+                    self.tokens_available -= needed
+                    return
+
+                await asyncio.sleep(max(
+                    (1 - self.requests_available) * 60 / request_capacity,
+                    (needed - self.tokens_available) * 60 / token_capacity,
+                    0.0
+                ))
+
+    def throttle(self):
+        """Halve capacity for the cool-down period after a rate limit error"""
+        self.throttled_until = time.monotonic() + _RATE_LIMIT_COOLDOWN_SECONDS
 
 
 class LLMAnalyzer:
     """Advanced LLM-powered meeting analyzer"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ):
         self.api_key = api_key
         if api_key:
-            self.client = AsyncOpenAI(api_key=api_key)
+            # HTTP/2 multiplexes concurrent analyses over pooled connections
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY_SECONDS
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0)
+            )
+            self.client = AsyncOpenAI(api_key=api_key, http_client=self._http_client)
         else:
+            self._http_client = None
             self.client = None
             logger.warning("No OpenAI API key provided. LLM features will be limited.")
 
-        # Initialize TF-IDF vectorizer for similarity analysis
-        self.vectorizer = TfidfVectorizer(max_features=100, stop_words='english')
-        self.meeting_patterns_cache = {}
+        # Proactive quota shared by every call; without both limits, only
+        # rate limit errors slow requests down
+        self._rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(requests_per_minute, tokens_per_minute)
+            if requests_per_minute and tokens_per_minute else None
+        )
 
-        # Pre-defined prompt templates for consistency
-        self.prompt_templates = self._initialize_prompt_templates()
+        # Initialize hashing vectorizer for similarity analysis
+        # Stateless, so titles are embedded without fitting a vocabulary
+        self.vectorizer = HashingVectorizer(
+            n_features=1024, alternate_sign=False, norm='l2', stop_words='english'
+        )
+        self.meeting_patterns_cache: DefaultDict[str, MeetingPatternHistory] = defaultdict(MeetingPatternHistory)
+
+        # LLM insights reused for near-identical meetings, one cache per depth
+        # and organizer/user context so users never see each other's insights
+        self._insight_caches: OrderedDict[Tuple[AnalysisDepth, str], SemanticInsightCache] = OrderedDict()
+
+        # id(user_context) -> (user_context, JSON); holding the context keeps its id unique
+        self._user_context_json: OrderedDict[int, Tuple[Dict[str, Any], str]] = OrderedDict()
+        # Micro-batched explanation requests; the worker starts on first use
+        self._explanation_queue: Optional[asyncio.Queue] = None
+        self._explanation_task: Optional[asyncio.Task] = None
+        self._explanation_semaphore = asyncio.Semaphore(_EXPLANATION_CONCURRENCY)
+        self._explanation_batches: set = set()
+
+        # SHA-256 of the request -> (monotonic time, response content)
+        self._response_cache: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+        # id(recent_meetings) -> (recent_meetings, title vectors / attendee sets / counts)
+        self._recent_meeting_indexes: OrderedDict[int, Tuple[List[Dict[str, Any]], Tuple]] = OrderedDict()
+
+        # Pre-defined prompt templates for consistency, dedented once so the
+        # source indentation is not sent as prompt tokens
+        self.prompt_templates = {
+            name: textwrap.dedent(template).strip()
+            for name, template in self._initialize_prompt_templates().items()
+        }
+        # Bound formatters, so call sites skip the template lookup
+        self._prompt_formatters: Dict[str, Callable[..., str]] = {
+            name: template.format for name, template in self.prompt_templates.items()
+        }
 
     def _initialize_prompt_templates(self) -> Dict[str, str]:
         """Initialize sophisticated prompt templates"""
         return {
-            "meeting_analysis": """
-                You are an elite executive assistant AI with expertise in time management and meeting optimization.
-                Analyze this meeting with surgical precision:
-
-                Meeting Title: {title}
-                Description: {description}
-                Duration: {duration} minutes
-                Attendees: {attendees}
-                Organizer: {organizer}
-                Time: {meeting_time}
-                Location/Link: {location}
-
-                Provide a comprehensive analysis in JSON format:
-                {{
-                    "importance_score": <0-10, based on strategic value>,
-                    "urgency_score": <0-10, based on time sensitivity>,
-                    "category": "<meeting category>",
-                    "ai_attendance_suitable": <true if AI can represent the user>,
-                    "key_topics": [<3-5 main discussion points>],
-                    "required_preparation": [<specific prep items>],
-                    "expected_outcomes": [<concrete deliverables>],
-                    "decision_points": [<decisions to be made>],
-                    "optimal_duration_minutes": <recommended duration>,
-                    "efficiency_recommendations": [<ways to improve meeting>],
-                    "potential_blockers": [<risks or issues>],
-                    "skip_probability": <0-1, likelihood user can skip>,
-                    "delegation_candidates": [<who else could attend>],
-                    "alternative_approaches": [<other ways to achieve goals>],
-                    "strategic_value": "<High/Medium/Low> - <explanation>",
-                    "ai_reasoning": "<detailed reasoning for recommendations>"
-                }}
-
-                Consider factors like: ROI of attendance, alternative communication methods,
-                meeting fatigue, focus time protection, and strategic alignment.
-            """,
-
             "attendee_analysis": """
                 Analyze the importance and roles of meeting attendees:
 
@@ -151,39 +721,19 @@ class LLMAnalyzer:
                 Return JSON with email as key and analysis as value.
             """,
 
+            # Volatile tail only; the instructions are CALENDAR_PATTERN_INSTRUCTIONS
             "calendar_pattern_recognition": """
-                You are a calendar optimization expert. Analyze these calendar patterns:
-
                 Recent Meetings: {recent_meetings}
                 Upcoming Schedule: {upcoming_schedule}
                 User Preferences: {preferences}
-
-                Identify:
-                1. Recurring meeting patterns and their effectiveness
-                2. Meeting clustering and fatigue zones
-                3. Optimal focus time slots
-                4. Inefficient meeting patterns
-                5. Opportunities for batch processing
-                6. Recommended schedule optimizations
-
-                Provide actionable insights for calendar optimization.
             """,
 
+            # Volatile tail only; the instructions are EXPLANATION_INSTRUCTIONS
             "natural_explanation": """
-                Generate a natural, conversational explanation for this meeting decision:
-
                 Decision: {decision}
                 Meeting: {meeting_title}
                 Reasoning Data: {reasoning_data}
                 User Context: {user_context}
-
-                Write a 2-3 sentence explanation that:
-                1. Sounds human and empathetic
-                2. Clearly explains the reasoning
-                3. Provides actionable next steps
-                4. Maintains professional tone with personality
-
-                Format: Conversational but professional explanation.
             """,
 
             "meeting_summary": """
@@ -218,6 +768,108 @@ class LLMAnalyzer:
             """
         }
 
+    async def aclose(self):
+        """Stop the explanation worker and close the pooled HTTP connections
+
+        Requests still queued or waiting out the batch window are failed
+        with CancelledError; batches already dispatched finish first.
+        """
+        if self._explanation_task is not None:
+            self._explanation_task.cancel()
+            # The worker fails its in-window batch as it unwinds
+            await asyncio.gather(self._explanation_task, return_exceptions=True)
+            self._explanation_task = None
+
+        if self._explanation_queue is not None:
+            queued = []
+            while not self._explanation_queue.empty():
+                queued.append(self._explanation_queue.get_nowait())
+            self._cancel_explanation_requests(queued)
+
+        if self._explanation_batches:
+            await asyncio.gather(*self._explanation_batches, return_exceptions=True)
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    async def _chat_completion(self, **kwargs) -> Any:
+        """Create a chat completion, backing off exponentially when rate limited"""
+        if self._rate_limiter is not None:
+            # Prompt tokens plus the completion allowance, as the API counts them
+            count_tokens = await _load_token_counter()
+            tokens = sum(
+                count_tokens(message["content"]) for message in kwargs.get("messages", ())
+            ) + kwargs.get("max_tokens", 0)
+
+        for attempt in range(_RATE_LIMIT_ATTEMPTS):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(tokens)
+            try:
+                return await self.client.chat.completions.create(**kwargs)
+            except openai.RateLimitError:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.throttle()
+                if attempt == _RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                delay = 2 ** attempt + random.random()
+                logger.warning(f"Rate limited by OpenAI, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def _cached_chat(self, ttl: float = _RESPONSE_CACHE_TTL_SECONDS, **kwargs) -> str:
+        """
+        Chat completion content, served from cache for identical requests
+
+        The key is a SHA-256 of the canonical (sorted-key) request, so the
+        same model, messages and sampling parameters within ttl seconds
+        skip the API call.
+        """
+        key = hashlib.sha256(orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        cached = self._response_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            self._response_cache.move_to_end(key)
+            return cached[1]
+
+        response = await self._chat_completion(**kwargs)
+        content = response.choices[0].message.content
+
+        self._response_cache[key] = (time.monotonic(), content)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > _RESPONSE_CACHE_CAPACITY:
+            self._response_cache.popitem(last=False)
+        return content
+
+    async def analyze_meetings(
+        self,
+        meetings: List[Dict[str, Any]],
+        depth: AnalysisDepth = AnalysisDepth.STANDARD,
+        user_context: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = _ANALYSIS_CONCURRENCY
+    ) -> List[MeetingInsight]:
+        """
+        Analyze several meetings concurrently, in input order
+
+        At most max_concurrency analyses are in flight at once so a large
+        calendar sync does not trip the API rate limit.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(meeting: Dict[str, Any]) -> MeetingInsight:
+            async with semaphore:
+                return await self.analyze_meeting(meeting, depth, user_context)
+
+        results = await asyncio.gather(
+            *(analyze_one(meeting) for meeting in meetings),
+            return_exceptions=True
+        )
+
+        insights = []
+        for meeting, result in zip(meetings, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error analyzing meeting: {result}")
+                result = self._fallback_analysis(meeting)
+            insights.append(result)
+        return insights
+
     async def analyze_meeting(
         self,
         meeting_data: Dict[str, Any],
@@ -238,11 +890,23 @@ class LLMAnalyzer:
             location = meeting_data.get("location", meeting_data.get("meeting_link", ""))
 
             if self.client and depth != AnalysisDepth.QUICK:
-                # Use LLM for deep analysis
-                insight = await self._llm_deep_analysis(
-                    title, description, attendees, duration,
-                    organizer, meeting_time, location, depth, user_context
+                # Reuse the LLM analysis of a near-identical meeting if cached
+                cache = self._insight_cache(depth, organizer, user_context)
+                embedding = cache.embed(
+                    f"{title} {description} duration_{duration} {' '.join(sorted(attendees))}"
                 )
+                insight = cache.get(embedding)
+
+                if insight is None:
+                    # Use LLM for deep analysis
+                    insight, from_llm = await self._llm_deep_analysis(
+                        title, description, attendees, duration,
+                        organizer, meeting_time, location, depth, user_context
+                    )
+                    # A rule-based fallback would otherwise stand in for the
+                    # LLM result for as long as similar meetings keep hitting it
+                    if from_llm:
+                        cache.put(embedding, insight)
             else:
                 # Use rule-based analysis for quick or no-API scenarios
                 insight = self._rule_based_analysis(
@@ -274,76 +938,49 @@ class LLMAnalyzer:
         location: str,
         depth: AnalysisDepth,
         user_context: Optional[Dict[str, Any]]
-    ) -> MeetingInsight:
-        """Perform deep LLM-based analysis"""
+    ) -> Tuple[MeetingInsight, bool]:
+        """Perform deep LLM-based analysis
 
-        # Prepare the analysis prompt
-        prompt = self.prompt_templates["meeting_analysis"].format(
-            title=title,
-            description=description or "No description provided",
-            duration=duration,
-            attendees=", ".join(attendees) if attendees else "Unknown",
-            organizer=organizer,
-            meeting_time=meeting_time,
-            location=location or "Not specified"
-        )
+        Returns the insight and whether it came from the LLM, which is
+        False when the call failed and rule-based analysis was used.
+        """
 
-        # Add user context if available
-        if user_context:
-            prompt += f"\n\nUser Context: {json.dumps(user_context, indent=2)}"
+        prompt = self._build_analysis_prompt(
+            title, description, attendees, duration,
+            organizer, meeting_time, location, depth, user_context
+        )
 
         try:
-            # Make LLM call with appropriate model based on depth
-            model = "gpt-4o" if depth == AnalysisDepth.DEEP else "gpt-4o-mini"
-
-            response = await self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "You are an expert meeting analyst. Provide analysis in valid JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,  # Low temperature for consistent analysis
-                response_format={"type": "json_object"}
+            # Analysis, attendee roles and summary come back from one call
+            stream = await self._chat_completion(
+                **self._analysis_request_body(prompt, depth), stream=True
             )
-
-            analysis = json.loads(response.choices[0].message.content)
-
-            # Perform attendee analysis if depth is DEEP or EXECUTIVE
-            attendee_roles = {}
-            if depth in [AnalysisDepth.DEEP, AnalysisDepth.EXECUTIVE]:
+            result, complete = await self._read_analysis_stream(stream)
+
+            if not complete:
+                # Obvious skip: the leading scores are all the analysis needed
+                result["category"] = self._categorize_meeting(
+                    f"{title} {description or ''}".lower()
+                ).value
+                result["ai_reasoning"] = "Analysis stopped early: the meeting is very likely skippable"
+                summary = f"{title} - Likely skippable ({result['skip_probability']:.0%} skip probability)"
+                return self._insight_from_analysis(
+                    result, title, description, duration, {}, summary
+                ), True
+
+            analysis, attendee_roles, summary = self._split_analysis_response(result)
+
+            # Separate calls remain as fallbacks for incomplete responses
+            if depth in [AnalysisDepth.DEEP, AnalysisDepth.EXECUTIVE] and not attendee_roles:
                 attendee_roles = await self._analyze_attendees(
                     title, attendees, user_context
                 )
+            if not summary:
+                summary = await self._generate_summary(title, analysis)
 
-            # Generate natural language summary
-            summary = await self._generate_summary(title, analysis)
-
-            # Calculate sentiment (simplified for now)
-            sentiment = self._analyze_sentiment(description, title)
-
-            return MeetingInsight(
-                importance_score=float(analysis.get("importance_score", 5)),
-                urgency_score=float(analysis.get("urgency_score", 5)),
-                ai_attendance_suitable=analysis.get("ai_attendance_suitable", False),
-                ai_confidence=0.85,  # High confidence for LLM analysis
-                category=self._parse_category(analysis.get("category", "unknown")),
-                key_topics=analysis.get("key_topics", []),
-                required_preparation=analysis.get("required_preparation", []),
-                expected_outcomes=analysis.get("expected_outcomes", []),
-                decision_points=analysis.get("decision_points", []),
-                attendee_analysis=attendee_roles,
-                optimal_duration_minutes=analysis.get("optimal_duration_minutes", duration),
-                efficiency_recommendations=analysis.get("efficiency_recommendations", []),
-                potential_blockers=analysis.get("potential_blockers", []),
-                follow_up_actions=analysis.get("follow_up_actions", []),
-                sentiment_analysis=sentiment,
-                strategic_value=analysis.get("strategic_value", "Medium - Standard meeting"),
-                skip_probability=float(analysis.get("skip_probability", 0.3)),
-                delegation_candidates=analysis.get("delegation_candidates", []),
-                alternative_approaches=analysis.get("alternative_approaches", []),
-                generated_summary=summary,
-                ai_reasoning=analysis.get("ai_reasoning", "")
-            )
+            return self._insight_from_analysis(
+                analysis, title, description, duration, attendee_roles, summary
+            ), True
 
         except Exception as e:
             logger.error(f"LLM analysis failed: {e}")
@@ -351,8 +988,298 @@ class LLMAnalyzer:
             return self._rule_based_analysis(
                 title, description, attendees, duration,
                 organizer, meeting_time, location
+            ), False
+
+    async def _read_analysis_stream(self, stream: Any) -> Tuple[Dict[str, Any], bool]:
+        """
+        Accumulate a streamed analysis response while scanning its scores
+
+        Returns the decoded response and True, or just the leading scores
+        and False if the stream was closed early because skip_probability
+        showed the meeting is an obvious skip.
+        """
+        content = ""
+        scores: Dict[str, float] = {}
+        scanned = 0
+        async for chunk in stream:
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            content += chunk.choices[0].delta.content
+
+            if "skip_probability" not in scores:
+                # Rescan only the tail that could hold a newly completed field
+                for match in _STREAMED_SCORE_RE.finditer(content, max(0, scanned - 64)):
+                    scores[match.group(1)] = float(match.group(2))
+                scanned = len(content)
+
+                if scores.get("skip_probability", 0.0) > _EARLY_SKIP_PROBABILITY:
+                    await stream.close()
+                    logger.info("Meeting is an obvious skip, stopped analysis early")
+                    return scores, False
+
+        return orjson.loads(content), True
+
+    def _build_analysis_prompt(
+        self,
+        title: str,
+        description: str,
+        attendees: List[str],
+        duration: int,
+        organizer: str,
+        meeting_time: str,
+        location: str,
+        depth: AnalysisDepth,
+        user_context: Optional[Dict[str, Any]]
+    ) -> str:
+        """Compact JSON user message describing the meeting to analyze"""
+
+        # Round to the minute so identical meetings produce identical payloads
+        try:
+            meeting_time = datetime.fromisoformat(meeting_time).replace(
+                second=0, microsecond=0
+            ).isoformat()
+        except (ValueError, TypeError):
+            pass
+
+        payload = {
+            "title": title,
+            "description": description or "No description provided",
+            "duration_minutes": duration,
+            "attendees": attendees or [],
+            "organizer": organizer,
+            "time": meeting_time,
+            "location": location or "Not specified",
+            # Attendee roles are only worth the output tokens for deeper analysis
+            "include_attendee_roles": depth in [AnalysisDepth.DEEP, AnalysisDepth.EXECUTIVE]
+        }
+
+        payload_json = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+
+        # Add user context if available; "user_context" sorts after every
+        # other key, so appending it keeps the payload in sorted-key order
+        if user_context:
+            payload_json = f'{payload_json[:-1]},"user_context":{self._user_context_to_json(user_context)}}}'
+
+        return payload_json
+
+    def _insight_cache(
+        self,
+        depth: AnalysisDepth,
+        organizer: str,
+        user_context: Optional[Dict[str, Any]]
+    ) -> SemanticInsightCache:
+        """Semantic insight cache for analyses at a depth with this organizer and user context"""
+        context_json = self._user_context_to_json(user_context) if user_context else ""
+        context_hash = hashlib.sha256(f"{organizer}\0{context_json}".encode()).hexdigest()
+        key = (depth, context_hash)
+
+        cache = self._insight_caches.get(key)
+        if cache is None:
+            cache = self._insight_caches[key] = SemanticInsightCache(self.vectorizer)
+            if len(self._insight_caches) > _INSIGHT_CACHE_SCOPES:
+                self._insight_caches.popitem(last=False)
+        else:
+            self._insight_caches.move_to_end(key)
+        return cache
+
+    def _user_context_to_json(self, user_context: Dict[str, Any]) -> str:
+        """Serialize a user context once and reuse it for every meeting it is passed with
+
+        Contexts are expected not to be mutated while meetings are analyzed.
+        """
+        key = id(user_context)
+        cached = self._user_context_json.get(key)
+        if cached is not None and cached[0] is user_context:
+            self._user_context_json.move_to_end(key)
+            return cached[1]
+
+        serialized = orjson.dumps(
+            user_context, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode()
+        self._user_context_json[key] = (user_context, serialized)
+        if len(self._user_context_json) > _USER_CONTEXT_CACHE_CAPACITY:
+            self._user_context_json.popitem(last=False)
+        return serialized
+
+    @staticmethod
+    def _split_analysis_response(
+        result: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, str], str]:
+        """Split a multi-task response into analysis, attendee roles and summary"""
+        analysis = result.get("analysis")
+        if not isinstance(analysis, dict):
+            # Model answered with the bare analysis object
+            analysis = result
+        attendee_roles = result.get("attendees")
+        if isinstance(attendee_roles, list):
+            attendee_roles = {
+                entry["email"]: entry["role"]
+                for entry in attendee_roles
+                if isinstance(entry, dict) and "email" in entry and "role" in entry
+            }
+        elif not isinstance(attendee_roles, dict):
+            attendee_roles = {}
+        summary = result.get("summary")
+        return analysis, attendee_roles, summary.strip() if isinstance(summary, str) else ""
+
+    def _analysis_request_body(self, prompt: str, depth: AnalysisDepth) -> Dict[str, Any]:
+        """Chat completion parameters for a meeting analysis prompt"""
+        return {
+            "model": "gpt-4o" if depth == AnalysisDepth.DEEP else "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,  # Low temperature for consistent analysis
+            "response_format": _ANALYSIS_RESPONSE_FORMATS[depth]
+        }
+
+    def _insight_from_analysis(
+        self,
+        analysis: Dict[str, Any],
+        title: str,
+        description: str,
+        duration: int,
+        attendee_roles: Dict[str, str],
+        summary: str
+    ) -> MeetingInsight:
+        """Build a MeetingInsight from the decoded LLM analysis"""
+
+        # Calculate sentiment (simplified for now)
+        sentiment = self._analyze_sentiment(f"{title} {description or ''}".lower())
+
+        return MeetingInsight(
+            importance_score=float(analysis.get("importance_score", 5)),
+            urgency_score=float(analysis.get("urgency_score", 5)),
+            ai_attendance_suitable=analysis.get("ai_attendance_suitable", False),
+            ai_confidence=0.85,  # High confidence for LLM analysis
+            category=self._parse_category(analysis.get("category", "unknown")),
+            key_topics=analysis.get("key_topics", []),
+            required_preparation=analysis.get("required_preparation", []),
+            expected_outcomes=analysis.get("expected_outcomes", []),
+            decision_points=analysis.get("decision_points", []),
+            attendee_analysis=attendee_roles,
+            optimal_duration_minutes=analysis.get("optimal_duration_minutes", duration),
+            efficiency_recommendations=analysis.get("efficiency_recommendations", []),
+            potential_blockers=analysis.get("potential_blockers", []),
+            follow_up_actions=analysis.get("follow_up_actions", []),
+            sentiment_analysis=sentiment,
+            strategic_value=analysis.get("strategic_value", "Medium - Standard meeting"),
+            skip_probability=float(analysis.get("skip_probability", 0.3)),
+            delegation_candidates=analysis.get("delegation_candidates", []),
+            alternative_approaches=analysis.get("alternative_approaches", []),
+            generated_summary=summary,
+            ai_reasoning=analysis.get("ai_reasoning", "")
+        )
+
+    async def analyze_meetings_batch(
+        self,
+        meetings: List[Dict[str, Any]],
+        depth: AnalysisDepth = AnalysisDepth.STANDARD,
+        user_context: Optional[Dict[str, Any]] = None,
+        max_poll_interval: float = 300.0
+    ) -> List[MeetingInsight]:
+        """
+        Analyze many meetings through the OpenAI Batch API
+
+        Meant for offline precomputation such as scanning the upcoming week:
+        batch jobs are billed at half price and do not count against the
+        interactive rate limit, but may take up to 24 hours to complete.
+        Insights are returned in the order of the input meetings; meetings
+        the batch could not analyze get the rule-based analysis.
+        """
+
+        if not meetings:
+            return []
+
+        if not self.client or depth == AnalysisDepth.QUICK:
+            return [await self.analyze_meeting(m, depth, user_context) for m in meetings]
+
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            # One request line per meeting, keyed by its position in the input
+            lines = []
+            for index, meeting in enumerate(meetings):
+                prompt = self._build_analysis_prompt(
+                    meeting.get("title", ""),
+                    meeting.get("description", ""),
+                    meeting.get("attendees", []),
+                    meeting.get("duration_minutes", 30),
+                    meeting.get("organizer_email", ""),
+                    meeting.get("start_time", ""),
+                    meeting.get("location", meeting.get("meeting_link", "")),
+                    depth,
+                    user_context
+                )
+                lines.append(orjson.dumps({
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._analysis_request_body(prompt, depth)
+                }))
+
+            batch_input = await self.client.files.create(
+                file=("meeting_analysis.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_input.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
             )
 
+            # Poll with exponential backoff until the batch reaches a final state
+            poll_interval = 5.0
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, max_poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.output_file_id:
+                output = await self.client.files.content(batch.output_file_id)
+                for line in output.text.splitlines():
+                    if not line:
+                        continue
+                    record = orjson.loads(line)
+                    response = record.get("response") or {}
+                    if response.get("status_code") != 200:
+                        continue
+                    content = response["body"]["choices"][0]["message"]["content"]
+                    results[record["custom_id"]] = orjson.loads(content)
+            else:
+                logger.error(f"Batch analysis {batch.id} ended with status {batch.status}")
+
+        except Exception as e:
+            logger.error(f"Batch analysis failed: {e}")
+
+        insights = []
+        for index, meeting in enumerate(meetings):
+            title = meeting.get("title", "")
+            description = meeting.get("description", "")
+            attendees = meeting.get("attendees", [])
+            duration = meeting.get("duration_minutes", 30)
+
+            result = results.get(str(index))
+            if result is None:
+                insight = self._rule_based_analysis(
+                    title, description, attendees, duration,
+                    meeting.get("organizer_email", ""),
+                    meeting.get("start_time", ""),
+                    meeting.get("location", meeting.get("meeting_link", ""))
+                )
+            else:
+                analysis, attendee_roles, summary = self._split_analysis_response(result)
+                if not summary:
+                    summary = f"{title} - Meeting analyzed with importance score {analysis.get('importance_score', 5)}/10"
+                insight = self._insight_from_analysis(
+                    analysis, title, description, duration, attendee_roles, summary
+                )
+
+            self._update_pattern_cache(meeting, insight)
+            insights.append(insight)
+
+        return insights
+
     def _rule_based_analysis(
         self,
         title: str,
@@ -365,27 +1292,13 @@ class LLMAnalyzer:
     ) -> MeetingInsight:
         """Rule-based analysis when LLM is not available"""
 
-        # Keyword-based importance scoring
+        # Lowercase once; every keyword check below reuses these
         title_lower = title.lower()
-        desc_lower = (description or "").lower()
-        combined_text = f"{title_lower} {desc_lower}"
+        combined_text = f"{title_lower} {(description or '').lower()}"
 
         # Calculate importance based on keywords
-        high_importance_keywords = ["urgent", "critical", "emergency", "escalation",
-                                   "decision", "approval", "budget", "strategic",
-                                   "executive", "board", "client", "customer"]
-
-        low_importance_keywords = ["optional", "fun", "social", "casual", "catch-up",
-                                   "standup", "sync", "check-in", "status"]
-
-        importance_score = 5.0
-        for keyword in high_importance_keywords:
-            if keyword in combined_text:
-                importance_score = min(10, importance_score + 1.5)
-
-        for keyword in low_importance_keywords:
-            if keyword in combined_text:
-                importance_score = max(0, importance_score - 1)
+        importance_score = min(10, 5.0 + 1.5 * _count_keywords(_HIGH_IMPORTANCE_RE, combined_text))
+        importance_score = max(0, importance_score - _count_keywords(_LOW_IMPORTANCE_RE, combined_text))
 
         # Urgency based on time
         urgency_score = 5.0
@@ -395,11 +1308,10 @@ class LLMAnalyzer:
             urgency_score = 10.0
 
         # Determine if AI can attend
-        ai_suitable_meetings = ["status", "update", "standup", "review", "sync"]
-        ai_attendance_suitable = any(keyword in title_lower for keyword in ai_suitable_meetings)
+        ai_attendance_suitable = _AI_SUITABLE_RE.search(title_lower) is not None
 
         # Categorize meeting
-        category = self._categorize_meeting(title, description)
+        category = self._categorize_meeting(combined_text)
 
         # Optimal duration based on meeting type
         optimal_duration = self._calculate_optimal_duration(category, attendees, duration)
@@ -442,28 +1354,9 @@ class LLMAnalyzer:
             ai_reasoning="Rule-based analysis due to LLM unavailability"
         )
 
-    def _categorize_meeting(self, title: str, description: str) -> MeetingCategory:
-        """Categorize meeting based on title and description"""
-        text = f"{title} {description or ''}".lower()
-
-        category_keywords = {
-            MeetingCategory.STATUS_UPDATE: ["status", "update", "standup", "sync"],
-            MeetingCategory.BRAINSTORMING: ["brainstorm", "ideation", "creative", "workshop"],
-            MeetingCategory.DECISION_MAKING: ["decision", "approval", "review", "gate"],
-            MeetingCategory.ONE_ON_ONE: ["1:1", "one-on-one", "1-on-1", "catch up"],
-            MeetingCategory.TRAINING: ["training", "learning", "onboarding", "tutorial"],
-            MeetingCategory.CLIENT_MEETING: ["client", "customer", "prospect", "sales"],
-            MeetingCategory.TEAM_BUILDING: ["team building", "social", "happy hour", "lunch"],
-            MeetingCategory.REVIEW: ["review", "retrospective", "retro", "post-mortem"],
-            MeetingCategory.PLANNING: ["planning", "roadmap", "strategy", "sprint"],
-            MeetingCategory.EMERGENCY: ["emergency", "urgent", "critical", "incident"]
-        }
-
-        for category, keywords in category_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                return category
-
-        return MeetingCategory.UNKNOWN
+    def _categorize_meeting(self, text_lower: str) -> MeetingCategory:
+        """Categorize meeting from its lowercased "title description" text"""
+        return _categorize_text(text_lower)
 
     def _calculate_optimal_duration(
         self,
@@ -512,31 +1405,11 @@ class LLMAnalyzer:
 
         return important_words[:5]  # Return top 5 topics
 
-    def _analyze_sentiment(self, description: str, title: str) -> Dict[str, float]:
-        """Analyze sentiment of meeting description"""
-        text = f"{title} {description or ''}".lower()
-
-        positive_words = ["great", "excellent", "opportunity", "success", "celebrate",
-                         "achievement", "progress", "innovative"]
-        negative_words = ["problem", "issue", "concern", "risk", "failure", "delay",
-                         "escalation", "urgent", "critical"]
-
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
-        total = max(1, positive_count + negative_count)
-
-        if total == 0:
-            return {"positive": 0.33, "neutral": 0.34, "negative": 0.33}
-
-        positive_score = positive_count / total
-        negative_score = negative_count / total
-        neutral_score = max(0, 1.0 - positive_score - negative_score)
-
-        return {
-            "positive": round(positive_score, 2),
-            "neutral": round(neutral_score, 2),
-            "negative": round(negative_score, 2)
-        }
+    def _analyze_sentiment(self, text_lower: str) -> Dict[str, float]:
+        """Analyze sentiment of a meeting's lowercased "title description" text"""
+        # Fresh dict per call; insights own (and may mutate) their sentiment
+        positive, neutral, negative = _sentiment_scores(text_lower)
+        return {"positive": positive, "neutral": neutral, "negative": negative}
 
     def _parse_category(self, category_str: str) -> MeetingCategory:
         """Parse category string to enum"""
@@ -555,7 +1428,15 @@ class LLMAnalyzer:
             "emergency": MeetingCategory.EMERGENCY
         }
 
-        return category_map.get(category_str.lower().replace(" ", "_"), MeetingCategory.UNKNOWN)
+        key = category_str.lower().replace(" ", "_")
+        if key in category_map:
+            return category_map[key]
+
+        # Structured outputs answer with the enum values themselves
+        try:
+            return MeetingCategory(key)
+        except ValueError:
+            return MeetingCategory.UNKNOWN
 
     async def _analyze_attendees(
         self,
@@ -568,15 +1449,15 @@ class LLMAnalyzer:
         if not self.client or not attendees:
             return {}
 
-        prompt = self.prompt_templates["attendee_analysis"].format(
+        prompt = self._prompt_formatters["attendee_analysis"](
             title=title,
-            attendees=json.dumps(attendees),
+            attendees=orjson.dumps(attendees).decode(),
             user_email=user_context.get("user_email", "") if user_context else "",
-            context=json.dumps(user_context) if user_context else "{}"
+            context=self._user_context_to_json(user_context) if user_context else "{}"
         )
 
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._chat_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "Analyze meeting attendees and return JSON."},
@@ -586,7 +1467,7 @@ class LLMAnalyzer:
                 response_format={"type": "json_object"}
             )
 
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(response.choices[0].message.content)
 
         except Exception as e:
             logger.error(f"Attendee analysis failed: {e}")
@@ -598,13 +1479,13 @@ class LLMAnalyzer:
         if not self.client:
             return f"{title} - Meeting analyzed with importance score {analysis.get('importance_score', 5)}/10"
 
-        prompt = self.prompt_templates["meeting_summary"].format(
+        prompt = self._prompt_formatters["meeting_summary"](
             meeting_details=title,
-            analysis_results=json.dumps(analysis, indent=2)
+            analysis_results=orjson.dumps(analysis, option=_PROMPT_JSON).decode()
         )
 
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._chat_completion(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "Generate concise meeting summary."},
@@ -657,28 +1538,61 @@ class LLMAnalyzer:
             return []
 
         current_title = current_meeting.get("title", "")
-        current_attendees = set(current_meeting.get("attendees", []))
-
-        similar = []
-        for meeting in recent_meetings:
-            title_similarity = self._calculate_text_similarity(
-                current_title,
-                meeting.get("title", "")
-            )
+        current_attendees = frozenset(current_meeting.get("attendees", []))
+        title_vectors, attendee_sets, attendee_counts = self._index_recent_meetings(recent_meetings)
+
+        # Rows come back L2-normalised, so cosine similarity is a dot product
+        current_vector = self.vectorizer.transform([current_title])
+        title_similarity = (title_vectors @ current_vector.T).toarray().ravel()
+
+        # Jaccard overlap is at most min(|A|, |B|) / max(|A|, |B|), so only
+        # meetings whose attendee counts allow >60% overlap are intersected
+        current_count = len(current_attendees)
+        upper_bound = np.minimum(attendee_counts, current_count) / np.maximum(
+            np.maximum(attendee_counts, current_count), 1
+        )
+        attendee_overlap = np.zeros(len(recent_meetings))
+        for i in np.flatnonzero(upper_bound > 0.6):
+            shared = len(current_attendees & attendee_sets[i])
+            attendee_overlap[i] = shared / (current_count + attendee_counts[i] - shared)
 
-            meeting_attendees = set(meeting.get("attendees", []))
-            attendee_overlap = len(current_attendees & meeting_attendees) / max(
-                len(current_attendees | meeting_attendees), 1
-            )
+        # Consider similar if title is >70% similar or attendees >60% overlap
+        mask = (title_similarity > 0.7) | (attendee_overlap > 0.6)
+        return [recent_meetings[i] for i in np.flatnonzero(mask)]
 
-            # Consider similar if title is >70% similar or attendees >60% overlap
-            if title_similarity > 0.7 or attendee_overlap > 0.6:
-                similar.append(meeting)
+    def _index_recent_meetings(
+        self,
+        recent_meetings: List[Dict[str, Any]]
+    ) -> Tuple[Any, List[FrozenSet[str]], np.ndarray]:
+        """
+        Title vectors, attendee sets and attendee counts of recent meetings
 
-        return similar
+        Built once per list and reused for every meeting compared against
+        it; lists are expected not to be mutated while meetings are analyzed.
+        """
+        key = id(recent_meetings)
+        cached = self._recent_meeting_indexes.get(key)
+        if cached is not None and cached[0] is recent_meetings:
+            self._recent_meeting_indexes.move_to_end(key)
+            return cached[1]
+
+        attendee_sets = [frozenset(meeting.get("attendees", [])) for meeting in recent_meetings]
+        index = (
+            self.vectorizer.transform([meeting.get("title", "") for meeting in recent_meetings]),
+            attendee_sets,
+            np.fromiter(map(len, attendee_sets), dtype=np.int64, count=len(attendee_sets))
+        )
+        self._recent_meeting_indexes[key] = (recent_meetings, index)
+        if len(self._recent_meeting_indexes) > _USER_CONTEXT_CACHE_CAPACITY:
+            self._recent_meeting_indexes.popitem(last=False)
+        return index
 
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two text strings"""
+        """Calculate similarity between two text strings
+
+        Kept for callers comparing a single pair; _find_similar_meetings
+        scores all candidates at once.
+        """
 
         if not text1 or not text2:
             return 0.0
@@ -708,20 +1622,14 @@ class LLMAnalyzer:
 
         key = f"{meeting_data.get('title', '')}_{insight.category.value}"
 
-        if key not in self.meeting_patterns_cache:
-            self.meeting_patterns_cache[key] = []
-
-        self.meeting_patterns_cache[key].append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "importance": insight.importance_score,
-            "duration": meeting_data.get("duration_minutes", 30),
-            "skip_probability": insight.skip_probability,
-            "ai_suitable": insight.ai_attendance_suitable
-        })
-
-        # Keep only recent patterns (last 50)
-        if len(self.meeting_patterns_cache[key]) > 50:
-            self.meeting_patterns_cache[key] = self.meeting_patterns_cache[key][-50:]
+        # Ring buffer keeps only the most recent analyses per pattern
+        self.meeting_patterns_cache[key].append(
+            insight.importance_score,
+            # Missing or null durations count as the default half hour
+            int(meeting_data.get("duration_minutes") or 30),
+            insight.skip_probability,
+            insight.ai_attendance_suitable
+        )
 
     def _fallback_analysis(self, meeting_data: Dict[str, Any]) -> MeetingInsight:
         """Minimal fallback analysis when everything else fails"""
@@ -759,33 +1667,115 @@ class LLMAnalyzer:
     ) -> str:
         """Generate natural language explanation for decisions"""
 
+        # Routine, confident decisions read fine from a template; skip the API
+        template = _EXPLANATION_TEMPLATES.get(decision)
+        if (
+            template is not None
+            and user_context is None
+            and reasoning_data.get("confidence", 0.0) > _TEMPLATE_EXPLANATION_MIN_CONFIDENCE
+            and len(meeting_title) < _TEMPLATE_EXPLANATION_MAX_TITLE_LENGTH
+        ):
+            return template.format(meeting_title=meeting_title)
+
         if not self.client:
             return f"I've decided to {decision} the meeting '{meeting_title}' based on its importance and your schedule."
 
-        prompt = self.prompt_templates["natural_explanation"].format(
+        prompt = self._prompt_formatters["natural_explanation"](
             decision=decision,
             meeting_title=meeting_title,
-            reasoning_data=json.dumps(reasoning_data, indent=2),
-            user_context=json.dumps(user_context) if user_context else "{}"
+            reasoning_data=orjson.dumps(reasoning_data, option=_PROMPT_JSON).decode(),
+            user_context=self._user_context_to_json(user_context) if user_context else "{}"
         )
 
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
+            content = await self._submit_explanation({
+                "model": "gpt-4o-mini",
+                "messages": [
                     {"role": "system", "content": "Generate natural, conversational explanations."},
+                    {"role": "user", "content": EXPLANATION_INSTRUCTIONS},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,
-                max_tokens=200
-            )
+                "temperature": 0.7,
+                "max_tokens": 200
+            })
 
-            return response.choices[0].message.content.strip()
+            return content.strip()
 
         except Exception as e:
             logger.error(f"Explanation generation failed: {e}")
             return f"I've decided to {decision} '{meeting_title}' to optimize your schedule."
 
+    async def _submit_explanation(self, request: Dict[str, Any]) -> str:
+        """Queue an explanation request for the micro-batcher and await its content"""
+
+        if self._explanation_queue is None:
+            self._explanation_queue = asyncio.Queue()
+        if self._explanation_task is None or self._explanation_task.done():
+            # A restarted worker picks up whatever the last one left queued
+            self._explanation_task = asyncio.create_task(self._explanation_worker())
+
+        future = asyncio.get_running_loop().create_future()
+        self._explanation_queue.put_nowait((request, future))
+        return await future
+
+    async def _explanation_worker(self):
+        """Collect explanation requests over a short window and dispatch them together"""
+
+        while True:
+            batch = [await self._explanation_queue.get()]
+            # Let requests from the same sweep catch up before dispatching
+            try:
+                await asyncio.sleep(_EXPLANATION_BATCH_WINDOW_SECONDS)
+            except asyncio.CancelledError:
+                self._cancel_explanation_requests(batch)
+                raise
+            while len(batch) < _EXPLANATION_BATCH_SIZE:
+                try:
+                    batch.append(self._explanation_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Identical requests in a batch share one API call
+            waiters: Dict[bytes, Tuple[Dict[str, Any], List[asyncio.Future]]] = {}
+            for request, future in batch:
+                key = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+                waiters.setdefault(key, (request, []))[1].append(future)
+
+            # Dispatch without waiting, so the next window opens immediately
+            dispatch = asyncio.gather(
+                *(self._run_explanation(request, futures) for request, futures in waiters.values())
+            )
+            self._explanation_batches.add(dispatch)
+            dispatch.add_done_callback(self._explanation_batches.discard)
+
+    @staticmethod
+    def _cancel_explanation_requests(requests: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Fail queued explanation requests so their callers stop waiting"""
+        for _, future in requests:
+            if not future.done():
+                future.set_exception(asyncio.CancelledError())
+
+    async def _run_explanation(self, request: Dict[str, Any], futures: List[asyncio.Future]):
+        """Make one explanation call and resolve every future waiting on it"""
+
+        try:
+            async with self._explanation_semaphore:
+                content = await self._cached_chat(**request)
+        except asyncio.CancelledError:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(asyncio.CancelledError())
+            raise
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future in futures:
+            if not future.done():
+                future.set_result(content)
+
     async def analyze_calendar_patterns(
         self,
         recent_meetings: List[Dict[str, Any]],
@@ -797,26 +1787,27 @@ class LLMAnalyzer:
         if not self.client:
             return self._basic_pattern_analysis(recent_meetings, upcoming_schedule)
 
-        prompt = self.prompt_templates["calendar_pattern_recognition"].format(
-            recent_meetings=json.dumps(recent_meetings[:20], indent=2),  # Limit to recent 20
-            upcoming_schedule=json.dumps(upcoming_schedule[:20], indent=2),
-            preferences=json.dumps(user_preferences) if user_preferences else "{}"
+        count_tokens = await _load_token_counter()
+        prompt = self._prompt_formatters["calendar_pattern_recognition"](
+            # Limit to recent 20, and fewer if they would overrun the budget
+            recent_meetings=_pack_json_list(recent_meetings[:20], _CALENDAR_PROMPT_TOKEN_BUDGET, count_tokens),
+            upcoming_schedule=_pack_json_list(upcoming_schedule[:20], _CALENDAR_PROMPT_TOKEN_BUDGET, count_tokens),
+            preferences=orjson.dumps(user_preferences, option=_PROMPT_JSON).decode() if user_preferences else "{}"
         )
 
         try:
-            response = await self.client.chat.completions.create(
+            analysis_text = await self._cached_chat(
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": "You are a calendar optimization expert."},
+                    {"role": "user", "content": CALENDAR_PATTERN_INSTRUCTIONS},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.4
+                temperature=0.4,
+                response_format=_CALENDAR_INSIGHTS_RESPONSE_FORMAT
             )
 
-            analysis_text = response.choices[0].message.content
-
-            # Parse structured insights from the response
-            return self._parse_pattern_insights(analysis_text, recent_meetings, upcoming_schedule)
+            return orjson.loads(analysis_text)
 
         except Exception as e:
             logger.error(f"Calendar pattern analysis failed: {e}")
@@ -827,28 +1818,49 @@ class LLMAnalyzer:
         recent_meetings: List[Dict[str, Any]],
         upcoming_schedule: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Basic pattern analysis without LLM"""
+        """Basic pattern analysis without LLM
+
+        Has every key of _CALENDAR_INSIGHTS_RESPONSE_FORMAT, with empty
+        lists where only the LLM can say anything. "patterns" also holds
+        total_meetings, average_duration, peak_meeting_hours and
+        meeting_density, which the LLM response does not.
+        """
 
         # Calculate basic statistics
         total_meetings = len(recent_meetings) + len(upcoming_schedule)
-        avg_duration = np.mean([m.get("duration_minutes", 30) for m in recent_meetings]) if recent_meetings else 30
-
-        # Find meeting clusters
-        meeting_hours = [datetime.fromisoformat(m.get("start_time", "")).hour
-                        for m in recent_meetings if m.get("start_time")]
 
+        # One pass fills durations and start hours; -1 marks a missing or
+        # malformed start
+        durations = np.empty(len(recent_meetings), dtype=np.float64)
+        hours = np.full(len(recent_meetings), -1, dtype=np.int8)
+        for i, m in enumerate(recent_meetings):
+            durations[i] = m.get("duration_minutes", 30)
+            start_time = m.get("start_time")
+            if start_time:
+                hours[i] = _parse_hour(start_time)
+
+        avg_duration = durations.mean() if recent_meetings else 30
+
+        # Find meeting clusters: busiest hours first, ties in order of first
+        # appearance (as Counter.most_common would rank them)
+        meeting_hours = hours[hours >= 0]
         peak_hours = []
-        if meeting_hours:
-            from collections import Counter
-            hour_counts = Counter(meeting_hours)
-            peak_hours = [hour for hour, count in hour_counts.most_common(3)]
+        if meeting_hours.size:
+            unique_hours, first_seen, hour_counts = np.unique(
+                meeting_hours, return_index=True, return_counts=True
+            )
+            ranked = np.lexsort((first_seen, -hour_counts))[:3]
+            peak_hours = unique_hours[ranked].tolist()
 
         return {
             "patterns": {
                 "total_meetings": total_meetings,
                 "average_duration": avg_duration,
                 "peak_meeting_hours": peak_hours,
-                "meeting_density": total_meetings / 7 if total_meetings else 0  # per day
+                "meeting_density": total_meetings / 7 if total_meetings else 0,  # per day
+                "recurring_meetings": [],
+                "fatigue_zones": [],
+                "inefficiencies": []
             },
             "recommendations": [
                 "Consider batching similar meetings",
@@ -859,49 +1871,7 @@ class LLMAnalyzer:
                 "Reduce average meeting duration",
                 "Consolidate status updates",
                 "Convert some meetings to async updates"
-            ]
-        }
-
-    def _parse_pattern_insights(
-        self,
-        analysis_text: str,
-        recent_meetings: List[Dict[str, Any]],
-        upcoming_schedule: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """Parse pattern insights from LLM response"""
-
-        # Extract key insights using simple parsing
-        # In production, use structured output format
-
-        insights = {
-            "patterns": {},
-            "recommendations": [],
-            "optimization_opportunities": [],
+            ],
             "focus_time_suggestions": [],
             "meeting_reduction_targets": []
         }
-
-        # Parse recommendations (looking for bullet points or numbered lists)
-        lines = analysis_text.split('\n')
-        current_section = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Detect sections
-            if "recommendation" in line.lower():
-                current_section = "recommendations"
-            elif "optimization" in line.lower() or "opportunit" in line.lower():
-                current_section = "optimization_opportunities"
-            elif "focus" in line.lower():
-                current_section = "focus_time_suggestions"
-            elif line.startswith(('•', '-', '*', '1.', '2.', '3.')):
-                # Extract bullet points
-                clean_line = re.sub(r'^[•\-\*\d\.]\s*', '', line)
-                if current_section and current_section in insights:
-                    if isinstance(insights[current_section], list):
-                        insights[current_section].append(clean_line)
-
-        return insights
\ No newline at end of file
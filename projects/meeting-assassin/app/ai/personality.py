@@ -3,12 +3,15 @@ AI Avatar Personality Modeling System
 """
 
 import json
-import random
-from typing import Dict, Any, List, Optional, Tuple
+import uuid
+from collections import Counter, deque
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple, Deque
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,13 @@ class DecisionContext(Enum):
     COMMUNICATION = "communication"
 
 
+# Enum <-> stored string lookups for profile serialization, built once
+_TRAIT_VALUES = {trait: trait.value for trait in PersonalityTrait}
+_TRAIT_BY_VALUE = {trait.value: trait for trait in PersonalityTrait}
+_CONTEXT_VALUES = {context: context.value for context in DecisionContext}
+_CONTEXT_BY_VALUE = {context.value: context for context in DecisionContext}
+
+
 @dataclass
 class PersonalityProfile:
     """Comprehensive personality profile for AI avatar"""
@@ -54,9 +64,9 @@ class PersonalityProfile:
         """Convert to dictionary for storage"""
         return {
             "personality_type": self.personality_type,
-            "traits": {trait.value: score for trait, score in self.traits.items()},
+            "traits": {_TRAIT_VALUES[trait]: score for trait, score in self.traits.items()},
             "decision_patterns": {
-                context.value: patterns for context, patterns in self.decision_patterns.items()
+                _CONTEXT_VALUES[context]: patterns for context, patterns in self.decision_patterns.items()
             },
             "communication_style": self.communication_style,
             "learning_preferences": self.learning_preferences,
@@ -69,9 +79,9 @@ class PersonalityProfile:
         """Create from dictionary"""
         return cls(
             personality_type=data["personality_type"],
-            traits={PersonalityTrait(k): v for k, v in data["traits"].items()},
+            traits={_TRAIT_BY_VALUE[k]: v for k, v in data["traits"].items()},
             decision_patterns={
-                DecisionContext(k): v for k, v in data["decision_patterns"].items()
+                _CONTEXT_BY_VALUE[k]: v for k, v in data["decision_patterns"].items()
             },
             communication_style=data["communication_style"],
             learning_preferences=data["learning_preferences"],
@@ -80,6 +90,21 @@ class PersonalityProfile:
         )
 
 
+# Trait order of the rows in PersonalityFactory's template matrix
+_TRAIT_ORDER = tuple(PersonalityTrait)
+
+# Per-trait autonomy adjustment: trait += (autonomy - 0.5) * weight, then
+# clamped only on the side the adjustment pushes toward
+_AUTONOMY_TRAIT_WEIGHTS = np.array([
+    0.4 if trait in (PersonalityTrait.ASSERTIVENESS, PersonalityTrait.DECISION_SPEED)
+    else -0.3 if trait is PersonalityTrait.COLLABORATION
+    else 0.0
+    for trait in _TRAIT_ORDER
+])
+_AUTONOMY_TRAIT_FLOORS = np.where(_AUTONOMY_TRAIT_WEIGHTS < 0, 0.0, -np.inf)
+_AUTONOMY_TRAIT_CEILINGS = np.where(_AUTONOMY_TRAIT_WEIGHTS > 0, 1.0, np.inf)
+
+
 class PersonalityFactory:
     """Factory for creating personality profiles"""
 
@@ -176,20 +201,23 @@ class PersonalityFactory:
         }
     }
 
+    # Template traits as one matrix, a row per template in _TRAIT_ORDER
+    _TEMPLATE_ROWS = {name: row for row, name in enumerate(PERSONALITY_TEMPLATES)}
+    _TEMPLATE_TRAITS = np.array([
+        [template["traits"][trait] for trait in _TRAIT_ORDER]
+        for template in PERSONALITY_TEMPLATES.values()
+    ])
+
     @classmethod
     def create_profile(cls, personality_type: str, autonomy: float = 0.5) -> PersonalityProfile:
         """Create a personality profile"""
         template = cls.PERSONALITY_TEMPLATES.get(personality_type, cls.PERSONALITY_TEMPLATES["professional"])
+        row = cls._TEMPLATE_ROWS.get(personality_type, cls._TEMPLATE_ROWS["professional"])
 
         # Adjust traits based on autonomy level
-        adjusted_traits = {}
-        for trait, base_score in template["traits"].items():
-            if trait in [PersonalityTrait.ASSERTIVENESS, PersonalityTrait.DECISION_SPEED]:
-                adjusted_traits[trait] = min(1.0, base_score + (autonomy - 0.5) * 0.4)
-            elif trait in [PersonalityTrait.COLLABORATION]:
-                adjusted_traits[trait] = max(0.0, base_score - (autonomy - 0.5) * 0.3)
-            else:
-                adjusted_traits[trait] = base_score
+        scores = cls._TEMPLATE_TRAITS[row] + (autonomy - 0.5) * _AUTONOMY_TRAIT_WEIGHTS
+        np.clip(scores, _AUTONOMY_TRAIT_FLOORS, _AUTONOMY_TRAIT_CEILINGS, out=scores)
+        adjusted_traits = dict(zip(_TRAIT_ORDER, scores.tolist()))
 
         # Create decision patterns
         decision_patterns = cls._create_decision_patterns(adjusted_traits, autonomy)
@@ -245,27 +273,70 @@ class PersonalityFactory:
         }
 
 
+# Meeting invitation outcomes as (decision, confidence, reasoning), indexed
+# by the outcome codes decide_meeting_invitations_batch selects; None means
+# the confidence is derived from the accept score
+_INVITATION_OUTCOMES = (
+    ("auto_accept", None, "High importance and low conflict detected"),
+    ("auto_decline", None, "Low priority or high conflict detected"),
+    ("suggest_alternative", 0.6, "Moderate priority, suggesting alternative time"),
+    ("request_user_input", 0.5, "Unable to make autonomous decision")
+)
+
+
+# Decisions remembered per engine for stats and feedback
+_DECISION_HISTORY_CAPACITY = 10_000
+
+
 class DecisionEngine:
     """AI decision-making engine based on personality"""
 
     def __init__(self, personality_profile: PersonalityProfile):
         self.personality = personality_profile
-        self.decision_history: List[Dict[str, Any]] = []
-
-    def make_decision(self, context: DecisionContext, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Make a decision based on personality and context"""
+        self.decision_history: Deque[Dict[str, Any]] = deque(maxlen=_DECISION_HISTORY_CAPACITY)
+        # Same decisions keyed by id, so feedback finds its decision directly
+        self._decisions_by_id: Dict[str, Dict[str, Any]] = {}
+        # Per-engine PRNG for the undecided-invitation coin flips
+        self._rng = np.random.default_rng()
+
+    def _record_decision(self, result: Dict[str, Any]):
+        """Assign the decision an id and add it to the bounded history"""
+        if len(self.decision_history) == self.decision_history.maxlen:
+            # The append below evicts the oldest decision
+            del self._decisions_by_id[self.decision_history[0]["id"]]
+        result["id"] = uuid.uuid4().hex
+        self.decision_history.append(result)
+        self._decisions_by_id[result["id"]] = result
+
+    def get_recent_decisions(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recent decisions, oldest first"""
+        return list(islice(self.decision_history, max(0, len(self.decision_history) - limit), None))
+
+    def make_decision(
+        self,
+        context: DecisionContext,
+        data: Dict[str, Any],
+        now_iso: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Make a decision based on personality and context
+
+        Callers deciding many items in one sweep can pass a shared ISO
+        timestamp as now_iso instead of formatting the time per decision.
+        """
         patterns = self.personality.decision_patterns.get(context, {})
+        timestamp = now_iso or datetime.utcnow().isoformat()
 
         if context == DecisionContext.MEETING_INVITATION:
-            return self._decide_meeting_invitation(data, patterns)
+            return self._decide_meeting_invitation(data, patterns, timestamp)
         elif context == DecisionContext.CONFLICT_RESOLUTION:
-            return self._decide_conflict_resolution(data, patterns)
+            return self._decide_conflict_resolution(data, patterns, timestamp)
         elif context == DecisionContext.FOCUS_TIME_PROTECTION:
-            return self._decide_focus_time_protection(data, patterns)
+            return self._decide_focus_time_protection(data, patterns, timestamp)
         else:
-            return self._generic_decision(data, patterns)
+            return self._generic_decision(data, patterns, timestamp)
 
-    def _decide_meeting_invitation(self, data: Dict[str, Any], patterns: Dict[str, float]) -> Dict[str, Any]:
+    def _decide_meeting_invitation(self, data: Dict[str, Any], patterns: Dict[str, float], timestamp: str) -> Dict[str, Any]:
         """Decide on meeting invitation"""
         meeting_importance = data.get("importance_score", 0.5)
         conflict_level = data.get("conflict_score", 0.0)
@@ -291,7 +362,7 @@ class DecisionEngine:
             reasoning = "Low priority or high conflict detected"
         else:
             # Need user input or suggest alternative
-            if random.random() < patterns.get("suggest_alternative_probability", 0.2):
+            if self._rng.random() < patterns.get("suggest_alternative_probability", 0.2):
                 decision = "suggest_alternative"
                 confidence = 0.6
                 reasoning = "Moderate priority, suggesting alternative time"
@@ -309,13 +380,70 @@ class DecisionEngine:
                 "conflict_level": conflict_level,
                 "organizer_priority": organizer_priority
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
 
-        self.decision_history.append(result)
+        self._record_decision(result)
         return result
 
-    def _decide_conflict_resolution(self, data: Dict[str, Any], patterns: Dict[str, float]) -> Dict[str, Any]:
+    def decide_meeting_invitations_batch(
+        self,
+        items: List[Dict[str, Any]],
+        now_iso: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Decide many meeting invitations at once
+
+        Equivalent to calling make_decision for each item in order, but the
+        accept scores, threshold checks and random draws for undecided
+        invitations all run as array operations.
+        """
+        patterns = self.personality.decision_patterns.get(DecisionContext.MEETING_INVITATION, {})
+        n = len(items)
+
+        importance = np.fromiter((d.get("importance_score", 0.5) for d in items), dtype=np.float64, count=n)
+        conflict = np.fromiter((d.get("conflict_score", 0.0) for d in items), dtype=np.float64, count=n)
+        organizer = np.fromiter((d.get("organizer_priority", 0.5) for d in items), dtype=np.float64, count=n)
+
+        accept_scores = importance * 0.4 + organizer * 0.3 + (1.0 - conflict) * 0.3
+
+        accept = accept_scores >= patterns.get("auto_accept_threshold", 0.7)
+        decline = ~accept & (accept_scores <= patterns.get("auto_decline_threshold", 0.3))
+        undecided = ~(accept | decline)
+
+        # One bulk draw for the undecided items, consuming the stream exactly
+        # as sequential decisions would
+        suggest = np.zeros(n, dtype=bool)
+        suggest[undecided] = self._rng.random(int(undecided.sum())) < patterns.get(
+            "suggest_alternative_probability", 0.2
+        )
+
+        outcomes = np.select([accept, decline, suggest], [0, 1, 2], 3).tolist()
+        derived_confidences = np.where(accept, accept_scores, 1.0 - accept_scores).tolist()
+
+        timestamp = now_iso or datetime.utcnow().isoformat()
+        results = []
+        for outcome, derived_confidence, meeting_importance, conflict_level, organizer_priority in zip(
+            outcomes, derived_confidences, importance.tolist(), conflict.tolist(), organizer.tolist()
+        ):
+            decision, confidence, reasoning = _INVITATION_OUTCOMES[outcome]
+            results.append({
+                "decision": decision,
+                "confidence": derived_confidence if confidence is None else confidence,
+                "reasoning": reasoning,
+                "data_considered": {
+                    "importance": meeting_importance,
+                    "conflict_level": conflict_level,
+                    "organizer_priority": organizer_priority
+                },
+                "timestamp": timestamp
+            })
+
+        for result in results:
+            self._record_decision(result)
+        return results
+
+    def _decide_conflict_resolution(self, data: Dict[str, Any], patterns: Dict[str, float], timestamp: str) -> Dict[str, Any]:
         """Decide on conflict resolution"""
         conflict_severity = data.get("conflict_severity", 0.5)
         meetings_involved = data.get("meetings_involved", [])
@@ -341,13 +469,13 @@ class DecisionEngine:
             "confidence": confidence,
             "reasoning": reasoning,
             "suggested_actions": self._generate_conflict_actions(decision, data),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
 
-        self.decision_history.append(result)
+        self._record_decision(result)
         return result
 
-    def _decide_focus_time_protection(self, data: Dict[str, Any], patterns: Dict[str, float]) -> Dict[str, Any]:
+    def _decide_focus_time_protection(self, data: Dict[str, Any], patterns: Dict[str, float], timestamp: str) -> Dict[str, Any]:
         """Decide on focus time protection"""
         interruption_type = data.get("interruption_type", "meeting")
         focus_session_remaining = data.get("focus_session_remaining", 0)
@@ -374,19 +502,19 @@ class DecisionEngine:
             "confidence": confidence,
             "reasoning": reasoning,
             "defer_until": self._calculate_defer_time(focus_session_remaining) if decision == "defer_interruption" else None,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
 
-        self.decision_history.append(result)
+        self._record_decision(result)
         return result
 
-    def _generic_decision(self, data: Dict[str, Any], patterns: Dict[str, float]) -> Dict[str, Any]:
+    def _generic_decision(self, data: Dict[str, Any], patterns: Dict[str, float], timestamp: str) -> Dict[str, Any]:
         """Generic decision making"""
         return {
             "decision": "request_user_input",
             "confidence": 0.5,
             "reasoning": "Generic decision context, requiring user input",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
 
     def _generate_conflict_actions(self, decision: str, data: Dict[str, Any]) -> List[str]:
@@ -414,10 +542,7 @@ class DecisionEngine:
     def learn_from_feedback(self, decision_id: str, feedback: Dict[str, Any]):
         """Learn from user feedback on decisions"""
         # Find the decision in history
-        decision = next(
-            (d for d in self.decision_history if d.get("id") == decision_id),
-            None
-        )
+        decision = self._decisions_by_id.get(decision_id)
 
         if not decision:
             return
@@ -440,14 +565,16 @@ class DecisionEngine:
         if not self.decision_history:
             return {"total_decisions": 0}
 
-        decisions = [d["decision"] for d in self.decision_history]
-        confidences = [d["confidence"] for d in self.decision_history]
+        # One pass for the breakdown and the confidence total
+        decision_counts = Counter()
+        confidence_total = 0.0
+        for d in self.decision_history:
+            decision_counts[d["decision"]] += 1
+            confidence_total += d["confidence"]
 
         return {
             "total_decisions": len(self.decision_history),
-            "average_confidence": sum(confidences) / len(confidences),
-            "decision_breakdown": {
-                decision: decisions.count(decision) for decision in set(decisions)
-            },
-            "recent_decisions": self.decision_history[-10:]  # Last 10 decisions
+            "average_confidence": confidence_total / len(self.decision_history),
+            "decision_breakdown": dict(decision_counts),
+            "recent_decisions": self.get_recent_decisions(10)
         }
\ No newline at end of file
@@ -3,21 +3,85 @@ Real-time Meeting Processing and Event Handling System
 """
 
 import asyncio
-import json
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass, asdict
+import functools
+import hashlib
+import itertools
+import multiprocessing
+import re
+import time
+import uuid
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime, timedelta
 import logging
-from asyncio import Queue, Task
-import aioredis
+from asyncio import PriorityQueue, Task
+import numpy as np
+import orjson
+from redis.asyncio import Redis
 from app.ai.llm_analyzer import LLMAnalyzer, MeetingInsight, AnalysisDepth
-from app.ai.enhanced_personality import EnhancedPersonalityEngine, PersonalityType
+from app.ai.enhanced_personality import EnhancedPersonalityEngine, PersonalityType, Decision
 from app.ai.calendar_intelligence import CalendarIntelligence
-import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Events waiting across all priorities, and workers draining them
+_QUEUE_CAPACITY = 3600
+_DEFAULT_WORKER_COUNT = 16
+
+# Processed events kept for reuse by later process_event calls
+_EVENT_POOL_CAPACITY = 1024
+
+# Distinct meeting start times whose parsed datetime is kept
+_START_TIME_CACHE_SIZE = 2048
+
+# Metrics are logged after at least this many more events were processed
+_METRICS_LOG_EVENT_INTERVAL = 100
+
+# Processed results kept in memory for status lookups
+_RESULTS_CACHE_CAPACITY = 10_000
+
+# Meeting fields whose change warrants re-analysis on update
+_SIGNIFICANT_MEETING_FIELDS = frozenset({"start_time", "duration", "attendees", "title"})
+
+# Batching groups by title keyword, one anchored lookahead per group so
+# earlier groups win wherever their keyword appears in the title
+_BATCH_GROUP_RE = re.compile(
+    r"^(?:(?=.*(?:status|update))(?P<status_updates>)"
+    r"|(?=.*(?:1:1|one-on-one))(?P<one_on_ones>)"
+    r"|(?=.*review)(?P<reviews>))",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Weight of the newest sample in the processing time moving average, and
+# how many recent samples back the latency percentiles
+_PROCESSING_TIME_EWMA_ALPHA = 0.02
+_PROCESSING_TIME_WINDOW = 1024
+
+# Identical calendar pattern analyses share one run for this long
+_PATTERN_ANALYSIS_TTL_SECONDS = 5.0
+_PATTERN_ANALYSIS_CACHE_CAPACITY = 256
+
+# Calendars with more meetings than this are analyzed in a worker process
+# so the event loop stays responsive; below it pickling costs more than
+# the analysis blocks for
+_ANALYSIS_PROCESS_MEETING_THRESHOLD = 200
+_ANALYSIS_PROCESS_WORKERS = 2
+
+# Backoff before the first retry of a failed event, doubling per retry
+_RETRY_BASE_DELAY_SECONDS = 0.5
+
+# Notifications waiting per websocket; beyond this a slow client misses updates
+_WEBSOCKET_QUEUE_CAPACITY = 256
+
+# Pooled Redis connections shared by workers and the cache writer
+_REDIS_MAX_CONNECTIONS = 32
+
+# Redis cache writes arriving within this window share one pipeline
+_REDIS_WRITE_WINDOW_SECONDS = 0.005
+
 
 class EventType(Enum):
     """Types of real-time events"""
@@ -39,7 +103,7 @@ class ProcessingPriority(Enum):
     LOW = 4       # Process within 15 minutes
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingEvent:
     """Event for processing queue"""
     event_type: EventType
@@ -50,16 +114,31 @@ class ProcessingEvent:
     retry_count: int = 0
     max_retries: int = 3
 
+    def reset(
+        self,
+        event_type: EventType,
+        priority: ProcessingPriority,
+        data: Dict[str, Any],
+        user_id: str,
+        timestamp: datetime
+    ):
+        """Reinitialize a pooled event, as if newly constructed"""
+        self.__init__(event_type, priority, data, user_id, timestamp)
+
     def to_dict(self) -> Dict[str, Any]:
+        # Built field by field: asdict would deep-copy the data payload
         return {
-            **asdict(self),
             'event_type': self.event_type.value,
             'priority': self.priority.value,
-            'timestamp': self.timestamp.isoformat()
+            'data': self.data,
+            'user_id': self.user_id,
+            'timestamp': self.timestamp.isoformat(),
+            'retry_count': self.retry_count,
+            'max_retries': self.max_retries
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of event processing"""
     event_type: EventType
@@ -70,59 +149,89 @@ class ProcessingResult:
     error_message: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        # Built field by field: asdict would deep-copy the result payload
         return {
-            **asdict(self),
             'event_type': self.event_type.value,
-            'timestamp': self.timestamp.isoformat()
+            'success': self.success,
+            'result': self.result,
+            'processing_time_ms': self.processing_time_ms,
+            'timestamp': self.timestamp.isoformat(),
+            'error_message': self.error_message
         }
 
 
+@functools.lru_cache(maxsize=_START_TIME_CACHE_SIZE)
+def _parse_start_time(start_time: str) -> datetime:
+    """Parse an ISO 8601 meeting start time; repeats for a meeting hit the cache"""
+    return datetime.fromisoformat(start_time)
+
+
+def _analyze_calendar_patterns_sync(
+    meetings: List[Dict[str, Any]],
+    user_context: Optional[Dict[str, Any]],
+    depth: str
+) -> Dict[str, Any]:
+    """Run a calendar pattern analysis to completion in a worker process"""
+    return asyncio.run(CalendarIntelligence().analyze_calendar_patterns(meetings, user_context, depth=depth))
+
+
 class RealtimeProcessor:
     """Real-time event processor for meeting intelligence"""
 
     def __init__(
         self,
         llm_analyzer: Optional[LLMAnalyzer] = None,
-        redis_url: Optional[str] = None
+        redis_url: Optional[str] = None,
+        worker_count: int = _DEFAULT_WORKER_COUNT
     ):
         self.llm_analyzer = llm_analyzer or LLMAnalyzer()
         self.personality_engine = EnhancedPersonalityEngine(self.llm_analyzer)
         self.calendar_intelligence = CalendarIntelligence()
 
-        # Processing queues by priority
-        self.queues = {
-            ProcessingPriority.CRITICAL: Queue(maxsize=100),
-            ProcessingPriority.HIGH: Queue(maxsize=500),
-            ProcessingPriority.MEDIUM: Queue(maxsize=1000),
-            ProcessingPriority.LOW: Queue(maxsize=2000)
-        }
+        # One queue for all priorities, drained by a pool of identical
+        # workers. Entries are (priority, sequence, event_id, event): the
+        # most urgent event goes first, and the sequence keeps equal
+        # priorities FIFO
+        self.queue: PriorityQueue = PriorityQueue(maxsize=_QUEUE_CAPACITY)
+        self.worker_count = worker_count
+        self._event_sequence = itertools.count()
+        self._queued_by_priority = {priority: 0 for priority in ProcessingPriority}
 
-        # Event handlers
-        self.event_handlers: Dict[EventType, Callable] = {
-            EventType.MEETING_CREATED: self._handle_meeting_created,
-            EventType.MEETING_UPDATED: self._handle_meeting_updated,
-            EventType.MEETING_CANCELLED: self._handle_meeting_cancelled,
-            EventType.CALENDAR_SYNC: self._handle_calendar_sync,
-            EventType.USER_FEEDBACK: self._handle_user_feedback,
-            EventType.OPTIMIZATION_TRIGGERED: self._handle_optimization,
-            EventType.AI_DECISION_MADE: self._handle_ai_decision,
-            EventType.PATTERN_DETECTED: self._handle_pattern_detected
-        }
+        # Finished events, reinitialized by process_event instead of allocating
+        self._event_pool: deque = deque(maxlen=_EVENT_POOL_CAPACITY)
+
+        # Event IDs are a per-instance random prefix plus a counter, so they
+        # stay unique across restarts and replicas sharing Redis
+        self._event_id_prefix = uuid.uuid4().hex[:8]
+        self._event_ids = itertools.count()
 
         # Processing tasks
         self.processing_tasks: List[Task] = []
         self.is_running = False
 
-        # Results cache
-        self.results_cache: Dict[str, ProcessingResult] = {}
+        # Results cache: event_id -> (monotonic time, result), oldest first
+        self.results_cache: OrderedDict[str, Tuple[float, ProcessingResult]] = OrderedDict()
         self.cache_ttl = 3600  # 1 hour
 
+        # (user_id, depth, SHA-256 of input) -> (monotonic time, analysis task);
+        # the task serves callers while in flight and after it completes
+        self._pattern_analyses: OrderedDict[Tuple[str, str, str], Tuple[float, asyncio.Future]] = OrderedDict()
+        # Worker processes for large analyses, started on first use
+        self._analysis_executor: Optional[ProcessPoolExecutor] = None
+
         # Redis for distributed processing (optional)
         self.redis_client = None
         self.redis_url = redis_url
+        # Pending cache writes, key -> (ttl, value); the latest write to a
+        # key wins, and _redis_writer flushes them in one pipeline
+        self._redis_write_buffer: Dict[str, Tuple[int, bytes]] = {}
+        self._redis_write_event = asyncio.Event()
 
-        # Websocket connections for real-time updates
+        # Websocket connections for real-time updates. Each has a bounded
+        # queue of outgoing notifications drained by its own sender task
         self.websocket_connections: Dict[str, Any] = {}
+        self._websocket_queues: Dict[str, asyncio.Queue] = {}
+        self._websocket_senders: Dict[str, Task] = {}
 
         # Metrics
         self.metrics = {
@@ -131,6 +240,7 @@ class RealtimeProcessor:
             "average_processing_time": 0,
             "queue_sizes": {}
         }
+        self._recent_processing_times: deque = deque(maxlen=_PROCESSING_TIME_WINDOW)
 
     async def start(self):
         """Start the real-time processor"""
@@ -143,20 +253,27 @@ class RealtimeProcessor:
         # Initialize Redis if configured
         if self.redis_url:
             try:
-                self.redis_client = await aioredis.create_redis_pool(self.redis_url)
+                self.redis_client = Redis.from_url(self.redis_url, max_connections=_REDIS_MAX_CONNECTIONS)
+                # Connections open lazily, so check the server is reachable now
+                await self.redis_client.ping()
                 logger.info("Connected to Redis for distributed processing")
             except Exception as e:
                 logger.warning(f"Failed to connect to Redis: {e}")
+                if self.redis_client:
+                    await self.redis_client.aclose()
+                    self.redis_client = None
 
-        # Start processing tasks for each priority
-        for priority in ProcessingPriority:
-            task = asyncio.create_task(self._process_queue(priority))
-            self.processing_tasks.append(task)
+        # Start the worker pool
+        for _ in range(self.worker_count):
+            self.processing_tasks.append(asyncio.create_task(self._worker()))
 
         # Start metrics collection
         metrics_task = asyncio.create_task(self._collect_metrics())
         self.processing_tasks.append(metrics_task)
 
+        if self.redis_client:
+            self.processing_tasks.append(asyncio.create_task(self._redis_writer()))
+
         logger.info("Real-time processor started successfully")
 
     async def stop(self):
@@ -174,10 +291,17 @@ class RealtimeProcessor:
         # Wait for tasks to complete
         await asyncio.gather(*self.processing_tasks, return_exceptions=True)
 
-        # Close Redis connection
+        # Apply feedback still queued for the personality engine
+        await self.personality_engine.aclose()
+
+        # Close Redis connection, writing out any buffered cache entries first
         if self.redis_client:
-            self.redis_client.close()
-            await self.redis_client.wait_closed()
+            await self._flush_redis_writes()
+            await self.redis_client.aclose()
+
+        if self._analysis_executor:
+            self._analysis_executor.shutdown(wait=False, cancel_futures=True)
+            self._analysis_executor = None
 
         logger.info("Real-time processor stopped")
 
@@ -197,30 +321,28 @@ class RealtimeProcessor:
         if priority is None:
             priority = self._determine_priority(event_type, data)
 
-        # Create event
-        event = ProcessingEvent(
-            event_type=event_type,
-            priority=priority,
-            data=data,
-            user_id=user_id,
-            timestamp=datetime.utcnow()
-        )
+        # Create event, reusing a finished one when available
+        if self._event_pool:
+            event = self._event_pool.pop()
+            event.reset(event_type, priority, data, user_id, datetime.utcnow())
+        else:
+            event = ProcessingEvent(
+                event_type=event_type,
+                priority=priority,
+                data=data,
+                user_id=user_id,
+                timestamp=datetime.utcnow()
+            )
 
         # Generate event ID
         event_id = self._generate_event_id(event)
 
-        # Add to appropriate queue
-        queue = self.queues[priority]
-
         try:
-            await asyncio.wait_for(
-                queue.put((event_id, event)),
-                timeout=1.0
-            )
-            logger.info(f"Event {event_id} added to {priority.name} queue")
+            self._enqueue(event_id, event)
+            logger.info(f"Event {event_id} queued with {priority.name} priority")
 
             # Notify via websocket if connected
-            await self._notify_websocket(user_id, {
+            self._notify_websocket(user_id, {
                 "type": "event_queued",
                 "event_id": event_id,
                 "event_type": event_type.value,
@@ -229,40 +351,29 @@ class RealtimeProcessor:
 
             return event_id
 
-        except asyncio.TimeoutError:
-            logger.error(f"Queue full for priority {priority.name}")
+        except asyncio.QueueFull:
+            logger.error(f"Queue full, dropping {priority.name} event")
+            self._release_event(event)
             raise Exception(f"Processing queue full, please retry later")
 
-    async def _process_queue(self, priority: ProcessingPriority):
-        """Process events from a specific priority queue"""
+    def _enqueue(self, event_id: str, event: ProcessingEvent):
+        """Put an event on the shared queue, raising QueueFull if there is no room"""
+        self.queue.put_nowait((event.priority.value, next(self._event_sequence), event_id, event))
+        self._queued_by_priority[event.priority] += 1
 
-        queue = self.queues[priority]
-        delay_map = {
-            ProcessingPriority.CRITICAL: 0,
-            ProcessingPriority.HIGH: 1,
-            ProcessingPriority.MEDIUM: 5,
-            ProcessingPriority.LOW: 15
-        }
-        delay = delay_map[priority]
+    async def _worker(self):
+        """Process queued events, most urgent first"""
 
+        loop = asyncio.get_running_loop()
         while self.is_running:
             try:
-                # Wait for event with timeout
-                event_data = await asyncio.wait_for(
-                    queue.get(),
-                    timeout=30.0
-                )
-
-                event_id, event = event_data
-
-                # Add processing delay based on priority
-                if delay > 0:
-                    await asyncio.sleep(delay)
+                _, _, event_id, event = await self.queue.get()
+                self._queued_by_priority[event.priority] -= 1
 
                 # Process the event
-                start_time = datetime.utcnow()
-                result = await self._process_single_event(event)
-                processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+                start_time = loop.time()
+                result = await self._process_single_event(event_id, event)
+                processing_time = (loop.time() - start_time) * 1000
 
                 # Create processing result
                 processing_result = ProcessingResult(
@@ -275,14 +386,14 @@ class RealtimeProcessor:
                 )
 
                 # Cache result
-                self.results_cache[event_id] = processing_result
+                self._cache_result(event_id, processing_result)
 
                 # Update metrics
                 self.metrics["events_processed"] += 1
                 self._update_average_processing_time(processing_time)
 
                 # Notify via websocket
-                await self._notify_websocket(event.user_id, {
+                self._notify_websocket(event.user_id, {
                     "type": "event_processed",
                     "event_id": event_id,
                     "result": processing_result.to_dict()
@@ -290,20 +401,44 @@ class RealtimeProcessor:
 
                 logger.info(f"Processed event {event_id} in {processing_time:.2f}ms")
 
-            except asyncio.TimeoutError:
-                # No events in queue, continue
-                continue
+                # A retrying event is still scheduled to go back on the queue
+                if not result.get("retrying"):
+                    self._release_event(event)
+
             except Exception as e:
                 logger.error(f"Error processing event: {e}")
                 self.metrics["events_failed"] += 1
 
-    async def _process_single_event(self, event: ProcessingEvent) -> Dict[str, Any]:
+    def _release_event(self, event: ProcessingEvent):
+        """Return a finished event to the pool, dropping its payload"""
+        event.data = None
+        self._event_pool.append(event)
+
+    async def _process_single_event(self, event_id: str, event: ProcessingEvent) -> Dict[str, Any]:
         """Process a single event"""
 
         try:
-            handler = self.event_handlers.get(event.event_type)
-            if not handler:
-                return {"success": False, "error": f"No handler for {event.event_type.value}"}
+            # Enum members compare by identity, so matching is cheaper than
+            # hashing the event type into a handler dict
+            match event.event_type:
+                case EventType.MEETING_CREATED:
+                    handler = self._handle_meeting_created
+                case EventType.MEETING_UPDATED:
+                    handler = self._handle_meeting_updated
+                case EventType.MEETING_CANCELLED:
+                    handler = self._handle_meeting_cancelled
+                case EventType.CALENDAR_SYNC:
+                    handler = self._handle_calendar_sync
+                case EventType.USER_FEEDBACK:
+                    handler = self._handle_user_feedback
+                case EventType.OPTIMIZATION_TRIGGERED:
+                    handler = self._handle_optimization
+                case EventType.AI_DECISION_MADE:
+                    handler = self._handle_ai_decision
+                case EventType.PATTERN_DETECTED:
+                    handler = self._handle_pattern_detected
+                case _:
+                    return {"success": False, "error": f"No handler for {event.event_type.value}"}
 
             # Execute handler
             result = await handler(event)
@@ -313,21 +448,25 @@ class RealtimeProcessor:
         except Exception as e:
             logger.error(f"Error handling event {event.event_type.value}: {e}")
 
-            # Retry logic
+            # Retry logic: the same event and id go back on the queue at lower
+            # priority after an exponential backoff, without holding a worker
             if event.retry_count < event.max_retries:
                 event.retry_count += 1
-                # Re-queue with lower priority
-                new_priority = ProcessingPriority(min(4, event.priority.value + 1))
-                await self.process_event(
-                    event.event_type,
-                    event.data,
-                    event.user_id,
-                    new_priority
-                )
+                event.priority = ProcessingPriority(min(4, event.priority.value + 1))
+                delay = _RETRY_BASE_DELAY_SECONDS * 2 ** (event.retry_count - 1)
+                asyncio.get_running_loop().call_later(delay, self._requeue, event_id, event)
                 return {"success": False, "error": str(e), "retrying": True}
 
             return {"success": False, "error": str(e)}
 
+    def _requeue(self, event_id: str, event: ProcessingEvent):
+        """Put a retried event back on the queue once its backoff has elapsed"""
+        try:
+            self._enqueue(event_id, event)
+        except asyncio.QueueFull:
+            logger.error(f"Queue full, dropping retry {event.retry_count} of event {event_id}")
+            self._release_event(event)
+
     async def _handle_meeting_created(self, event: ProcessingEvent) -> Dict[str, Any]:
         """Handle new meeting creation"""
 
@@ -351,9 +490,7 @@ class RealtimeProcessor:
         # Check for calendar patterns
         user_meetings = event.data.get("user_meetings", [])
         if user_meetings:
-            patterns = await self.calendar_intelligence.analyze_calendar_patterns(
-                user_meetings
-            )
+            patterns = await self._analyze_calendar_patterns(event.user_id, user_meetings)
         else:
             patterns = {}
 
@@ -369,14 +506,44 @@ class RealtimeProcessor:
         # Store in cache if Redis available
         if self.redis_client:
             cache_key = f"meeting_analysis:{meeting_data.get('id')}"
-            await self.redis_client.setex(
+            self._queue_cache_write(
                 cache_key,
                 self.cache_ttl,
-                json.dumps(response)
+                orjson.dumps(response, default=str, option=orjson.OPT_NON_STR_KEYS)
             )
 
         return response
 
+    def _queue_cache_write(self, key: str, ttl: int, value: bytes):
+        """Buffer a Redis SETEX for the next pipelined flush"""
+        self._redis_write_buffer[key] = (ttl, value)
+        self._redis_write_event.set()
+
+    async def _redis_writer(self):
+        """Flush buffered cache writes to Redis, one pipeline per burst"""
+
+        while True:
+            await self._redis_write_event.wait()
+            # Let writes from the same burst join this pipeline
+            await asyncio.sleep(_REDIS_WRITE_WINDOW_SECONDS)
+            self._redis_write_event.clear()
+            await self._flush_redis_writes()
+
+    async def _flush_redis_writes(self):
+        """Send every buffered cache write in a single round trip"""
+
+        if not self._redis_write_buffer:
+            return
+
+        batch, self._redis_write_buffer = self._redis_write_buffer, {}
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, (ttl, value) in batch.items():
+                pipe.setex(key, ttl, value)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} cache entries to Redis: {e}")
+
     async def _handle_meeting_updated(self, event: ProcessingEvent) -> Dict[str, Any]:
         """Handle meeting update"""
 
@@ -384,9 +551,7 @@ class RealtimeProcessor:
         changes = event.data.get("changes", {})
 
         # Quick re-analysis if significant changes
-        significant_changes = any(
-            field in changes for field in ["start_time", "duration", "attendees", "title"]
-        )
+        significant_changes = not _SIGNIFICANT_MEETING_FIELDS.isdisjoint(changes)
 
         if significant_changes:
             # Full re-analysis
@@ -432,6 +597,60 @@ class RealtimeProcessor:
             "cancellation_time": cancellation_time
         }
 
+    async def _analyze_calendar_patterns(
+        self,
+        user_id: str,
+        meetings: List[Dict[str, Any]],
+        user_context: Optional[Dict[str, Any]] = None,
+        depth: str = "standard"
+    ) -> Dict[str, Any]:
+        """
+        Calendar pattern analysis, shared between identical requests
+
+        Events arriving in a burst for the same user and meetings (a sync
+        followed by meeting creation, say) await a single analysis run
+        rather than repeating it.
+        """
+        digest = hashlib.sha256(orjson.dumps(
+            [meetings, user_context],
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )).hexdigest()
+        key = (user_id, depth, digest)
+
+        now = time.monotonic()
+        cached = self._pattern_analyses.get(key)
+        if cached is None or now - cached[0] >= _PATTERN_ANALYSIS_TTL_SECONDS:
+            if len(meetings) > _ANALYSIS_PROCESS_MEETING_THRESHOLD:
+                if self._analysis_executor is None:
+                    # Spawned rather than forked: the parent has a running
+                    # event loop and client threads a fork would copy
+                    self._analysis_executor = ProcessPoolExecutor(
+                        max_workers=_ANALYSIS_PROCESS_WORKERS,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                analysis = asyncio.get_running_loop().run_in_executor(
+                    self._analysis_executor,
+                    _analyze_calendar_patterns_sync,
+                    meetings,
+                    user_context,
+                    depth
+                )
+            else:
+                analysis = asyncio.ensure_future(self.calendar_intelligence.analyze_calendar_patterns(
+                    meetings,
+                    user_context,
+                    depth=depth
+                ))
+            cached = (now, analysis)
+            self._pattern_analyses[key] = cached
+            self._pattern_analyses.move_to_end(key)
+            if len(self._pattern_analyses) > _PATTERN_ANALYSIS_CACHE_CAPACITY:
+                self._pattern_analyses.popitem(last=False)
+
+        # Shielded so one cancelled caller doesn't cancel the shared run
+        return await asyncio.shield(cached[1])
+
     async def _handle_calendar_sync(self, event: ProcessingEvent) -> Dict[str, Any]:
         """Handle full calendar sync"""
 
@@ -439,7 +658,8 @@ class RealtimeProcessor:
         user_id = event.user_id
 
         # Comprehensive calendar analysis
-        analysis = await self.calendar_intelligence.analyze_calendar_patterns(
+        analysis = await self._analyze_calendar_patterns(
+            user_id,
             meetings,
             event.data.get("user_context"),
             depth="deep"
@@ -463,7 +683,7 @@ class RealtimeProcessor:
         feedback = event.data["feedback"]
         personality = event.data.get("personality")
 
-        # Update personality engine with feedback
+        # Queue feedback for the personality engine, which applies it in batches
         await self.personality_engine.learn_from_feedback(
             decision_id,
             feedback,
@@ -473,7 +693,7 @@ class RealtimeProcessor:
         return {
             "decision_id": decision_id,
             "feedback_processed": True,
-            "learning_applied": True
+            "learning_queued": True
         }
 
     async def _handle_optimization(self, event: ProcessingEvent) -> Dict[str, Any]:
@@ -506,7 +726,7 @@ class RealtimeProcessor:
 
         else:
             # General optimization
-            analysis = await self.calendar_intelligence.analyze_calendar_patterns(meetings)
+            analysis = await self._analyze_calendar_patterns(event.user_id, meetings)
 
             return {
                 "optimization_type": "general",
@@ -562,7 +782,7 @@ class RealtimeProcessor:
             if "urgent" in meeting.get("title", "").lower():
                 return ProcessingPriority.CRITICAL
             if meeting.get("start_time"):
-                start_time = datetime.fromisoformat(meeting["start_time"])
+                start_time = _parse_start_time(meeting["start_time"])
                 if (start_time - datetime.utcnow()).total_seconds() < 3600:  # Within 1 hour
                     return ProcessingPriority.CRITICAL
 
@@ -579,8 +799,7 @@ class RealtimeProcessor:
 
     def _generate_event_id(self, event: ProcessingEvent) -> str:
         """Generate unique event ID"""
-        data = f"{event.user_id}:{event.event_type.value}:{event.timestamp.isoformat()}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        return f"{event.user_id}:{self._event_id_prefix}{next(self._event_ids):x}"
 
     def _generate_immediate_actions(
         self,
@@ -591,14 +810,14 @@ class RealtimeProcessor:
 
         actions = []
 
-        if decision.decision == "decline":
+        if decision.decision == Decision.DECLINE:
             actions.append({
                 "action": "send_decline",
                 "priority": "high",
                 "template": decision.response_template
             })
 
-        elif decision.decision == "accept":
+        elif decision.decision == Decision.ACCEPT:
             if insight.required_preparation:
                 actions.append({
                     "action": "schedule_prep_time",
@@ -607,7 +826,7 @@ class RealtimeProcessor:
                     "items": insight.required_preparation[:3]
                 })
 
-        elif decision.decision == "reschedule":
+        elif decision.decision == Decision.RESCHEDULE:
             actions.append({
                 "action": "propose_alternatives",
                 "priority": "high",
@@ -663,22 +882,11 @@ class RealtimeProcessor:
         """Create plan for batching similar meetings"""
 
         # Group meetings by similarity
-        groups = {}
+        groups = defaultdict(list)
         for meeting in meetings:
             # Simple grouping by title keywords
-            title = meeting.get("title", "").lower()
-            if "status" in title or "update" in title:
-                key = "status_updates"
-            elif "1:1" in title or "one-on-one" in title:
-                key = "one_on_ones"
-            elif "review" in title:
-                key = "reviews"
-            else:
-                key = "other"
-
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(meeting)
+            match = _BATCH_GROUP_RE.match(meeting.get("title", ""))
+            groups[match.lastgroup if match else "other"].append(meeting)
 
         # Create batching recommendations
         plan = {"batches": []}
@@ -763,41 +971,63 @@ class RealtimeProcessor:
         else:
             return "low"
 
-    async def _notify_websocket(self, user_id: str, data: Dict[str, Any]):
-        """Send notification via websocket if connected"""
+    def _notify_websocket(self, user_id: str, data: Dict[str, Any]):
+        """Queue a notification for the user's websocket if connected"""
 
-        if user_id in self.websocket_connections:
+        queue = self._websocket_queues.get(user_id)
+        if queue is None:
+            return
+
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning(f"Websocket queue full for user {user_id}, dropping {data.get('type')} notification")
+
+    async def _websocket_sender(self, user_id: str, websocket: Any, queue: asyncio.Queue):
+        """Send queued notifications to one websocket in order"""
+
+        while True:
+            data = await queue.get()
             try:
-                ws = self.websocket_connections[user_id]
-                await ws.send_json(data)
+                await websocket.send_json(data)
             except Exception as e:
                 logger.error(f"Failed to send websocket notification: {e}")
-                # Remove broken connection
-                del self.websocket_connections[user_id]
+                # Remove broken connection, unless it has already been replaced
+                if self.websocket_connections.get(user_id) is websocket:
+                    del self.websocket_connections[user_id]
+                    del self._websocket_queues[user_id]
+                    del self._websocket_senders[user_id]
+                return
 
     def _update_average_processing_time(self, new_time: float):
         """Update average processing time metric"""
 
-        current_avg = self.metrics["average_processing_time"]
-        count = self.metrics["events_processed"]
+        self._recent_processing_times.append(new_time)
 
-        # Calculate new average
-        self.metrics["average_processing_time"] = (
-            (current_avg * (count - 1) + new_time) / count
-        )
+        # Exponentially weighted, so the average tracks recent load; the
+        # first sample seeds it rather than decaying up from zero
+        if self.metrics["events_processed"] <= 1:
+            self.metrics["average_processing_time"] = new_time
+        else:
+            self.metrics["average_processing_time"] += (
+                _PROCESSING_TIME_EWMA_ALPHA * (new_time - self.metrics["average_processing_time"])
+            )
 
     async def _collect_metrics(self):
         """Collect and update metrics"""
 
+        logged_events_processed = 0
         while self.is_running:
             try:
                 # Update queue sizes
-                for priority, queue in self.queues.items():
-                    self.metrics["queue_sizes"][priority.name] = queue.qsize()
+                for priority, queued in self._queued_by_priority.items():
+                    self.metrics["queue_sizes"][priority.name] = queued
 
-                # Log metrics periodically
-                if self.metrics["events_processed"] % 100 == 0:
-                    logger.info(f"Metrics: {self.metrics}")
+                # Log metrics once another batch of events has been processed
+                events_processed = self.metrics["events_processed"]
+                if events_processed - logged_events_processed >= _METRICS_LOG_EVENT_INTERVAL:
+                    logged_events_processed = events_processed
+                    logger.info("Metrics: %s", self.metrics)
 
                 # Sleep for 30 seconds
                 await asyncio.sleep(30)
@@ -805,32 +1035,65 @@ class RealtimeProcessor:
             except Exception as e:
                 logger.error(f"Error collecting metrics: {e}")
 
+    def _cache_result(self, event_id: str, result: ProcessingResult):
+        """Cache a result, evicting expired entries and then the oldest over capacity"""
+        now = time.monotonic()
+        self.results_cache[event_id] = (now, result)
+        self.results_cache.move_to_end(event_id)
+
+        # Every entry shares one TTL, so expired ones are always at the front
+        while self.results_cache:
+            cached_at, _ = next(iter(self.results_cache.values()))
+            if now - cached_at < self.cache_ttl and len(self.results_cache) <= _RESULTS_CACHE_CAPACITY:
+                break
+            self.results_cache.popitem(last=False)
+
     async def get_processing_status(self, event_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a processing event"""
 
-        if event_id in self.results_cache:
-            return self.results_cache[event_id].to_dict()
+        cached = self.results_cache.get(event_id)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1].to_dict()
 
         # Check Redis if available
         if self.redis_client:
             cache_key = f"processing_result:{event_id}"
             result = await self.redis_client.get(cache_key)
             if result:
-                return json.loads(result)
+                return orjson.loads(result)
 
         return None
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics"""
-        return self.metrics.copy()
+        metrics = self.metrics.copy()
+        if self._recent_processing_times:
+            p50, p99 = np.percentile(self._recent_processing_times, [50, 99])
+            metrics["p50_processing_time"] = float(p50)
+            metrics["p99_processing_time"] = float(p99)
+        return metrics
 
     def register_websocket(self, user_id: str, websocket: Any):
         """Register websocket connection for user"""
+        self._stop_websocket_sender(user_id)
+        queue = asyncio.Queue(maxsize=_WEBSOCKET_QUEUE_CAPACITY)
         self.websocket_connections[user_id] = websocket
+        self._websocket_queues[user_id] = queue
+        self._websocket_senders[user_id] = asyncio.create_task(
+            self._websocket_sender(user_id, websocket, queue)
+        )
         logger.info(f"Websocket registered for user {user_id}")
 
     def unregister_websocket(self, user_id: str):
         """Unregister websocket connection"""
         if user_id in self.websocket_connections:
             del self.websocket_connections[user_id]
-            logger.info(f"Websocket unregistered for user {user_id}")
\ No newline at end of file
+            self._stop_websocket_sender(user_id)
+            logger.info(f"Websocket unregistered for user {user_id}")
+
+    def _stop_websocket_sender(self, user_id: str):
+        """Cancel a user's sender task, discarding notifications it hasn't sent"""
+        self._websocket_queues.pop(user_id, None)
+        sender = self._websocket_senders.pop(user_id, None)
+        if sender:
+            sender.cancel()
\ No newline at end of file
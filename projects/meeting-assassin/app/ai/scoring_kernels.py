@@ -0,0 +1,58 @@
+"""
+Numeric scoring kernels for the personality decision engine
+
+Pure scalar functions that take and return only numbers. They stay plain
+Python: each is called once per meeting from interpreted code, where a
+Numba dispatcher's argument unboxing costs more than the arithmetic.
+"""
+
+from bisect import bisect_right
+
+# Typical focus time as sorted, non-overlapping half-open hour windows
+FOCUS_WINDOWS = ((9, 11), (14, 16))
+FOCUS_STARTS = tuple(start for start, _ in FOCUS_WINDOWS)
+FOCUS_ENDS = tuple(end for _, end in FOCUS_WINDOWS)
+
+# Bits set by reasoning_flags
+REASON_HIGH_IMPORTANCE = 1
+REASON_LOW_IMPORTANCE = 2
+REASON_TIME_SENSITIVE = 4
+REASON_SKIPPABLE = 8
+
+
+def workload_score(calendar_density: float, stress_level: float) -> float:
+    """Blend calendar density and stress into a 0.0-1.0 workload score"""
+    workload = calendar_density * 0.7 + stress_level * 0.3
+    return 0.0 if workload < 0.0 else 1.0 if workload > 1.0 else workload
+
+
+def attendee_relationship_score(attendee_count: int) -> float:
+    """Relationship score from meeting size (smaller meetings often more important)"""
+    if attendee_count <= 3:
+        return 0.7
+    elif attendee_count <= 5:
+        return 0.5
+    else:
+        return 0.3
+
+
+def in_focus_time(meeting_hour: int) -> bool:
+    """Check if an hour falls in one of the FOCUS_WINDOWS"""
+    # First window ending after the hour is the only candidate
+    i = bisect_right(FOCUS_ENDS, meeting_hour)
+    return i < len(FOCUS_STARTS) and FOCUS_STARTS[i] <= meeting_hour
+
+
+def reasoning_flags(importance: float, urgency: float, skip_probability: float) -> int:
+    """Bitmask of the threshold-based reasons that apply to a decision"""
+    flags = 0
+    if importance > 0.7:
+        flags |= REASON_HIGH_IMPORTANCE
+    elif importance < 0.3:
+        flags |= REASON_LOW_IMPORTANCE
+    if urgency > 0.8:
+        flags |= REASON_TIME_SENSITIVE
+    if skip_probability > 0.7:
+        flags |= REASON_SKIPPABLE
+    return flags
+
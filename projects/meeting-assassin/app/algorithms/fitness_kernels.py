@@ -0,0 +1,148 @@
+"""
+Population fitness kernel for the calendar genetic algorithm
+
+One function scores every chromosome of a population from stacked slot
+arrays, so it can be compiled with Numba and run in parallel over the
+population. As plain Python it is slower than scoring chromosomes one at
+a time with NumPy, so callers should only use compiled_fitness_batch(),
+and only when HAS_NUMBA is set.
+
+Numba is imported and the kernel compiled (or loaded from Numba's on-disk
+cache) on the first compiled_fitness_batch() call, not at import, so
+processes that never run the genetic algorithm do not pay for it.
+"""
+
+import functools
+import importlib.util
+import logging
+from typing import Callable
+
+import numpy as np
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Parallel loop over the population; replaced by numba.prange before the
+# kernel is compiled
+prange = range
+
+logger = logging.getLogger(__name__)
+
+
+def fitness_batch(
+    occupied: np.ndarray,
+    meeting_id: np.ndarray,
+    start_us: np.ndarray,
+    end_us: np.ndarray,
+    duration_minutes: np.ndarray,
+    start_hour: np.ndarray,
+    slot_priority: np.ndarray,
+    start_order: np.ndarray,
+    end_order: np.ndarray,
+    gene_ids: np.ndarray,
+    gene_priority: np.ndarray,
+    total_priority: float,
+    min_focus_duration: float,
+    target_focus_time: float,
+    work_start: float,
+    work_end: float,
+    conflict_penalty: float,
+    focus_time_bonus: float,
+    priority_bonus: float,
+    work_hours_bonus: float
+) -> np.ndarray:
+    """
+    Fitness of each chromosome in a population
+
+    occupied and meeting_id are (population, slots); the other slot arrays
+    are shared by the population, with start_order and end_order sorting
+    slots by start and end. Every slot must have positive length, so
+    overlapping pairs can be counted from the two orders alone.
+    """
+    population, slot_count = occupied.shape
+    fitness = np.empty(population, dtype=np.float64)
+
+    for p in prange(population):
+        row = occupied[p]
+
+        # Overlapping pairs: over occupied slots i, those starting before i
+        # ends, less those ending by i's start, less i itself, halved
+        starts_before_end = 0
+        started = 0
+        s = 0
+        for e in range(slot_count):
+            i = end_order[e]
+            if not row[i]:
+                continue
+            while s < slot_count and start_us[start_order[s]] < end_us[i]:
+                if row[start_order[s]]:
+                    started += 1
+                s += 1
+            starts_before_end += started
+
+        ends_by_start = 0
+        ended = 0
+        e = 0
+        meetings = 0
+        for s in range(slot_count):
+            i = start_order[s]
+            if not row[i]:
+                continue
+            meetings += 1
+            while e < slot_count and end_us[end_order[e]] <= start_us[i]:
+                if row[end_order[e]]:
+                    ended += 1
+                e += 1
+            ends_by_start += ended
+
+        conflicts = (starts_before_end - ends_by_start - meetings) // 2
+
+        focus_time = 0
+        achieved_priority = 0.0
+        work_hours_meetings = 0
+        for i in range(slot_count):
+            if not row[i]:
+                if duration_minutes[i] >= min_focus_duration:
+                    focus_time += duration_minutes[i]
+                continue
+
+            if work_start <= start_hour[i] <= work_end:
+                work_hours_meetings += 1
+
+            mid = meeting_id[p, i]
+            if mid != 0 and gene_ids.shape[0] > 0:
+                g = np.searchsorted(gene_ids, mid)
+                if g < gene_ids.shape[0] and gene_ids[g] == mid:
+                    achieved_priority += gene_priority[g] * slot_priority[i]
+
+        score = 1.0 - conflicts * conflict_penalty
+
+        if target_focus_time > 0:
+            score += min(focus_time / target_focus_time, 1.0) * focus_time_bonus
+
+        if total_priority != 0:
+            score += achieved_priority / total_priority * priority_bonus
+
+        if meetings == 0:
+            score += work_hours_bonus
+        else:
+            score += work_hours_meetings / meetings * work_hours_bonus
+
+        fitness[p] = max(0.0, min(1.0, score))
+
+    return fitness
+
+
+@functools.lru_cache(maxsize=1)
+def compiled_fitness_batch() -> Callable[..., np.ndarray]:
+    """fitness_batch compiled with Numba, built on first use
+
+    Compiled without fastmath, so the final clamp is not optimized on the
+    assumption that scores are never NaN or infinite.
+    """
+    global prange
+    import numba
+
+    prange = numba.prange
+    kernel = numba.njit(cache=True, parallel=True)(fitness_batch)
+    logger.debug("Numba fitness kernel ready")
+    return kernel
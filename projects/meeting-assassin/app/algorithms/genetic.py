@@ -2,16 +2,55 @@
 Genetic Algorithm for Calendar Optimization
 """
 
+import heapq
+from itertools import islice
 import random
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import logging
 
+from app.algorithms.fitness_kernels import HAS_NUMBA, compiled_fitness_batch
+
 logger = logging.getLogger(__name__)
 
+# Slot times are held as int64 microseconds since the epoch, which is exact
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = _NAIVE_EPOCH.replace(tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_microseconds(moment: datetime) -> int:
+    """Microseconds since the epoch, for naive and aware datetimes alike"""
+    epoch = _NAIVE_EPOCH if moment.tzinfo is None else _AWARE_EPOCH
+    return (moment - epoch) // _MICROSECOND
+
+
+def _count_overlapping_pairs(start: np.ndarray, end: np.ndarray) -> int:
+    """Number of overlapping pairs among intervals that all have positive length"""
+    # Per interval: those starting before it ends, less those ending by its
+    # start (a subset when lengths are positive), less itself
+    overlaps = (
+        np.searchsorted(np.sort(start), end, side='left')
+        - np.searchsorted(np.sort(end), start, side='right')
+        - 1
+    )
+    return int(overlaps.sum()) // 2
+
+
+# Chromosome meeting id for a slot with no meeting
+_NO_MEETING = np.iinfo(np.int64).min
+
+
+def _gene_priority_index(genes: List['MeetingGene']) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Sorted meeting ids, the priority of the first gene with each, and the total priority"""
+    ids = np.fromiter((g.meeting_id for g in genes), dtype=np.int64, count=len(genes))
+    priorities = np.fromiter((g.priority for g in genes), dtype=np.float64, count=len(genes))
+    unique_ids, first_index = np.unique(ids, return_index=True)
+    return unique_ids, priorities[first_index], sum(gene.priority for gene in genes)
+
 
 @dataclass
 class TimeSlot:
@@ -59,37 +98,187 @@ class MeetingGene:
             raise ValueError("Flexibility must be between 0.0 and 1.0")
 
 
+@dataclass(frozen=True)
+class SlotLayout:
+    """Time slot geometry as arrays, shared by chromosomes built on the same slots"""
+    start_us: np.ndarray
+    end_us: np.ndarray
+    duration_minutes: np.ndarray
+    start_hour: np.ndarray
+    priority: np.ndarray
+    # Slot indexes by start and by end time, for the population kernel
+    start_order: np.ndarray
+    end_order: np.ndarray
+    # Whether every slot ends after it starts, as the kernel requires
+    positive_lengths: bool
+
+    @classmethod
+    def from_slots(cls, slots: List[TimeSlot]) -> 'SlotLayout':
+        count = len(slots)
+        start_us = np.fromiter((_epoch_microseconds(s.start_time) for s in slots), dtype=np.int64, count=count)
+        end_us = np.fromiter((_epoch_microseconds(s.end_time) for s in slots), dtype=np.int64, count=count)
+        return cls(
+            start_us=start_us,
+            end_us=end_us,
+            duration_minutes=np.fromiter((s.duration_minutes for s in slots), dtype=np.int64, count=count),
+            start_hour=np.fromiter((s.start_time.hour for s in slots), dtype=np.int8, count=count),
+            priority=np.fromiter((s.priority for s in slots), dtype=np.float64, count=count),
+            start_order=np.argsort(start_us, kind='stable').astype(np.int64),
+            end_order=np.argsort(end_us, kind='stable').astype(np.int64),
+            positive_lengths=bool((end_us > start_us).all())
+        )
+
+
 class Chromosome:
-    """Represents a complete calendar schedule solution"""
+    """
+    Represents a complete calendar schedule solution
+
+    Assignments are held in arrays indexed like the time slots, while slot
+    times and priorities are shared with clones and never copied, so
+    cloning copies two flat buffers. time_slots builds TimeSlot objects
+    from them on first access.
+    """
 
-    def __init__(self, genes: List[MeetingGene], time_slots: List[TimeSlot]):
+    def __init__(self, genes: List[MeetingGene], time_slots: List[TimeSlot],
+                 slot_layout: Optional[SlotLayout] = None):
         self.genes = genes
-        self.time_slots = time_slots
         self.fitness_score: Optional[float] = None
         self.schedule_conflicts = 0
         self.focus_time_blocks = 0
         self.optimization_metrics = {}
+        # Source of slot times; their assignment state is read once here
+        self._slots = time_slots
+        # Slot times and priorities never change after construction, so
+        # their arrays are built once and handed on to clones
+        self._slot_layout = slot_layout
+        # (sorted meeting ids, priority of each id's first gene, total priority)
+        self._gene_priorities: Optional[Tuple[np.ndarray, np.ndarray, float]] = None
+        # First gene with each meeting id, as a scan of genes would find it
+        self.gene_by_id: Dict[int, MeetingGene] = {gene.meeting_id: gene for gene in reversed(genes)}
+
+        count = len(time_slots)
+        self._available = np.fromiter((slot.is_available for slot in time_slots), dtype=bool, count=count)
+        self._meeting_ids = np.fromiter(
+            (_NO_MEETING if slot.meeting_id is None else slot.meeting_id for slot in time_slots),
+            dtype=np.int64,
+            count=count
+        )
+        self._time_slots: Optional[List[TimeSlot]] = None
+
+    @property
+    def time_slots(self) -> List[TimeSlot]:
+        """Time slots with their current assignments"""
+        if self._time_slots is None:
+            self._time_slots = [TimeSlot(
+                start_time=slot.start_time,
+                end_time=slot.end_time,
+                duration_minutes=slot.duration_minutes,
+                is_available=bool(available),
+                priority=slot.priority,
+                meeting_id=None if meeting_id == _NO_MEETING else int(meeting_id)
+            ) for slot, available, meeting_id in zip(self._slots, self._available, self._meeting_ids)]
+        return self._time_slots
+
+    def slot_layout(self) -> SlotLayout:
+        """Array view of the time slot geometry"""
+        if self._slot_layout is None:
+            self._slot_layout = SlotLayout.from_slots(self._slots)
+        return self._slot_layout
+
+    def gene_priorities(self) -> Tuple[np.ndarray, np.ndarray, float]:
+        """Sorted meeting ids, the priority of the first gene with each, and the total priority"""
+        if self._gene_priorities is None:
+            self._gene_priorities = _gene_priority_index(self.genes)
+        return self._gene_priorities
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Structure-of-arrays view of the schedule: slot geometry plus assignments"""
+        layout = self.slot_layout()
+        return {
+            'start_us': layout.start_us,
+            'end_us': layout.end_us,
+            'duration_minutes': layout.duration_minutes,
+            'start_hour': layout.start_hour,
+            'slot_priority': layout.priority,
+            'occupied': ~self._available,
+            'meeting_id': np.where(self._meeting_ids == _NO_MEETING, 0, self._meeting_ids)
+        }
+
+    def assignment_key(self) -> bytes:
+        """Bytes identifying the slot assignments, equal for equal schedules"""
+        return self._available.tobytes() + self._meeting_ids.tobytes()
 
     def assign_meeting_to_slot(self, gene: MeetingGene, slot: TimeSlot) -> bool:
         """Assign a meeting to a specific time slot"""
-        if not slot.is_available or slot.duration_minutes < gene.duration_minutes:
+        index = next((i for i, s in enumerate(self.time_slots) if s is slot), None)
+        if index is None:
+            raise ValueError("Slot is not one of this chromosome's time slots")
+        return self.assign_meeting_to_slot_index(gene, index)
+
+    def assign_meeting_to_slot_index(self, gene: MeetingGene, index: int) -> bool:
+        """Assign a meeting to the time slot at an index"""
+        if not self._available[index] or self.slot_layout().duration_minutes[index] < gene.duration_minutes:
             return False
 
-        slot.meeting_id = gene.meeting_id
-        slot.is_available = False
+        self._available[index] = False
+        self._meeting_ids[index] = gene.meeting_id
+        if self._time_slots is not None:
+            self._time_slots[index].is_available = False
+            self._time_slots[index].meeting_id = gene.meeting_id
         return True
 
-    def get_conflicts(self) -> List[Tuple[TimeSlot, TimeSlot]]:
-        """Get all scheduling conflicts"""
-        conflicts = []
-        occupied_slots = [slot for slot in self.time_slots if not slot.is_available]
+    def free_slot_index(self, index: int):
+        """Remove any meeting from the time slot at an index"""
+        self._available[index] = True
+        self._meeting_ids[index] = _NO_MEETING
+        if self._time_slots is not None:
+            self._time_slots[index].is_available = True
+            self._time_slots[index].meeting_id = None
 
-        for i, slot1 in enumerate(occupied_slots):
-            for slot2 in occupied_slots[i+1:]:
-                if slot1.overlaps_with(slot2):
-                    conflicts.append((slot1, slot2))
+    def _occupied_by_start(self) -> List[Tuple[int, TimeSlot]]:
+        """Occupied slots with their index, ordered by start time"""
+        occupied = [(i, slot) for i, slot in enumerate(self.time_slots) if not slot.is_available]
+        occupied.sort(key=lambda item: item[1].start_time)
+        return occupied
 
-        return conflicts
+    def get_conflicts(self) -> List[Tuple[TimeSlot, TimeSlot]]:
+        """Get all scheduling conflicts, each pair in time_slots order"""
+        pairs = []
+        # Sweep by start time; the heap holds (end_time, index, slot) for
+        # slots that may still overlap a later one
+        active: List[Tuple[datetime, int, TimeSlot]] = []
+        for i, slot in self._occupied_by_start():
+            while active and active[0][0] <= slot.start_time:
+                heapq.heappop(active)
+            for _, j, other in active:
+                if slot.end_time > other.start_time:
+                    pairs.append((j, i) if j < i else (i, j))
+            heapq.heappush(active, (slot.end_time, i, slot))
+
+        pairs.sort()
+        return [(self.time_slots[i], self.time_slots[j]) for i, j in pairs]
+
+    def count_conflicts(self) -> int:
+        """Number of scheduling conflicts, without building the pairs"""
+        layout = self.slot_layout()
+        occupied = ~self._available
+        start, end = layout.start_us[occupied], layout.end_us[occupied]
+        if (end > start).all():
+            return _count_overlapping_pairs(start, end)
+
+        # Zero or negative lengths: sweep, checking each candidate pair
+        count = 0
+        active: List[Tuple[datetime, int]] = []
+        for i, slot in self._occupied_by_start():
+            while active and active[0][0] <= slot.start_time:
+                heapq.heappop(active)
+            if slot.end_time > slot.start_time:
+                # Every active slot started no later and ends after this start
+                count += len(active)
+            else:
+                count += sum(1 for _, j in active if slot.end_time > self.time_slots[j].start_time)
+            heapq.heappush(active, (slot.end_time, i))
+        return count
 
     def get_focus_time_blocks(self, min_duration_minutes: int = 60) -> List[TimeSlot]:
         """Get available focus time blocks"""
@@ -103,17 +292,21 @@ class Chromosome:
         return focus_blocks
 
     def clone(self) -> 'Chromosome':
-        """Create a deep copy of the chromosome"""
-        new_slots = [TimeSlot(
-            start_time=slot.start_time,
-            end_time=slot.end_time,
-            duration_minutes=slot.duration_minutes,
-            is_available=slot.is_available,
-            priority=slot.priority,
-            meeting_id=slot.meeting_id
-        ) for slot in self.time_slots]
-
-        return Chromosome(self.genes.copy(), new_slots)
+        """Create a copy of the chromosome that can be reassigned independently"""
+        clone = Chromosome.__new__(Chromosome)
+        clone.genes = self.genes
+        clone.fitness_score = self.fitness_score
+        clone.schedule_conflicts = 0
+        clone.focus_time_blocks = 0
+        clone.optimization_metrics = {}
+        clone._slots = self._slots
+        clone._slot_layout = self.slot_layout()
+        clone._gene_priorities = self._gene_priorities
+        clone.gene_by_id = self.gene_by_id
+        clone._available = self._available.copy()
+        clone._meeting_ids = self._meeting_ids.copy()
+        clone._time_slots = None
+        return clone
 
 
 class FitnessFunction(ABC):
@@ -124,6 +317,10 @@ class FitnessFunction(ABC):
         """Calculate fitness score for a chromosome"""
         pass
 
+    def calculate_population_fitness(self, chromosomes: List[Chromosome]) -> List[float]:
+        """Calculate fitness scores for a whole population"""
+        return [self.calculate_fitness(chromosome) for chromosome in chromosomes]
+
 
 class CalendarFitnessFunction(FitnessFunction):
     """Fitness function for calendar optimization"""
@@ -140,17 +337,17 @@ class CalendarFitnessFunction(FitnessFunction):
     def calculate_fitness(self, chromosome: Chromosome) -> float:
         """Calculate comprehensive fitness score"""
         score = 1.0  # Start with perfect score
+        arrays = chromosome.to_arrays()
+        occupied = arrays['occupied']
 
         # Penalty for conflicts
-        conflicts = chromosome.get_conflicts()
-        conflict_penalty = len(conflicts) * self.weights['conflict_penalty']
+        conflict_penalty = chromosome.count_conflicts() * self.weights['conflict_penalty']
         score -= conflict_penalty
 
         # Bonus for focus time
-        focus_blocks = chromosome.get_focus_time_blocks(
-            self.user_preferences.get('min_focus_duration', 60)
-        )
-        total_focus_time = sum(block.duration_minutes for block in focus_blocks)
+        free_durations = arrays['duration_minutes'][~occupied]
+        min_focus_duration = self.user_preferences.get('min_focus_duration', 60)
+        total_focus_time = int(free_durations[free_durations >= min_focus_duration].sum())
         target_focus_time = self.user_preferences.get('target_focus_hours', 4) * 60
 
         focus_ratio = min(total_focus_time / target_focus_time, 1.0) if target_focus_time > 0 else 0
@@ -158,48 +355,82 @@ class CalendarFitnessFunction(FitnessFunction):
         score += focus_bonus
 
         # Bonus for high-priority meetings in optimal slots
-        priority_score = self._calculate_priority_score(chromosome)
+        priority_score = self._calculate_priority_score(chromosome, arrays)
         score += priority_score * self.weights['priority_bonus']
 
         # Bonus for meetings within work hours
-        work_hours_score = self._calculate_work_hours_score(chromosome)
+        work_hours_score = self._calculate_work_hours_score(arrays)
         score += work_hours_score * self.weights['work_hours_bonus']
 
         # Ensure score is between 0 and 1
         return max(0.0, min(1.0, score))
 
-    def _calculate_priority_score(self, chromosome: Chromosome) -> float:
+    def calculate_population_fitness(self, chromosomes: List[Chromosome]) -> List[float]:
+        """Calculate fitness scores for a whole population, in one compiled pass when possible"""
+        if not HAS_NUMBA or not chromosomes:
+            return super().calculate_population_fitness(chromosomes)
+
+        # The kernel needs one shared slot layout and gene index
+        layout = chromosomes[0].slot_layout()
+        gene_ids, gene_priority, total_priority = gene_index = chromosomes[0].gene_priorities()
+        if not layout.positive_lengths or any(
+            c.slot_layout() is not layout or c.gene_priorities() is not gene_index
+            for c in chromosomes
+        ):
+            return super().calculate_population_fitness(chromosomes)
+
+        rows = [c.to_arrays() for c in chromosomes]
+        fitness = compiled_fitness_batch()(
+            np.stack([row['occupied'] for row in rows]),
+            np.stack([row['meeting_id'] for row in rows]),
+            layout.start_us,
+            layout.end_us,
+            layout.duration_minutes,
+            layout.start_hour,
+            layout.priority,
+            layout.start_order,
+            layout.end_order,
+            gene_ids,
+            gene_priority,
+            float(total_priority),
+            float(self.user_preferences.get('min_focus_duration', 60)),
+            float(self.user_preferences.get('target_focus_hours', 4) * 60),
+            float(self.user_preferences.get('work_hours_start', 9)),
+            float(self.user_preferences.get('work_hours_end', 17)),
+            self.weights['conflict_penalty'],
+            self.weights['focus_time_bonus'],
+            self.weights['priority_bonus'],
+            self.weights['work_hours_bonus']
+        )
+        return fitness.tolist()
+
+    def _calculate_priority_score(self, chromosome: Chromosome, arrays: Dict[str, np.ndarray]) -> float:
         """Calculate score based on priority meeting placement"""
-        total_priority = sum(gene.priority for gene in chromosome.genes)
+        gene_ids, gene_priority, total_priority = chromosome.gene_priorities()
         if total_priority == 0:
             return 0
 
-        achieved_priority = 0
-        for slot in chromosome.time_slots:
-            if not slot.is_available and slot.meeting_id:
-                gene = next((g for g in chromosome.genes if g.meeting_id == slot.meeting_id), None)
-                if gene:
-                    # Higher priority meetings in preferred slots get higher scores
-                    achieved_priority += gene.priority * slot.priority
+        # Occupied slots holding a meeting, matched to that meeting's gene
+        assigned = arrays['occupied'] & (arrays['meeting_id'] != 0)
+        meeting_ids = arrays['meeting_id'][assigned]
+        index = np.minimum(np.searchsorted(gene_ids, meeting_ids), len(gene_ids) - 1)
+        matched = gene_ids[index] == meeting_ids
 
-        return achieved_priority / total_priority
+        # Higher priority meetings in preferred slots get higher scores
+        achieved_priority = (gene_priority[index[matched]] * arrays['slot_priority'][assigned][matched]).sum()
+        return float(achieved_priority) / total_priority
 
-    def _calculate_work_hours_score(self, chromosome: Chromosome) -> float:
+    def _calculate_work_hours_score(self, arrays: Dict[str, np.ndarray]) -> float:
         """Calculate score for meetings within work hours"""
         work_start = self.user_preferences.get('work_hours_start', 9)
         work_end = self.user_preferences.get('work_hours_end', 17)
 
-        total_meetings = len([s for s in chromosome.time_slots if not s.is_available])
+        hours = arrays['start_hour'][arrays['occupied']]
+        total_meetings = len(hours)
         if total_meetings == 0:
             return 1.0
 
-        work_hours_meetings = 0
-        for slot in chromosome.time_slots:
-            if not slot.is_available:
-                hour = slot.start_time.hour
-                if work_start <= hour <= work_end:
-                    work_hours_meetings += 1
-
+        work_hours_meetings = int(((hours >= work_start) & (hours <= work_end)).sum())
         return work_hours_meetings / total_meetings
 
 
@@ -220,10 +451,21 @@ class GeneticAlgorithm:
         self.population: List[Chromosome] = []
         self.best_chromosome: Optional[Chromosome] = None
         self.fitness_history: List[float] = []
+        # Geometry of the slots being scheduled and the genes' priority
+        # index, shared by the whole population
+        self.slot_layout: Optional[SlotLayout] = None
+        self._gene_priorities: Optional[Tuple[np.ndarray, np.ndarray, float]] = None
+        # preferred[g, s]: slot s overlaps one of gene g's preferred slots
+        self.preferred: Optional[np.ndarray] = None
+        # Fitness by assignment_key for the current evolve run, oldest first
+        self._fitness_cache: Dict[bytes, float] = {}
 
     def initialize_population(self, genes: List[MeetingGene], available_slots: List[TimeSlot]):
         """Initialize random population"""
         self.population = []
+        self.slot_layout = SlotLayout.from_slots(available_slots)
+        self._gene_priorities = _gene_priority_index(genes)
+        self.preferred = self._preferred_matrix(genes, available_slots)
 
         for _ in range(self.population_size):
             chromosome = self._create_random_chromosome(genes, available_slots)
@@ -231,49 +473,56 @@ class GeneticAlgorithm:
 
         logger.info(f"Initialized population with {len(self.population)} chromosomes")
 
+    @staticmethod
+    def _preferred_matrix(genes: List[MeetingGene], available_slots: List[TimeSlot]) -> np.ndarray:
+        """Which slots overlap each gene's preferred time slots"""
+        preferred = np.zeros((len(genes), len(available_slots)), dtype=bool)
+        for g, gene in enumerate(genes):
+            for s, slot in enumerate(available_slots):
+                preferred[g, s] = any(pref.overlaps_with(slot) for pref in gene.preferred_time_slots)
+        return preferred
+
     def _create_random_chromosome(self, genes: List[MeetingGene], available_slots: List[TimeSlot]) -> Chromosome:
         """Create a random chromosome by randomly assigning meetings to slots"""
-        # Create fresh copy of slots
-        slots = [TimeSlot(
-            start_time=slot.start_time,
-            end_time=slot.end_time,
-            duration_minutes=slot.duration_minutes,
-            is_available=True,
-            priority=slot.priority
-        ) for slot in available_slots]
+        preferred = self.preferred
+        if preferred is None:
+            preferred = self._preferred_matrix(genes, available_slots)
+
+        chromosome = Chromosome(genes, available_slots, self.slot_layout)
+        chromosome._gene_priorities = self._gene_priorities
 
-        chromosome = Chromosome(genes, slots)
+        # Start from an empty schedule, whatever the given slots hold
+        chromosome._available.fill(True)
+        chromosome._meeting_ids.fill(_NO_MEETING)
+        durations = chromosome.slot_layout().duration_minutes
 
         # Randomly assign meetings to available slots
-        shuffled_genes = genes.copy()
-        random.shuffle(shuffled_genes)
+        gene_order = list(range(len(genes)))
+        random.shuffle(gene_order)
 
-        for gene in shuffled_genes:
-            suitable_slots = [
-                slot for slot in chromosome.time_slots
-                if slot.is_available and slot.duration_minutes >= gene.duration_minutes
-            ]
+        for gene_idx in gene_order:
+            gene = genes[gene_idx]
+            suitable = chromosome._available & (durations >= gene.duration_minutes)
 
-            if suitable_slots:
+            if suitable.any():
                 # Prefer preferred time slots if available
-                preferred_slots = [
-                    slot for slot in suitable_slots
-                    if any(pref.overlaps_with(slot) for pref in gene.preferred_time_slots)
-                ]
+                preferred_slots = np.flatnonzero(preferred[gene_idx] & suitable)
+                if not len(preferred_slots):
+                    preferred_slots = np.flatnonzero(suitable)
 
-                chosen_slot = random.choice(preferred_slots if preferred_slots else suitable_slots)
-                chromosome.assign_meeting_to_slot(gene, chosen_slot)
+                chosen_slot = random.choice(preferred_slots)
+                chromosome.assign_meeting_to_slot_index(gene, chosen_slot)
 
         return chromosome
 
     def evolve(self, fitness_function: FitnessFunction) -> Chromosome:
         """Run the genetic algorithm"""
         logger.info(f"Starting evolution with {self.max_generations} generations")
+        self._fitness_cache.clear()
 
         for generation in range(self.max_generations):
             # Calculate fitness for all chromosomes
-            for chromosome in self.population:
-                chromosome.fitness_score = fitness_function.calculate_fitness(chromosome)
+            self._evaluate_population(fitness_function)
 
             # Sort population by fitness (descending)
             self.population.sort(key=lambda x: x.fitness_score or 0, reverse=True)
@@ -322,6 +571,33 @@ class GeneticAlgorithm:
         logger.info(f"Evolution completed. Best fitness: {self.best_chromosome.fitness_score:.4f}")
         return self.best_chromosome
 
+    def _evaluate_population(self, fitness_function: FitnessFunction):
+        """Set fitness scores, evaluating only schedules not scored before"""
+        # Elites and unchanged offspring repeat earlier schedules
+        pending: Dict[bytes, List[Chromosome]] = {}
+        for chromosome in self.population:
+            key = chromosome.assignment_key()
+            score = self._fitness_cache.get(key)
+            if score is None:
+                pending.setdefault(key, []).append(chromosome)
+            else:
+                chromosome.fitness_score = score
+
+        if not pending:
+            return
+
+        scores = fitness_function.calculate_population_fitness([group[0] for group in pending.values()])
+        for (key, group), score in zip(pending.items(), scores):
+            for chromosome in group:
+                chromosome.fitness_score = score
+            self._fitness_cache[key] = score
+
+        # Drop the oldest entries beyond the bound
+        excess = len(self._fitness_cache) - 8 * self.population_size
+        if excess > 0:
+            for key in list(islice(self._fitness_cache, excess)):
+                del self._fitness_cache[key]
+
     def _tournament_selection(self, tournament_size: int = 3) -> Chromosome:
         """Tournament selection for parent selection"""
         tournament = random.sample(self.population, min(tournament_size, len(self.population)))
@@ -332,48 +608,45 @@ class GeneticAlgorithm:
         child1 = parent1.clone()
         child2 = parent2.clone()
 
-        if len(parent1.time_slots) <= 1:
+        slot_count = len(parent1._available)
+        if slot_count <= 1:
             return child1, child2
 
         # Choose crossover point
-        crossover_point = random.randint(1, len(parent1.time_slots) - 1)
+        crossover_point = random.randint(1, slot_count - 1)
 
         # Swap meeting assignments after crossover point
-        for i in range(crossover_point, len(parent1.time_slots)):
-            child1.time_slots[i].meeting_id = parent2.time_slots[i].meeting_id
-            child1.time_slots[i].is_available = parent2.time_slots[i].is_available
+        child1._available[crossover_point:] = parent2._available[crossover_point:]
+        child1._meeting_ids[crossover_point:] = parent2._meeting_ids[crossover_point:]
 
-            child2.time_slots[i].meeting_id = parent1.time_slots[i].meeting_id
-            child2.time_slots[i].is_available = parent1.time_slots[i].is_available
+        child2._available[crossover_point:] = parent1._available[crossover_point:]
+        child2._meeting_ids[crossover_point:] = parent1._meeting_ids[crossover_point:]
 
         return child1, child2
 
     def _mutate(self, chromosome: Chromosome):
         """Mutate a chromosome by randomly reassigning meetings"""
-        occupied_slots = [slot for slot in chromosome.time_slots if not slot.is_available]
+        occupied_slots = np.flatnonzero(~chromosome._available)
 
-        if not occupied_slots:
+        if not len(occupied_slots):
             return
 
         # Choose random occupied slot to modify
         slot_to_mutate = random.choice(occupied_slots)
-        original_meeting_id = slot_to_mutate.meeting_id
+        original_meeting_id = chromosome._meeting_ids[slot_to_mutate]
 
         # Free the slot
-        slot_to_mutate.is_available = True
-        slot_to_mutate.meeting_id = None
+        chromosome.free_slot_index(slot_to_mutate)
 
         # Find a new slot for the meeting
-        gene = next((g for g in chromosome.genes if g.meeting_id == original_meeting_id), None)
+        gene = chromosome.gene_by_id.get(int(original_meeting_id))
         if gene:
-            available_slots = [
-                slot for slot in chromosome.time_slots
-                if slot.is_available and slot.duration_minutes >= gene.duration_minutes
-            ]
+            durations = chromosome.slot_layout().duration_minutes
+            available_slots = np.flatnonzero(chromosome._available & (durations >= gene.duration_minutes))
 
-            if available_slots:
+            if len(available_slots):
                 new_slot = random.choice(available_slots)
-                chromosome.assign_meeting_to_slot(gene, new_slot)
+                chromosome.assign_meeting_to_slot_index(gene, new_slot)
 
     def get_optimization_stats(self) -> Dict[str, Any]:
         """Get optimization statistics"""
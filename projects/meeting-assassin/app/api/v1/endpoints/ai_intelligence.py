@@ -26,10 +26,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Initialize AI components
-llm_analyzer = LLMAnalyzer(api_key=settings.OPENAI_API_KEY)
+llm_analyzer = LLMAnalyzer(
+    api_key=settings.OPENAI_API_KEY,
+    requests_per_minute=settings.OPENAI_RPM,
+    tokens_per_minute=settings.OPENAI_TPM
+)
 personality_engine = EnhancedPersonalityEngine(llm_analyzer)
 calendar_intelligence = CalendarIntelligence()
-realtime_processor = RealtimeProcessor(llm_analyzer, settings.REDIS_URL)
+realtime_processor = RealtimeProcessor(llm_analyzer, settings.REDIS_URL, settings.RT_WORKERS)
 
 
 @router.on_event("startup")
@@ -43,6 +47,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     await realtime_processor.stop()
+    await llm_analyzer.aclose()
     logger.info("AI Intelligence system shutdown")
 
 
@@ -359,20 +364,24 @@ async def batch_analyze_meetings(
         results = []
         depth = AnalysisDepth[analysis_type.upper()]
 
+        # Fetch meeting data (one session, so sequentially)
+        found = []
         for meeting_id in meeting_ids:
-            # Fetch meeting data
             meeting = await _get_meeting_by_id(meeting_id, db)
             if meeting:
-                # Analyze meeting
-                insight = await llm_analyzer.analyze_meeting(
-                    meeting,
-                    depth
-                )
-                results.append({
-                    "meeting_id": meeting_id,
-                    "title": meeting.get("title"),
-                    "insight": insight.to_dict()
-                })
+                found.append((meeting_id, meeting))
+
+        # Analyze meetings concurrently
+        insights = await llm_analyzer.analyze_meetings(
+            [meeting for _, meeting in found],
+            depth
+        )
+        for (meeting_id, meeting), insight in zip(found, insights):
+            results.append({
+                "meeting_id": meeting_id,
+                "title": meeting.get("title"),
+                "insight": insight.to_dict()
+            })
 
         return {
             "success": True,
@@ -24,6 +24,9 @@ class Settings(BaseSettings):
 
     # OpenAI API (for AI features)
     OPENAI_API_KEY: Optional[str] = None
+    # Account quota; when both are set, requests are paced to stay under them
+    OPENAI_RPM: Optional[int] = None
+    OPENAI_TPM: Optional[int] = None
 
     # JWT Settings
     SECRET_KEY: str = "your-secret-key-change-in-production"
@@ -36,6 +39,9 @@ class Settings(BaseSettings):
     # Redis (optional for caching)
     REDIS_URL: Optional[str] = None
 
+    # Concurrent workers processing real-time events
+    RT_WORKERS: int = 16
+
     # Avatar personalities
     DEFAULT_AVATAR_PERSONALITY: str = "professional"
 
@@ -88,8 +88,7 @@ class AIAvatarService:
         if not engine:
             return []
 
-        history = engine.decision_history[-limit:] if engine.decision_history else []
-        return history
+        return engine.get_recent_decisions(limit)
 
     async def get_avatar_stats(self, user_id: int, days: int, db: AsyncSession) -> AvatarStats:
         """Get AI avatar performance statistics"""
@@ -194,7 +194,7 @@ class OptimizationService:
 
         for slot in chromosome.time_slots:
             if not slot.is_available and slot.meeting_id:
-                gene = next((g for g in chromosome.genes if g.meeting_id == slot.meeting_id), None)
+                gene = chromosome.gene_by_id.get(slot.meeting_id)
                 if gene:
                     schedule.append({
                         "meeting_id": gene.meeting_id,
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from app.ai.enhanced_personality import EnhancedPersonalityEngine, PersonalityType
+
+
+@pytest.mark.asyncio
+async def test_aclose_applies_queued_feedback():
+    """Feedback queued before shutdown is applied, and the worker stops."""
+    engine = EnhancedPersonalityEngine()
+
+    for i in range(5):
+        await engine.learn_from_feedback(f"decision-{i}", {"user_agreed": True})
+    worker = engine._feedback_task
+
+    await engine.aclose()
+
+    assert list(engine.learning_cache) == [f"decision-{i}" for i in range(5)]
+    assert worker.done()
+    assert engine._feedback_task is None
+
+
+@pytest.mark.asyncio
+async def test_feedback_after_aclose_is_applied_on_flush():
+    """A closed engine restarts its worker for new feedback."""
+    engine = EnhancedPersonalityEngine()
+    await engine.aclose()
+
+    await engine.learn_from_feedback("decision", {"user_agreed": False})
+    await engine.flush_feedback()
+
+    assert "decision" in engine.learning_cache
+    await engine.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ensemble_survives_cancelled_personality():
+    """A cancelled personality decision is replaced by a neutral one."""
+    engine = EnhancedPersonalityEngine()
+    make_decision = engine.make_personality_decision
+
+    async def cancelled_for_protective(personality_type, *args, **kwargs):
+        if personality_type == PersonalityType.PROTECTIVE:
+            raise asyncio.CancelledError()
+        return await make_decision(personality_type, *args, **kwargs)
+
+    engine.make_personality_decision = cancelled_for_protective
+
+    result = await engine.get_ensemble_decision({"title": "Weekly sync", "duration_minutes": 30})
+
+    assert set(result["all_decisions"]) == {p.value for p in PersonalityType}
+    await engine.aclose()
@@ -0,0 +1,204 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from app.ai.llm_analyzer import (
+    _CALENDAR_INSIGHTS_RESPONSE_FORMAT,
+    _CATEGORY_KEYWORDS,
+    AnalysisDepth,
+    LLMAnalyzer,
+    MeetingCategory,
+    _categorize_text,
+)
+
+
+MEETING = {
+    "title": "Quarterly roadmap review",
+    "description": "Walk through the roadmap and agree on priorities",
+    "attendees": ["alice@example.com", "bob@example.com"],
+    "duration_minutes": 60,
+    "organizer_email": "alice@example.com",
+}
+
+
+def explanation_request(content):
+    """Explanation chat request whose only message is the given content."""
+    return {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": content}]}
+
+
+class FakeStream:
+    """Streamed chat completion yielding the given content pieces."""
+
+    def __init__(self, *pieces):
+        self.chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+            for piece in pieces
+        ]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def close(self):
+        pass
+
+
+@pytest_asyncio.fixture
+async def analyzer():
+    """Analyzer whose LLM analysis records the user context it was given."""
+    analyzer = LLMAnalyzer(api_key="test-key")
+    analyzer.llm_calls = []
+
+    async def fake_llm_deep_analysis(title, description, attendees, duration,
+                                     organizer, meeting_time, location, depth, user_context):
+        analyzer.llm_calls.append(user_context)
+        insight = analyzer._fallback_analysis({"title": title, "duration_minutes": duration})
+        insight.ai_reasoning = f"for {user_context['user_email']}"
+        return insight, True
+
+    analyzer._llm_deep_analysis = fake_llm_deep_analysis
+    yield analyzer
+    await analyzer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_insight_cache_reused_for_same_context(analyzer):
+    """A repeated meeting with the same user context is served from cache."""
+    context = {"user_email": "carol@example.com", "preferences": {"focus": "mornings"}}
+
+    first = await analyzer.analyze_meeting(MEETING, AnalysisDepth.STANDARD, context)
+    second = await analyzer.analyze_meeting(MEETING, AnalysisDepth.STANDARD, context)
+
+    assert len(analyzer.llm_calls) == 1
+    assert first.ai_reasoning == second.ai_reasoning == "for carol@example.com"
+
+
+@pytest.mark.asyncio
+async def test_insight_cache_not_shared_between_contexts(analyzer):
+    """Users with different contexts never get each other's cached insights."""
+    context_a = {"user_email": "carol@example.com", "preferences": {"focus": "mornings"}}
+    context_b = {"user_email": "dave@example.com", "preferences": {"focus": "afternoons"}}
+
+    insight_a = await analyzer.analyze_meeting(MEETING, AnalysisDepth.STANDARD, context_a)
+    insight_b = await analyzer.analyze_meeting(MEETING, AnalysisDepth.STANDARD, context_b)
+
+    assert len(analyzer.llm_calls) == 2
+    assert insight_a.ai_reasoning == "for carol@example.com"
+    assert insight_b.ai_reasoning == "for dave@example.com"
+
+
+@pytest.mark.asyncio
+async def test_insight_cache_not_shared_between_organizers(analyzer):
+    """The same meeting text from another organizer is analyzed afresh."""
+    context = {"user_email": "carol@example.com"}
+
+    await analyzer.analyze_meeting(MEETING, AnalysisDepth.STANDARD, context)
+    await analyzer.analyze_meeting(
+        {**MEETING, "organizer_email": "mallory@example.com"}, AnalysisDepth.STANDARD, context
+    )
+
+    assert len(analyzer.llm_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_waiting_explanations():
+    """Closing the analyzer never leaves explanation callers waiting forever."""
+    analyzer = LLMAnalyzer(api_key="test-key")
+    started = asyncio.Event()
+
+    async def slow_cached_chat(**request):
+        started.set()
+        await asyncio.sleep(0.05)
+        return request["messages"][-1]["content"]
+
+    analyzer._cached_chat = slow_cached_chat
+
+    in_flight = asyncio.create_task(analyzer._submit_explanation(explanation_request("first")))
+    await started.wait()
+    queued = asyncio.create_task(analyzer._submit_explanation(explanation_request("second")))
+    await asyncio.sleep(0)
+
+    await analyzer.aclose()
+
+    assert await in_flight == "first"
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+
+
+@pytest.mark.parametrize("duration, recorded", [(None, 30), (45, 45), (40000, 40000)])
+def test_pattern_cache_records_any_duration(duration, recorded):
+    """Null and very long durations are recorded rather than raising."""
+    analyzer = LLMAnalyzer()
+    meeting = {**MEETING, "duration_minutes": duration}
+
+    analyzer._update_pattern_cache(meeting, analyzer._fallback_analysis(meeting))
+
+    (history,) = analyzer.meeting_patterns_cache.values()
+    assert history.duration[0] == recorded
+
+
+@pytest.mark.asyncio
+async def test_failed_llm_analysis_is_not_cached():
+    """A rule-based fallback after an LLM error is retried, not served from cache."""
+    analyzer = LLMAnalyzer(api_key="test-key")
+    calls = []
+
+    async def flaky_chat_completion(**request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise RuntimeError("request timed out")
+        return FakeStream(
+            '{"analysis":{"importance_score":1,',
+            '"urgency_score":1,"skip_probability":0.95,'
+        )
+
+    analyzer._chat_completion = flaky_chat_completion
+
+    fallback = await analyzer.analyze_meeting(MEETING)
+    retried = await analyzer.analyze_meeting(MEETING)
+    cached = await analyzer.analyze_meeting(MEETING)
+
+    assert len(calls) == 2
+    assert fallback.ai_reasoning == "Rule-based analysis due to LLM unavailability"
+    assert retried.skip_probability == cached.skip_probability == 0.95
+    await analyzer.aclose()
+
+
+@pytest.mark.asyncio
+async def test_basic_pattern_analysis_has_llm_response_keys():
+    """Without an API key, pattern analysis still has every key of the LLM schema."""
+    analyzer = LLMAnalyzer()
+    schema = _CALENDAR_INSIGHTS_RESPONSE_FORMAT["json_schema"]["schema"]
+
+    analysis = await analyzer.analyze_calendar_patterns(
+        [{**MEETING, "start_time": "2026-01-05T10:00:00"}], []
+    )
+
+    assert set(schema["required"]) <= set(analysis)
+    assert set(schema["properties"]["patterns"]["required"]) <= set(analysis["patterns"])
+
+
+@pytest.mark.parametrize("text, category", [
+    ("sprint retrospective", MeetingCategory.REVIEW),
+    ("team retro", MeetingCategory.REVIEW),
+    ("retrospective and retro notes", MeetingCategory.REVIEW),
+    ("q3 review", MeetingCategory.DECISION_MAKING),
+    ("status update", MeetingCategory.STATUS_UPDATE),
+    ("retrospective status", MeetingCategory.STATUS_UPDATE),
+    ("roadmap planning", MeetingCategory.PLANNING),
+    ("lunch", MeetingCategory.TEAM_BUILDING),
+])
+def test_categories_with_overlapping_keywords(text, category):
+    """Longest-match keyword scanning categorizes as a per-keyword `in` check would."""
+    expected = next(
+        (cat for cat, keywords in _CATEGORY_KEYWORDS if any(k in text for k in keywords)),
+        MeetingCategory.UNKNOWN
+    )
+
+    assert _categorize_text(text) == expected == category